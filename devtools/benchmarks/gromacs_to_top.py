@@ -0,0 +1,102 @@
+"""
+Benchmark writing GROMACS topology files with systems of increasing size.
+
+The system is made of copies of a small molecule, parametrized once with a SMIRNOFF
+force field and then tiled, so that setup time does not dominate for large systems.
+Writing the topology should scale linearly with the number of atoms, i.e. the fitted
+exponent printed at the end should be close to 1.
+
+Usage: python gromacs_to_top.py [--max-atoms 1000000]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import mdtraj as md
+import numpy as np
+from openff.toolkit.topology import Molecule
+from openff.toolkit.typing.engines.smirnoff import ForceField
+
+from openff.interchange.components.interchange import Interchange
+from openff.interchange.components.mdtraj import _OFFBioTop
+from openff.interchange.models import TopologyKey
+
+
+def _tile(interchange: Interchange, n_copies: int) -> Interchange:
+    """Create an Interchange with many copies of a single-molecule Interchange."""
+    mdtop = md.Topology()
+    reference = interchange.topology.mdtop
+    n_atoms = reference.n_atoms
+
+    for _ in range(n_copies):
+        chain = mdtop.add_chain()
+        residue = mdtop.add_residue("MOL", chain)
+        atoms = [
+            mdtop.add_atom(atom.name, atom.element, residue) for atom in reference.atoms
+        ]
+        for bond in reference.bonds:
+            mdtop.add_bond(atoms[bond.atom1.index], atoms[bond.atom2.index])
+
+    tiled = Interchange()
+    tiled.topology = _OFFBioTop(mdtop=mdtop)
+    tiled.box = interchange.box
+
+    for name, handler in interchange.handlers.items():
+        tiled_handler = handler.copy(deep=True)
+        tiled_handler.slot_map = {
+            TopologyKey(
+                atom_indices=tuple(i + copy * n_atoms for i in top_key.atom_indices),
+                mult=top_key.mult,
+                bond_order=top_key.bond_order,
+            ): pot_key
+            for copy in range(n_copies)
+            for top_key, pot_key in handler.slot_map.items()
+        }
+        tiled.handlers[name] = tiled_handler
+
+    return tiled
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-atoms", type=int, default=1_000_000)
+    parser.add_argument("--smiles", type=str, default="CCO")
+    args = parser.parse_args()
+
+    molecule = Molecule.from_smiles(args.smiles)
+    single = Interchange.from_smirnoff(
+        ForceField("openff-1.0.0.offxml"), molecule.to_topology()
+    )
+    single.box = [10, 10, 10]
+
+    sizes, timings = list(), list()
+
+    n_atoms = 1_000
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        while n_atoms <= args.max_atoms:
+            n_copies = n_atoms // molecule.n_atoms
+            system = _tile(single, n_copies)
+
+            start = time.perf_counter()
+            system.to_top(Path(tmpdir) / "out.top")
+            elapsed = time.perf_counter() - start
+
+            sizes.append(system.topology.mdtop.n_atoms)
+            timings.append(elapsed)
+
+            print(
+                f"{sizes[-1]:>10d} atoms\t{elapsed:10.3f} s\t"
+                f"{1e6 * elapsed / sizes[-1]:8.2f} us/atom"
+            )
+
+            n_atoms *= 10
+
+    if len(sizes) > 1:
+        exponent, _ = np.polyfit(np.log(sizes), np.log(timings), 1)
+        print(f"Fitted scaling exponent: {exponent:.2f}")
+
+
+if __name__ == "__main__":
+    main()
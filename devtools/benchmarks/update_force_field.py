@@ -0,0 +1,67 @@
+"""
+Benchmark re-parameterizing systems of increasing size with a modified force field.
+
+The system is made of copies of a small molecule. After parametrizing it once with a
+SMIRNOFF force field, the force constant of every bond parameter is changed and the
+system is re-parametrized with ``Interchange.update_force_field`` and, for comparison,
+from scratch with ``Interchange.from_smirnoff``. Since only parameter values change,
+``update_force_field`` does not match parameters to the topology again and the speedup
+printed for each size should be well above 1.
+
+Usage: python update_force_field.py [--max-molecules 1000]
+"""
+import argparse
+import time
+
+from openff.toolkit.topology import Molecule, Topology
+from openff.toolkit.typing.engines.smirnoff import ForceField
+
+from openff.interchange.components.interchange import Interchange
+
+
+def _modify(force_field: ForceField) -> ForceField:
+    """Return a copy of a force field with the force constants of all bonds changed."""
+    modified = ForceField(force_field.to_string())
+
+    for parameter in modified["Bonds"].parameters:
+        parameter.k *= 1.1
+
+    return modified
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-molecules", type=int, default=1_000)
+    parser.add_argument("--smiles", type=str, default="CCO")
+    args = parser.parse_args()
+
+    molecule = Molecule.from_smiles(args.smiles)
+    force_field = ForceField("openff-1.0.0.offxml")
+    modified = _modify(force_field)
+
+    n_molecules = 10
+
+    while n_molecules <= args.max_molecules:
+        topology = Topology.from_molecules(n_molecules * [molecule])
+        system = Interchange.from_smirnoff(force_field, topology)
+
+        start = time.perf_counter()
+        system.update_force_field(modified)
+        updated = time.perf_counter() - start
+
+        start = time.perf_counter()
+        Interchange.from_smirnoff(modified, topology)
+        from_scratch = time.perf_counter() - start
+
+        print(
+            f"{n_molecules:>8d} molecules\t"
+            f"update_force_field {updated:10.3f} s\t"
+            f"from_smirnoff {from_scratch:10.3f} s\t"
+            f"speedup {from_scratch / updated:8.1f}x"
+        )
+
+        n_molecules *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 """
 Base models for engine- and force field-agnostic components.
 """
+from typing import Dict, Optional
+
+import numpy as np
 from openff.units import unit
 from pydantic import Field
 from typing_extensions import Literal
 
 from openff.interchange.components.potentials import PotentialHandler
+from openff.interchange.models import TopologyKey
 from openff.interchange.types import FloatQuantity
 
 
@@ -89,3 +93,30 @@ class BaseElectrostaticsHandler(_BaseNonbondedHandler):
             topology_key: self.potentials[potential_key].parameters["charge"]
             for topology_key, potential_key in self.slot_map.items()
         }
+
+    def get_charge_array(self, n_atoms: Optional[int] = None) -> np.ndarray:
+        """Get the partial charge on each atom, in elementary charges, as an array."""
+        return _get_charge_array(self.charges, n_atoms)
+
+
+def _get_charge_array(charges: Dict, n_atoms: Optional[int] = None) -> np.ndarray:
+    """
+    Convert a dict of partial charges keyed by atom to an array indexed by atom.
+
+    The array has ``n_atoms`` entries, or one more than the largest index of an atom with
+    a charge if ``n_atoms`` is not given. Keys of virtual sites are ignored and atoms
+    without a charge have a charge of zero.
+    """
+    atom_charges = {
+        key.atom_indices[0]: np.ravel(charge.m_as(unit.elementary_charge))[0]
+        for key, charge in charges.items()
+        if type(key) is TopologyKey
+    }
+
+    if n_atoms is None:
+        n_atoms = max(atom_charges, default=-1) + 1
+
+    array = np.zeros(n_atoms)
+    array[[*atom_charges.keys()]] = [*atom_charges.values()]
+
+    return array
@@ -0,0 +1,196 @@
+"""Persistent caches of fractional bond orders computed by toolkit wrappers."""
+import abc
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+import numpy as np
+from openff.toolkit.topology import Molecule
+
+from openff.interchange.components.charge_cache import (
+    _SQLiteArrayCache,
+    _update_with_toolkit_versions,
+)
+
+if TYPE_CHECKING:
+    from openff.toolkit.topology.molecule import Bond
+
+
+class FractionalBondOrderCache(abc.ABC):
+    """
+    Base class for stores of fractional bond orders shared between processes.
+
+    Entries are keyed by a string produced by ``get_fractional_bond_order_cache_key`` and
+    store the fractional bond order of each bond of a molecule as an array of floats, in
+    the order given by sorting the bonds by the indices of their atoms.
+
+    .. warning :: This API is experimental and subject to change.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the bond orders stored under ``key``, or ``None`` if not present."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def set(self, key: str, bond_orders: np.ndarray) -> None:
+        """Store bond orders under ``key``."""
+        raise NotImplementedError()
+
+
+class SQLiteFractionalBondOrderCache(_SQLiteArrayCache, FractionalBondOrderCache):
+    """
+    A fractional bond order cache backed by a local SQLite database.
+
+    Each operation opens its own short-lived connection, so one cache object can be
+    passed to (pickled for) many worker processes that read from and write to the same
+    file. The least recently used entries are evicted once more than ``max_entries``
+    entries are stored. The same file may also be used as a ``SQLitePartialChargeCache``.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    path
+        The path of the SQLite database file. It is created if it does not exist.
+    max_entries
+        The maximum number of entries kept in the database.
+    timeout
+        The number of seconds to wait for a lock held by another process.
+
+    """
+
+    _table = "fractional_bond_orders"
+
+
+def get_fractional_bond_order_cache_key(
+    molecule: Molecule, bond_order_model: str
+) -> str:
+    """
+    Generate the key under which fractional bond orders of a molecule are cached.
+
+    The key is a hash of the mapped SMILES of the molecule, the bond order model and the
+    versions of the OpenFF Toolkit and the toolkit wrappers that may be used to compute
+    the bond orders. Conformers are not included, since bond orders are always computed
+    from a newly generated conformer.
+    """
+    key = hashlib.sha256()
+    key.update(
+        molecule.to_smiles(isomeric=True, explicit_hydrogens=True, mapped=True).encode()
+    )
+    key.update(bond_order_model.lower().encode())
+    _update_with_toolkit_versions(key)
+
+    return key.hexdigest()
+
+
+# Bond orders computed in this process, keyed as in a `FractionalBondOrderCache`
+_FRACTIONAL_BOND_ORDERS: Dict[str, np.ndarray] = dict()
+
+
+def assign_fractional_bond_orders(
+    molecules: Iterable[Molecule],
+    bond_order_model: str,
+    bond_order_cache: Optional[FractionalBondOrderCache] = None,
+    n_workers: int = 1,
+) -> None:
+    """
+    Assign fractional bond orders to the bonds of molecules in place.
+
+    Bond orders are computed from a single newly generated conformer of each molecule,
+    ignoring any conformers or bond orders it already has. Bond orders already computed
+    in this process, or stored in ``bond_order_cache``, are reused. The remaining
+    molecules are processed concurrently on a process pool if ``n_workers`` is greater
+    than 1.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    molecules
+        The molecules to assign bond orders to, i.e. the reference molecules of a topology.
+    bond_order_model
+        The bond order model to use, i.e. ``"am1-wiberg"``.
+    bond_order_cache
+        A persistent cache of bond orders, which may be shared between processes.
+    n_workers
+        The number of processes used to compute bond orders that are not cached.
+
+    """
+    bond_order_model = bond_order_model.lower()
+
+    molecules_by_key: Dict[str, List[Molecule]] = dict()
+
+    for molecule in molecules:
+        key = get_fractional_bond_order_cache_key(molecule, bond_order_model)
+        molecules_by_key.setdefault(key, list()).append(molecule)
+
+    bond_orders: Dict[str, np.ndarray] = dict()
+    missing: Dict[str, str] = dict()
+
+    for key, (molecule, *_) in molecules_by_key.items():
+        cached = _FRACTIONAL_BOND_ORDERS.get(key)
+
+        if cached is None and bond_order_cache is not None:
+            cached = bond_order_cache.get(key)
+
+        if cached is not None and len(cached) == molecule.n_bonds:
+            bond_orders[key] = cached
+        else:
+            missing[key] = molecule.to_smiles(
+                isomeric=True, explicit_hydrogens=True, mapped=True
+            )
+
+    if n_workers > 1 and len(missing) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(missing))) as pool:
+            computed = pool.map(
+                _compute_fractional_bond_orders,
+                missing.values(),
+                [bond_order_model] * len(missing),
+            )
+            bond_orders.update(zip(missing.keys(), computed))
+    else:
+        for key, mapped_smiles in missing.items():
+            bond_orders[key] = _compute_fractional_bond_orders(
+                mapped_smiles, bond_order_model
+            )
+
+    for key in missing:
+        if bond_order_cache is not None:
+            bond_order_cache.set(key, bond_orders[key])
+
+    for key, key_molecules in molecules_by_key.items():
+        _FRACTIONAL_BOND_ORDERS[key] = bond_orders[key]
+
+        for molecule in key_molecules:
+            for bond, bond_order in zip(_sorted_bonds(molecule), bond_orders[key]):
+                bond.fractional_bond_order = float(bond_order)
+
+
+def _compute_fractional_bond_orders(
+    mapped_smiles: str, bond_order_model: str
+) -> np.ndarray:
+    """
+    Compute the fractional bond orders of a molecule, ordered as by ``_sorted_bonds``.
+
+    This is a module-level function of picklable arguments so that it can be submitted
+    to process pools.
+    """
+    molecule = Molecule.from_mapped_smiles(mapped_smiles, allow_undefined_stereo=True)
+
+    # TODO: expose conformer generation and fractional bond order assigment
+    # knobs to user via API
+    molecule.generate_conformers(n_conformers=1)
+    molecule.assign_fractional_bond_orders(bond_order_model=bond_order_model)
+
+    return np.array(
+        [bond.fractional_bond_order for bond in _sorted_bonds(molecule)], dtype=float
+    )
+
+
+def _sorted_bonds(molecule: Molecule) -> List["Bond"]:
+    """Return the bonds of a molecule sorted by the indices of their atoms."""
+    return sorted(
+        molecule.bonds,
+        key=lambda bond: sorted((bond.atom1_index, bond.atom2_index)),
+    )
@@ -0,0 +1,224 @@
+"""Persistent caches of partial charges computed by toolkit wrappers."""
+import abc
+import contextlib
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Union
+
+import numpy as np
+import openff.toolkit
+from openff.toolkit.utils.toolkits import GLOBAL_TOOLKIT_REGISTRY
+from openmm import unit as omm_unit
+
+if TYPE_CHECKING:
+    from openff.toolkit.topology import Molecule
+
+
+class PartialChargeCache(abc.ABC):
+    """
+    Base class for stores of partial charges shared between processes.
+
+    Entries are keyed by a string produced by ``get_partial_charge_cache_key`` and store
+    partial charges as an array of floats in units of elementary charge.
+
+    .. warning :: This API is experimental and subject to change.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the partial charges stored under ``key``, or ``None`` if not present."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def set(self, key: str, charges: np.ndarray) -> None:
+        """Store partial charges under ``key``."""
+        raise NotImplementedError()
+
+
+class _SQLiteArrayCache:
+    """
+    A store of arrays of floats keyed by strings, backed by a local SQLite database.
+
+    Each operation opens its own short-lived connection, so one cache object can be
+    passed to (pickled for) many worker processes that read from and write to the same
+    file. The least recently used entries are evicted once more than ``max_entries``
+    entries are stored. Subclasses set the name of the table that entries are stored in.
+
+    Reads do not take a write lock: the times at which entries were last used are kept
+    in memory and written in one batch by the next ``set`` (or after ``_touch_batch_size``
+    reads), so the order in which entries are evicted is approximate across processes.
+    """
+
+    _table: str
+    _touch_batch_size = 1000
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = 100_000,
+        timeout: float = 60.0,
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._pending_touches: Dict[str, float] = dict()
+
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._table} "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            columns = {
+                row[1]
+                for row in connection.execute(f"PRAGMA table_info({self._table})")
+            }
+            if "charges" in columns:
+                # Databases written by earlier versions named the column of values for
+                # the partial charges first stored this way
+                connection.execute(
+                    f"ALTER TABLE {self._table} RENAME COLUMN charges TO value"
+                )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._table}_last_used_index "
+                f"ON {self._table} (last_used)"
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(path={str(self.path)!r}, "
+            f"max_entries={self.max_entries})"
+        )
+
+    def __len__(self) -> int:
+        with self._connect() as connection:
+            return connection.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[
+                0
+            ]
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and is always closed."""
+        connection = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _flush_touches(self, connection: sqlite3.Connection) -> None:
+        """Write the times at which entries were last read in one batch."""
+        if not self._pending_touches:
+            return
+
+        connection.executemany(
+            f"UPDATE {self._table} SET last_used = ? WHERE key = ?",
+            [(last_used, key) for key, last_used in self._pending_touches.items()],
+        )
+        self._pending_touches.clear()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the array stored under ``key``, or ``None`` if not present."""
+        with self._connect() as connection:
+            row = connection.execute(
+                f"SELECT value FROM {self._table} WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self._pending_touches[key] = time.time()
+
+            if len(self._pending_touches) >= self._touch_batch_size:
+                self._flush_touches(connection)
+
+        return np.frombuffer(row[0], dtype="<f8").copy()
+
+    def set(self, key: str, values: np.ndarray) -> None:
+        """Store an array under ``key``, evicting the least recently used entries if full."""
+        blob = np.asarray(values, dtype="<f8").tobytes()
+
+        with self._connect() as connection:
+            self._flush_touches(connection)
+            connection.execute(
+                f"INSERT OR REPLACE INTO {self._table} (key, value, last_used) "
+                "VALUES (?, ?, ?)",
+                (key, blob, time.time()),
+            )
+
+            n_entries = connection.execute(
+                f"SELECT COUNT(*) FROM {self._table}"
+            ).fetchone()[0]
+
+            if n_entries > self.max_entries:
+                connection.execute(
+                    f"DELETE FROM {self._table} WHERE key IN "
+                    f"(SELECT key FROM {self._table} ORDER BY last_used ASC LIMIT ?)",
+                    (n_entries - self.max_entries,),
+                )
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._pending_touches.clear()
+
+        with self._connect() as connection:
+            connection.execute(f"DELETE FROM {self._table}")
+
+
+class SQLitePartialChargeCache(_SQLiteArrayCache, PartialChargeCache):
+    """
+    A partial charge cache backed by a local SQLite database.
+
+    Each operation opens its own short-lived connection, so one cache object can be
+    passed to (pickled for) many worker processes that read from and write to the same
+    file. The least recently used entries are evicted once more than ``max_entries``
+    entries are stored.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    path
+        The path of the SQLite database file. It is created if it does not exist.
+    max_entries
+        The maximum number of entries kept in the database.
+    timeout
+        The number of seconds to wait for a lock held by another process.
+
+    """
+
+    _table = "partial_charges"
+
+
+def get_partial_charge_cache_key(molecule: "Molecule", method: str) -> str:
+    """
+    Generate the key under which partial charges of a molecule are cached.
+
+    The key is a hash of the mapped SMILES of the molecule, its conformers (if any), the
+    partial charge method and the versions of the OpenFF Toolkit and the toolkit wrappers
+    that may be used to compute the charges.
+    """
+    key = hashlib.sha256()
+
+    key.update(
+        molecule.to_smiles(isomeric=True, explicit_hydrogens=True, mapped=True).encode()
+    )
+
+    for conformer in molecule.conformers or []:
+        positions = np.asarray(conformer.value_in_unit(omm_unit.angstrom), dtype="<f8")
+        key.update(np.round(positions, decimals=6).tobytes())
+
+    key.update(method.lower().encode())
+    _update_with_toolkit_versions(key)
+
+    return key.hexdigest()
+
+
+def _update_with_toolkit_versions(key: "hashlib._Hash") -> None:
+    """Add the versions of the OpenFF Toolkit and the registered toolkit wrappers to a hash."""
+    key.update(openff.toolkit.__version__.encode())
+
+    for toolkit in GLOBAL_TOOLKIT_REGISTRY.registered_toolkits:
+        key.update(f"{toolkit.toolkit_name} {toolkit.toolkit_version}".encode())
@@ -1,22 +1,25 @@
 """Models and utilities for processing Foyer data."""
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from copy import copy
-from typing import TYPE_CHECKING, Dict, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, Union
 
+import numpy as np
 from openff.units import unit
 from openff.utilities.utilities import has_package
 
+from openff.interchange.components.base import _get_charge_array
 from openff.interchange.components.mdtraj import (
     _iterate_angles,
     _iterate_propers,
     _OFFBioTop,
-    _store_bond_partners,
 )
 from openff.interchange.components.potentials import Potential, PotentialHandler
 from openff.interchange.models import PotentialKey, TopologyKey
 from openff.interchange.types import FloatQuantity
 
 if TYPE_CHECKING:
+    import mdtraj as md
     from foyer.forcefield import Forcefield
     from foyer.topology_graph import TopologyGraph
 
@@ -41,10 +44,132 @@ def _copy_params(
     return params_copy
 
 
-def _get_potential_key_id(atom_slots: Dict[TopologyKey, PotentialKey], idx):
-    """From a dictionary of TopologyKey: PotentialKey, get the PotentialKey id."""
-    top_key = TopologyKey(atom_indices=(idx,))
-    return atom_slots[top_key].id
+def _get_atom_type_ids(atom_slots: Dict[TopologyKey, PotentialKey]) -> Dict[int, str]:
+    """From a dictionary of TopologyKey: PotentialKey, get the PotentialKey id of each atom."""
+    return {
+        top_key.atom_indices[0]: pot_key.id for top_key, pot_key in atom_slots.items()
+    }
+
+
+def _get_atom_label(atom: "md.core.topology.Atom") -> str:
+    """Get the property of an atom that Foyer atom types are matched on."""
+    # Like TopologyGraph.from_parmed, atoms with names starting with an underscore are
+    # coarse-grained (non-element) atoms, which are matched by name
+    if atom.name.startswith("_") or atom.element is None:
+        return atom.name
+    return atom.element.symbol
+
+
+def _get_unique_components(mdtop: "md.Topology") -> Dict[Tuple, List[List[int]]]:
+    """
+    Group the connected components (molecules) of a topology by their signature.
+
+    The signature lists the label (see ``_get_atom_label``) of each atom of a component,
+    in order, and its bonds by the indices of atoms within the component. Components with
+    the same signature are the same graph with atoms in the same order, so are assigned
+    the same atom types.
+    """
+    molecules = sorted(
+        sorted(atom.index for atom in molecule) for molecule in mdtop.find_molecules()
+    )
+
+    component_index = [0] * mdtop.n_atoms
+    local_index = [0] * mdtop.n_atoms
+    for index, atom_indices in enumerate(molecules):
+        for local, atom_index in enumerate(atom_indices):
+            component_index[atom_index] = index
+            local_index[atom_index] = local
+
+    component_bonds: List[List[Tuple[int, int]]] = [list() for _ in molecules]
+    for bond in mdtop.bonds:
+        atom1, atom2 = bond.atom1.index, bond.atom2.index
+        local_bond = sorted((local_index[atom1], local_index[atom2]))
+        component_bonds[component_index[atom1]].append(tuple(local_bond))  # type: ignore
+
+    labels = [_get_atom_label(atom) for atom in mdtop.atoms]
+
+    unique_components: Dict[Tuple, List[List[int]]] = dict()
+    for atom_indices, bonds in zip(molecules, component_bonds):
+        signature = (
+            tuple(labels[atom_index] for atom_index in atom_indices),
+            tuple(sorted(bonds)),
+        )
+        unique_components.setdefault(signature, list()).append(atom_indices)
+
+    return unique_components
+
+
+def _get_component_graph(
+    mdtop: "md.Topology", signature: Tuple, atom_indices: List[int]
+) -> "TopologyGraph":
+    """Build the graph of one connected component, with atoms indexed within it."""
+    top_graph = TopologyGraph()
+
+    for local, atom_index in enumerate(atom_indices):
+        atom = mdtop.atom(atom_index)
+        if atom.name.startswith("_") or atom.element is None:
+            atomic_number, element = None, None
+        else:
+            atomic_number, element = atom.element.atomic_number, atom.element.symbol
+        top_graph.add_atom(
+            name=atom.name, index=local, atomic_number=atomic_number, element=element
+        )
+
+    for atom1, atom2 in signature[1]:
+        top_graph.add_bond(atom1, atom2)
+
+    return top_graph
+
+
+_TYPING_WORKER_STATE: Dict = dict()
+
+
+def _initialize_typing_worker(force_field: "Forcefield") -> None:
+    """Store the force field used by every graph typed by a worker process."""
+    _TYPING_WORKER_STATE["force_field"] = force_field
+
+
+def _find_component_atom_types(
+    top_graph: "TopologyGraph", force_field: Optional["Forcefield"] = None
+) -> List[str]:
+    """
+    Find the atom type of each atom of a graph, in order.
+
+    This is a module-level function so that it can be submitted to process pools. If
+    ``force_field`` is not provided, the force field stored by
+    ``_initialize_typing_worker`` is used.
+    """
+    from foyer.atomtyper import find_atomtypes
+
+    if force_field is None:
+        force_field = _TYPING_WORKER_STATE["force_field"]
+
+    type_map = find_atomtypes(top_graph, forcefield=force_field)
+
+    return [type_map[index]["atomtype"] for index in range(len(type_map))]
+
+
+def _get_parameters(
+    force_field: "Forcefield",
+    parameter_type: str,
+    key: Union[str, List[str]],
+    parameter_cache: Optional[Dict] = None,
+) -> Dict:
+    """
+    Look up parameters in a Foyer force field, reusing earlier lookups stored in ``parameter_cache``.
+
+    Lookups are keyed by the type of parameter and the atom type (or atom types) they are
+    looked up by. Errors raised by the force field are not cached.
+    """
+    if parameter_cache is None:
+        return force_field.get_parameters(parameter_type, key=key)
+
+    cache_key = (parameter_type, key if isinstance(key, str) else tuple(key))
+
+    if cache_key not in parameter_cache:
+        parameter_cache[cache_key] = force_field.get_parameters(parameter_type, key=key)
+
+    return parameter_cache[cache_key]
 
 
 def get_handlers_callable() -> Dict[str, Type[PotentialHandler]]:
@@ -77,33 +202,70 @@ class FoyerVDWHandler(PotentialHandler):
         self,
         force_field: "Forcefield",
         topology: "_OFFBioTop",
+        n_workers: int = 1,
     ) -> None:
-        """Populate self.slot_map with key-val pairs of [TopologyKey, PotentialKey]."""
-        from foyer.atomtyper import find_atomtypes
+        """
+        Populate self.slot_map with key-val pairs of [TopologyKey, PotentialKey].
 
-        if topology.n_topology_atoms == 0:
-            from parmed.openmm import load_topology  # type: ignore
+        The topology is split into connected components (molecules) and each unique
+        component is typed once, on a process pool if ``n_workers`` is greater than 1.
+        Its atom types are then copied to every identical component, i.e. each solvent
+        molecule.
+        """
+        mdtop = topology.mdtop
 
-            _store_bond_partners(topology.mdtop)
-            top_graph = TopologyGraph.from_parmed(
-                structure=load_topology(topology.mdtop.to_openmm())
-            )
-        else:
-            top_graph = TopologyGraph.from_openff_topology(openff_topology=topology)
-
-        if top_graph.number_of_nodes() == 0:
+        if mdtop.n_atoms == 0:
             raise RuntimeError()
 
-        type_map = find_atomtypes(top_graph, forcefield=force_field)
-        for key, val in type_map.items():
-            top_key = TopologyKey(atom_indices=(key,))
-            self.slot_map[top_key] = PotentialKey(id=val["atomtype"])
+        unique_components = _get_unique_components(mdtop)
+
+        top_graphs = [
+            _get_component_graph(mdtop, signature, components[0])
+            for signature, components in unique_components.items()
+        ]
+
+        if n_workers > 1 and len(top_graphs) > 1:
+            # The force field is sent to each worker once, not with every graph
+            with ProcessPoolExecutor(
+                max_workers=min(n_workers, len(top_graphs)),
+                initializer=_initialize_typing_worker,
+                initargs=(force_field,),
+            ) as pool:
+                component_atom_types = list(
+                    pool.map(_find_component_atom_types, top_graphs)
+                )
+        else:
+            component_atom_types = [
+                _find_component_atom_types(top_graph, force_field)
+                for top_graph in top_graphs
+            ]
+
+        atom_types: List[Optional[PotentialKey]] = [None] * mdtop.n_atoms
+        for components, types in zip(unique_components.values(), component_atom_types):
+            potential_keys = [PotentialKey(id=atom_type) for atom_type in types]
+            for atom_indices in components:
+                for atom_index, potential_key in zip(atom_indices, potential_keys):
+                    atom_types[atom_index] = potential_key
+
+        self.slot_map.update(
+            {
+                TopologyKey(atom_indices=(atom_index,)): potential_key
+                for atom_index, potential_key in enumerate(atom_types)
+            }
+        )
 
-    def store_potentials(self, force_field: "Forcefield") -> None:
-        """Extract specific force field potentials a Forcefield object."""
-        for top_key in self.slot_map:
-            atom_params = force_field.get_parameters(
-                self.type, key=self.slot_map[top_key].id
+    def store_potentials(
+        self, force_field: "Forcefield", parameter_cache: Optional[Dict] = None
+    ) -> None:
+        """
+        Extract specific force field potentials a Forcefield object.
+
+        Parameters are looked up and tagged with units once per atom type. Lookups are
+        shared with other handlers through ``parameter_cache``, if provided.
+        """
+        for pot_key in dict.fromkeys(self.slot_map.values()):
+            atom_params = _get_parameters(
+                force_field, self.type, pot_key.id, parameter_cache
             )
 
             atom_params = _copy_params(
@@ -112,7 +274,7 @@ class FoyerVDWHandler(PotentialHandler):
                 param_units={"epsilon": unit.kJ / unit.mol, "sigma": unit.nm},
             )
 
-            self.potentials[self.slot_map[top_key]] = Potential(parameters=atom_params)
+            self.potentials[pot_key] = Potential._from_trusted(parameters=atom_params)
 
 
 class FoyerElectrostaticsHandler(PotentialHandler):
@@ -132,19 +294,34 @@ class FoyerElectrostaticsHandler(PotentialHandler):
         """Get the total partial charge on each atom, including virtual sites."""
         return self.charges
 
+    def get_charge_array(self, n_atoms: Optional[int] = None) -> np.ndarray:
+        """Get the partial charge on each atom, in elementary charges, as an array."""
+        return _get_charge_array(self.charges, n_atoms)
+
     def store_charges(
         self,
         atom_slots: Dict[TopologyKey, PotentialKey],
         force_field: "Forcefield",
+        parameter_cache: Optional[Dict] = None,
     ):
-        """Look up fixed charges (a.k.a. library charges) from the force field and store them in self.charges."""
+        """
+        Look up fixed charges (a.k.a. library charges) from the force field and store them in self.charges.
+
+        Charges are looked up once per atom type, sharing lookups with other handlers
+        through ``parameter_cache``, if provided.
+        """
         for top_key, pot_key in atom_slots.items():
-            foyer_params = force_field.get_parameters("atoms", pot_key.id)
-            charge = foyer_params["charge"]
-            charge = charge * unit.elementary_charge
-            self.charges[top_key] = charge
+            if pot_key not in self.potentials:
+                foyer_params = _get_parameters(
+                    force_field, "atoms", pot_key.id, parameter_cache
+                )
+                charge = foyer_params["charge"]
+                charge = charge * unit.elementary_charge
+                self.potentials[pot_key] = Potential._from_trusted(
+                    parameters={"charge": charge}
+                )
+            self.charges[top_key] = self.potentials[pot_key].parameters["charge"]
             self.slot_map[top_key] = pot_key
-            self.potentials[pot_key] = Potential(parameters={"charge": charge})
 
 
 class FoyerConnectedAtomsHandler(PotentialHandler):
@@ -159,6 +336,8 @@ class FoyerConnectedAtomsHandler(PotentialHandler):
         topology: "_OFFBioTop",
     ) -> None:
         """Populate self.slot_map with key-val pairs of [TopologyKey, PotentialKey]."""
+        atom_type_ids = _get_atom_type_ids(atom_slots)
+
         for connection in getattr(topology, self.connection_attribute):
             try:
                 atoms_iterable = connection.atoms
@@ -167,25 +346,34 @@ class FoyerConnectedAtomsHandler(PotentialHandler):
             atoms_indices = tuple(atom.topology_atom_index for atom in atoms_iterable)
             top_key = TopologyKey(atom_indices=atoms_indices)
 
-            pot_key_ids = tuple(
-                _get_potential_key_id(atom_slots, idx) for idx in atoms_indices
-            )
+            pot_key_ids = tuple(atom_type_ids[idx] for idx in atoms_indices)
 
             self.slot_map[top_key] = PotentialKey(
                 id=POTENTIAL_KEY_SEPARATOR.join(pot_key_ids)
             )
 
-    def store_potentials(self, force_field: "Forcefield") -> None:
-        """Populate self.potentials with key-val pairs of [PotentialKey, Potential]."""
+    def store_potentials(
+        self, force_field: "Forcefield", parameter_cache: Optional[Dict] = None
+    ) -> None:
+        """
+        Populate self.potentials with key-val pairs of [PotentialKey, Potential].
+
+        Parameters are looked up and tagged with units once per tuple of atom types, not
+        once per term. Lookups are shared with other handlers through ``parameter_cache``,
+        if provided.
+        """
         from foyer.exceptions import MissingForceError, MissingParametersError
 
-        for pot_key in self.slot_map.values():
+        for pot_key in dict.fromkeys(self.slot_map.values()):
             try:
-                params = force_field.get_parameters(
-                    self.type, key=pot_key.id.split(POTENTIAL_KEY_SEPARATOR)
+                params = _get_parameters(
+                    force_field,
+                    self.type,
+                    pot_key.id.split(POTENTIAL_KEY_SEPARATOR),
+                    parameter_cache,
                 )
                 params = self.get_params_with_units(params)
-                self.potentials[pot_key] = Potential(parameters=params)
+                self.potentials[pot_key] = Potential._from_trusted(parameters=params)
             except MissingForceError:
                 # Here, we can safely assume that the ForceGenerator is Missing
                 self.slot_map = {}
@@ -223,13 +411,13 @@ class FoyerHarmonicBondHandler(FoyerConnectedAtomsHandler):
         topology: "_OFFBioTop",
     ) -> None:
         """Populate self.slot_map with key-val pairs of [TopologyKey, PotentialKey]."""
+        atom_type_ids = _get_atom_type_ids(atom_slots)
+
         for bond in topology.mdtop.bonds:
             atoms_indices = tuple((bond.atom1.index, bond.atom2.index))
             top_key = TopologyKey(atom_indices=atoms_indices)
 
-            pot_key_ids = tuple(
-                _get_potential_key_id(atom_slots, idx) for idx in atoms_indices
-            )
+            pot_key_ids = tuple(atom_type_ids[idx] for idx in atoms_indices)
 
             self.slot_map[top_key] = PotentialKey(
                 id=POTENTIAL_KEY_SEPARATOR.join(pot_key_ids)
@@ -259,13 +447,13 @@ class FoyerHarmonicAngleHandler(FoyerConnectedAtomsHandler):
         topology: "_OFFBioTop",
     ) -> None:
         """Populate self.slot_map with key-val pairs of [TopologyKey, PotentialKey]."""
+        atom_type_ids = _get_atom_type_ids(atom_slots)
+
         for angle in _iterate_angles(topology.mdtop):
             atoms_indices = tuple(a.index for a in angle)
             top_key = TopologyKey(atom_indices=atoms_indices)
 
-            pot_key_ids = tuple(
-                _get_potential_key_id(atom_slots, idx) for idx in atoms_indices
-            )
+            pot_key_ids = tuple(atom_type_ids[idx] for idx in atoms_indices)
 
             self.slot_map[top_key] = PotentialKey(
                 id=POTENTIAL_KEY_SEPARATOR.join(pot_key_ids)
@@ -296,13 +484,13 @@ class FoyerRBProperHandler(FoyerConnectedAtomsHandler):
         topology: "_OFFBioTop",
     ) -> None:
         """Populate self.slot_map with key-val pairs of [TopologyKey, PotentialKey]."""
+        atom_type_ids = _get_atom_type_ids(atom_slots)
+
         for proper in _iterate_propers(topology.mdtop):
             atoms_indices = tuple(a.index for a in proper)
             top_key = TopologyKey(atom_indices=atoms_indices)
 
-            pot_key_ids = tuple(
-                _get_potential_key_id(atom_slots, idx) for idx in atoms_indices
-            )
+            pot_key_ids = tuple(atom_type_ids[idx] for idx in atoms_indices)
 
             self.slot_map[top_key] = PotentialKey(
                 id=POTENTIAL_KEY_SEPARATOR.join(pot_key_ids)
@@ -1,28 +1,73 @@
 """An object for storing, manipulating, and converting molecular mechanics data."""
+import logging
+import time
 import warnings
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
 from copy import deepcopy
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import mdtraj as md
 import numpy as np
+from openff.toolkit.topology import Molecule
 from openff.toolkit.topology.topology import Topology
-from openff.toolkit.typing.engines.smirnoff import ForceField
+from openff.toolkit.typing.engines.smirnoff import ForceField, ParameterHandler
+from openff.units import unit
+from openff.units.openmm import from_openmm
 from openff.utilities.utilities import has_package, requires_package
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, validate_model, validator
 
-from openff.interchange.components.mdtraj import _OFFBioTop
-from openff.interchange.components.potentials import PotentialHandler
+from openff.interchange.components.bond_order_cache import (
+    FractionalBondOrderCache,
+    SQLiteFractionalBondOrderCache,
+)
+from openff.interchange.components.charge_cache import (
+    PartialChargeCache,
+    SQLitePartialChargeCache,
+)
+from openff.interchange.components.mdtraj import _OFFBioTop, _splice_topologies
+from openff.interchange.components.potentials import (
+    PotentialArrays,
+    PotentialHandler,
+    _TrackedDict,
+)
 from openff.interchange.components.smirnoff import (
     SMIRNOFF_POTENTIAL_HANDLERS,
+    SMIRNOFFAngleHandler,
     SMIRNOFFBondHandler,
     SMIRNOFFConstraintHandler,
+    SMIRNOFFElectrostaticsHandler,
+    SMIRNOFFImproperTorsionHandler,
+    SMIRNOFFPotentialHandler,
+    SMIRNOFFProperTorsionHandler,
+    SMIRNOFFvdWHandler,
 )
 from openff.interchange.exceptions import (
+    InterchangeValidationError,
     InternalInconsistencyError,
     InvalidBoxError,
     InvalidTopologyError,
     MissingParameterHandlerError,
+    MissingParametersError,
     MissingPositionsError,
     SMIRNOFFHandlersNotImplementedError,
     UnsupportedCombinationError,
@@ -32,11 +77,15 @@ from openff.interchange.models import DefaultModel
 from openff.interchange.types import ArrayQuantity
 
 if TYPE_CHECKING:
+    from openff.interchange.interop.openmm import OpenMMParameterMap
+
     if has_package("foyer"):
         from foyer.forcefield import Forcefield as FoyerForcefield
     if has_package("nglview"):
         import nglview
 
+logger = logging.getLogger(__name__)
+
 _SUPPORTED_SMIRNOFF_HANDLERS = {
     "Constraints",
     "Bonds",
@@ -50,6 +99,16 @@ _SUPPORTED_SMIRNOFF_HANDLERS = {
     "VirtualSites",
 }
 
+# Handlers whose potentials only depend on the parameters matched to each term, and can
+# therefore be refreshed without matching parameters again
+_REFRESHABLE_SMIRNOFF_HANDLERS = (
+    SMIRNOFFBondHandler,
+    SMIRNOFFAngleHandler,
+    SMIRNOFFProperTorsionHandler,
+    SMIRNOFFImproperTorsionHandler,
+    SMIRNOFFvdWHandler,
+)
+
 
 class Interchange(DefaultModel):
     """
@@ -68,6 +127,10 @@ class Interchange(DefaultModel):
         box: ArrayQuantity["nanometer"] = Field(None)  # type: ignore
         positions: ArrayQuantity["nanometer"] = Field(None)  # type: ignore
 
+        # The data of the SMIRNOFF parameter handlers this was created from, if any,
+        # keyed by tag name (see ``_get_smirnoff_parameter_data``)
+        _smirnoff_parameter_data: Optional[Dict] = PrivateAttr(None)
+
         @validator("box")
         def validate_box(cls, val):
             if val is None:
@@ -123,6 +186,103 @@ class Interchange(DefaultModel):
     def box(self, value):
         self._inner_data.box = value
 
+    def check_consistency(self) -> None:
+        """
+        Check that the data in this Interchange is valid and self-consistent.
+
+        Importers, i.e. ``Interchange.from_smirnoff``, create potentials without validating
+        each of them. This method instead checks all handlers at once, using their
+        columnar representation (see ``PotentialHandler.to_arrays``):
+
+        * the fields of each handler other than its slot map and potentials are valid,
+        * each term has a potential and all values of each parameter have compatible units,
+        * parameters are not infinite,
+        * terms only refer to atoms in the topology,
+        * each atom has vdW parameters, and
+        * positions, if present, have a shape consistent with the topology and are finite.
+
+        .. warning :: This API is experimental and subject to change.
+
+        Raises
+        ------
+        InterchangeValidationError
+            If any problems are found, all of which are listed in the message.
+
+        """
+        problems: List[str] = list()
+        handler_arrays: Dict[str, PotentialArrays] = dict()
+
+        n_atoms = None if self.topology is None else self.topology.mdtop.n_atoms
+
+        for name, handler in self.handlers.items():
+            fields = {
+                field: getattr(handler, field)
+                for field in handler.__fields__
+                if not isinstance(getattr(handler, field), dict)
+            }
+            *_, errors = validate_model(type(handler), fields)
+            if errors is not None:
+                problems.append(f"Handler {name} has invalid fields: {errors}")
+
+            try:
+                arrays = handler.to_arrays()
+            except (
+                MissingParametersError,
+                NotImplementedError,
+                TypeError,
+                ValueError,
+            ) as error:
+                problems.append(f"Handler {name} has invalid potentials: {error}")
+                continue
+
+            handler_arrays[name] = arrays
+
+            infinite = np.isinf(arrays.parameters).any(axis=0)
+            if infinite.any():
+                problems.append(
+                    f"Handler {name} has infinite values of parameters "
+                    f"{np.asarray(arrays.parameter_names)[infinite].tolist()}"
+                )
+
+            if n_atoms is not None:
+                out_of_range = (arrays.atom_indices >= n_atoms) | (
+                    arrays.atom_indices < -1
+                )
+                if out_of_range.any():
+                    problems.append(
+                        f"Handler {name} has terms with atom indices outside of the "
+                        f"topology, which has {n_atoms} atoms"
+                    )
+
+        if n_atoms and "vdW" in handler_arrays:
+            arrays = handler_arrays["vdW"]
+            atom_indices = arrays.atom_indices[:, :1].ravel()
+            if arrays.virtual_site_type is not None:
+                atom_indices = atom_indices[arrays.virtual_site_type == ""]
+            covered = np.zeros(n_atoms, dtype=bool)
+            covered[atom_indices[(atom_indices >= 0) & (atom_indices < n_atoms)]] = True
+            if not covered.all():
+                problems.append(
+                    f"Atoms {np.flatnonzero(~covered).tolist()} have no vdW parameters"
+                )
+
+        if self.positions is not None:
+            positions = np.asarray(self.positions.m)
+            if positions.ndim != 2 or positions.shape[1] != 3:
+                problems.append(f"Found positions of shape {positions.shape}")
+            elif n_atoms is not None and positions.shape[0] < n_atoms:
+                problems.append(
+                    f"Found positions of shape {positions.shape} for a topology with "
+                    f"{n_atoms} atoms"
+                )
+            if not np.isfinite(positions).all():
+                problems.append("Found positions that are not finite")
+
+        if problems:
+            raise InterchangeValidationError(
+                "Found the following problems:\n\t" + "\n\t".join(problems)
+            )
+
     @classmethod
     def _check_supported_handlers(cls, force_field: ForceField):
 
@@ -143,6 +303,10 @@ class Interchange(DefaultModel):
         force_field: ForceField,
         topology: _OFFBioTop,
         box=None,
+        charge_cache: Optional[Union[PartialChargeCache, str, Path]] = None,
+        n_workers: int = 1,
+        executor: Optional[Executor] = None,
+        bond_order_cache: Optional[Union[FractionalBondOrderCache, str, Path]] = None,
     ) -> "Interchange":
         """
         Create a new object by parameterizing a topology with a SMIRNOFF force field.
@@ -155,6 +319,22 @@ class Interchange(DefaultModel):
             The topology to parameterize.
         box
             The box vectors associated with the interchange.
+        charge_cache
+            A persistent cache of partial charges computed by toolkit wrappers (i.e. AM1-BCC),
+            which may be shared between processes. If a path is given, an SQLite cache is
+            opened (or created) at that path.
+        n_workers
+            If greater than 1, create the potential handlers concurrently on a process pool
+            with this many workers. Ignored if ``executor`` is provided.
+        executor
+            An executor, i.e. a ``concurrent.futures.ThreadPoolExecutor``, on which to create
+            the potential handlers concurrently. It is not shut down after use. The wall time
+            taken to create each handler is logged at the ``INFO`` level.
+        bond_order_cache
+            A persistent cache of fractional bond orders computed by toolkit wrappers (i.e.
+            AM1-Wiberg) for parameters interpolated by bond order, which may be shared between
+            processes. If a path is given, an SQLite cache is opened (or created) at that path.
+            Bond orders that are not cached are computed on ``n_workers`` processes.
 
         Examples
         --------
@@ -177,24 +357,119 @@ class Interchange(DefaultModel):
             Interchange with 8 atoms, non-periodic topology
 
         """
-        sys_out = Interchange()
+        if isinstance(charge_cache, (str, Path)):
+            charge_cache = SQLitePartialChargeCache(charge_cache)
+        if isinstance(bond_order_cache, (str, Path)):
+            bond_order_cache = SQLiteFractionalBondOrderCache(bond_order_cache)
+
+        return cls._from_smirnoff_jobs(
+            jobs=cls._get_smirnoff_jobs(force_field),
+            topology=topology,
+            box=box,
+            charge_cache=charge_cache,
+            n_workers=n_workers,
+            executor=executor,
+            bond_order_cache=bond_order_cache,
+        )
 
-        cls._check_supported_handlers(force_field)
+    @classmethod
+    def from_smirnoff_batch(
+        cls,
+        force_field: ForceField,
+        topologies: Iterable[Union[_OFFBioTop, Topology]],
+        charge_cache: Optional[Union[PartialChargeCache, str, Path]] = None,
+        n_workers: int = 1,
+        bond_order_cache: Optional[Union[FractionalBondOrderCache, str, Path]] = None,
+    ) -> Iterator[Union["Interchange", BaseException]]:
+        """
+        Parameterize many topologies with one SMIRNOFF force field.
 
-        if isinstance(topology, _OFFBioTop):
-            # TODO: See if Topology(topology) is fixed
-            # https://github.com/openforcefield/openff-toolkit/issues/946
-            sys_out.topology = deepcopy(topology)
-            sys_out.topology.mdtop = topology.mdtop
-        elif isinstance(topology, Topology):
-            sys_out.topology = _OFFBioTop(
-                mdtop=md.Topology.from_openmm(topology.to_openmm())
-            )
-        else:
-            raise InvalidTopologyError(
-                "Could not process topology argument, expected Topology or _OFFBioTop. "
-                f"Found object of type {type(topology)}."
-            )
+        The force field is validated once, rather than once per topology, and each worker
+        process keeps its own cache of parameters matched to each unique molecule. Results
+        are yielded in the same order as the input topologies as they become available. If
+        parameterizing a topology fails, the exception is yielded in place of the
+        ``Interchange`` object and the remaining topologies are still processed.
+
+        .. warning :: This API is experimental and subject to change.
+
+        Parameters
+        ----------
+        force_field
+            The force field to parameterize the topologies with.
+        topologies
+            The topologies to parameterize. This may be a lazy iterable, i.e. a generator.
+        charge_cache
+            A persistent cache of partial charges computed by toolkit wrappers, shared by all
+            workers. If a path is given, an SQLite cache is opened (or created) at that path.
+        n_workers
+            If greater than 1, parameterize topologies on a process pool with this many workers.
+        bond_order_cache
+            A persistent cache of fractional bond orders computed by toolkit wrappers, shared by
+            all workers. If a path is given, an SQLite cache is opened (or created) at that path.
+
+        Examples
+        --------
+        Parameterize a few ligands, skipping any that fail
+
+        .. code-block:: pycon
+
+            >>> from openff.interchange.components.interchange import Interchange
+            >>> from openff.toolkit.topology import Molecule
+            >>> from openff.toolkit.typing.engines.smirnoff import ForceField
+            >>> parsley = ForceField("openff-1.0.0.offxml")
+            >>> topologies = [Molecule.from_smiles(smi).to_topology() for smi in ["CCO", "CCN"]]
+            >>> for out in Interchange.from_smirnoff_batch(parsley, topologies):
+            ...     if isinstance(out, BaseException):
+            ...         continue
+            ...     print(out)
+            Interchange with 9 atoms, non-periodic topology
+            Interchange with 10 atoms, non-periodic topology
+
+        """
+        if isinstance(charge_cache, (str, Path)):
+            charge_cache = SQLitePartialChargeCache(charge_cache)
+        if isinstance(bond_order_cache, (str, Path)):
+            bond_order_cache = SQLiteFractionalBondOrderCache(bond_order_cache)
+
+        jobs = cls._get_smirnoff_jobs(force_field)
+        parameter_data = _get_smirnoff_parameter_data(jobs)
+
+        if n_workers <= 1:
+            for topology in topologies:
+                yield _parameterize_batch_item(
+                    topology, jobs, charge_cache, bond_order_cache, parameter_data
+                )
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_initialize_batch_worker,
+            initargs=(jobs, charge_cache, bond_order_cache, parameter_data),
+        ) as executor:
+            # Only keep a few items in flight, so that results stream back and a long or
+            # lazy iterable of topologies is never fully loaded into memory
+            pending: Deque[Future] = deque()
+
+            for topology in topologies:
+                pending.append(executor.submit(_parameterize_batch_item, topology))
+
+                if len(pending) >= 2 * n_workers:
+                    yield _get_batch_result(pending.popleft())
+
+            while pending:
+                yield _get_batch_result(pending.popleft())
+
+    @classmethod
+    def _get_smirnoff_jobs(
+        cls,
+        force_field: ForceField,
+    ) -> List[Tuple[Type[SMIRNOFFPotentialHandler], List[ParameterHandler]]]:
+        """
+        Validate a force field and group its parameter handlers by the potential handler they create.
+
+        This only depends on the force field, so it can be done once for many topologies.
+        """
+        cls._check_supported_handlers(force_field)
 
         parameter_handlers_by_type = {
             force_field[parameter_handler_name].__class__: force_field[
@@ -212,6 +487,8 @@ class Interchange(DefaultModel):
                 "type are currently supported."
             )
 
+        jobs = list()
+
         for potential_handler_type in SMIRNOFF_POTENTIAL_HANDLERS:
 
             parameter_handlers = [
@@ -223,45 +500,155 @@ class Interchange(DefaultModel):
             if len(parameter_handlers) == 0:
                 continue
 
-            # TODO: Might be simpler to rework the bond handler to be self-contained and
-            #       move back to the constraint handler dealing with the logic (and
-            #       depending on the bond handler)
-            if potential_handler_type == SMIRNOFFBondHandler:
-                SMIRNOFFBondHandler.check_supported_parameters(force_field["Bonds"])
-                potential_handler = SMIRNOFFBondHandler._from_toolkit(
-                    parameter_handler=force_field["Bonds"],
-                    topology=topology,
-                    # constraint_handler=constraint_handler,
-                )
-                sys_out.handlers.update({"Bonds": potential_handler})
-            elif potential_handler_type == SMIRNOFFConstraintHandler:
-                bond_handler = force_field._parameter_handlers.get("Bonds", None)
-                constraint_handler = force_field._parameter_handlers.get(
-                    "Constraints", None
-                )
-                if constraint_handler is None:
+            if potential_handler_type == SMIRNOFFConstraintHandler:
+                if "Constraints" not in force_field.registered_parameter_handlers:
                     continue
-                constraints = SMIRNOFFConstraintHandler._from_toolkit(
-                    parameter_handler=[
-                        val
-                        for val in [bond_handler, constraint_handler]
-                        if val is not None
-                    ],
-                    topology=topology,
-                )
-                sys_out.handlers.update({"Constraints": constraints})
-                continue
-            elif len(potential_handler_type.allowed_parameter_handlers()) > 1:
-                potential_handler = potential_handler_type._from_toolkit(  # type: ignore
-                    parameter_handler=parameter_handlers,
-                    topology=topology,
-                )
-            else:
+            elif len(potential_handler_type.allowed_parameter_handlers()) == 1:
                 potential_handler_type.check_supported_parameters(parameter_handlers[0])
-                potential_handler = potential_handler_type._from_toolkit(  # type: ignore
-                    parameter_handler=parameter_handlers[0],
-                    topology=topology,
-                )
+
+            jobs.append((potential_handler_type, parameter_handlers))
+
+        return jobs
+
+    @classmethod
+    def _from_smirnoff_jobs(
+        cls,
+        jobs: List[Tuple[Type[SMIRNOFFPotentialHandler], List[ParameterHandler]]],
+        topology: _OFFBioTop,
+        box=None,
+        charge_cache: Optional[PartialChargeCache] = None,
+        n_workers: int = 1,
+        executor: Optional[Executor] = None,
+        bond_order_cache: Optional[FractionalBondOrderCache] = None,
+        parameter_data: Optional[Dict] = None,
+    ) -> "Interchange":
+        """
+        Create a new object from the output of ``_get_smirnoff_jobs`` and a topology.
+
+        ``parameter_data`` is the output of ``_get_smirnoff_parameter_data`` for ``jobs``,
+        which is computed if not provided.
+        """
+        sys_out = Interchange()
+        sys_out._inner_data._smirnoff_parameter_data = (
+            _get_smirnoff_parameter_data(jobs)
+            if parameter_data is None
+            else parameter_data
+        )
+
+        if isinstance(topology, _OFFBioTop):
+            # TODO: See if Topology(topology) is fixed
+            # https://github.com/openforcefield/openff-toolkit/issues/946
+            sys_out.topology = deepcopy(topology)
+            sys_out.topology.mdtop = topology.mdtop
+        elif isinstance(topology, Topology):
+            sys_out.topology = _OFFBioTop(
+                mdtop=md.Topology.from_openmm(topology.to_openmm())
+            )
+        else:
+            raise InvalidTopologyError(
+                "Could not process topology argument, expected Topology or _OFFBioTop. "
+                f"Found object of type {type(topology)}."
+            )
+
+        owns_executor = executor is None and n_workers > 1
+
+        if owns_executor:
+            executor = ProcessPoolExecutor(max_workers=n_workers)
+
+        job_types = {potential_handler_type for potential_handler_type, _ in jobs}
+        results: Dict[
+            Type[SMIRNOFFPotentialHandler], Tuple[SMIRNOFFPotentialHandler, float]
+        ] = dict()
+
+        def _get_dependencies(potential_handler_type) -> Dict:
+            # Handlers that this handler depends on and that are created in this call,
+            # which are passed to it rather than created again, keyed by their type
+            return {
+                results[dependency][0].type: results[dependency][0]
+                for dependency in potential_handler_type.handler_dependencies()
+                if dependency in job_types
+            }
+
+        try:
+            remaining = list(jobs)
+            futures: Dict[Type[SMIRNOFFPotentialHandler], Future] = dict()
+
+            # Each handler is created exactly once, after any handlers it depends on
+            while remaining:
+                ready = [
+                    (potential_handler_type, parameter_handlers)
+                    for potential_handler_type, parameter_handlers in remaining
+                    if all(
+                        dependency in results or dependency not in job_types
+                        for dependency in potential_handler_type.handler_dependencies()
+                    )
+                ]
+
+                if not ready:
+                    if not futures:
+                        raise RuntimeError(
+                            "Found circular dependencies between potential handlers: "
+                            f"{[job[0].__name__ for job in remaining]}"
+                        )
+
+                    # Wait for handlers created elsewhere that others depend on
+                    done, _ = wait(futures.values(), return_when=FIRST_COMPLETED)
+                    for potential_handler_type, future in list(futures.items()):
+                        if future in done:
+                            results[potential_handler_type] = future.result()
+                            futures.pop(potential_handler_type)
+                    continue
+
+                # Bonds are created first and in this process, since they may assign
+                # fractional bond orders to the topology that other handlers depend on
+                for potential_handler_type, parameter_handlers in ready:
+                    if executor is not None:
+                        if potential_handler_type != SMIRNOFFBondHandler:
+                            continue
+                    results[
+                        potential_handler_type
+                    ] = _create_smirnoff_potential_handler(
+                        potential_handler_type,
+                        parameter_handlers,
+                        topology,
+                        charge_cache,
+                        _get_dependencies(potential_handler_type),
+                        bond_order_cache,
+                        n_workers,
+                    )
+
+                for potential_handler_type, parameter_handlers in ready:
+                    if potential_handler_type not in results:
+                        futures[
+                            potential_handler_type
+                        ] = executor.submit(  # type: ignore[union-attr]
+                            _create_smirnoff_potential_handler,
+                            potential_handler_type,
+                            parameter_handlers,
+                            topology,
+                            charge_cache,
+                            _get_dependencies(potential_handler_type),
+                            bond_order_cache,
+                        )
+
+                remaining = [
+                    job
+                    for job in remaining
+                    if job[0] not in results and job[0] not in futures
+                ]
+
+            for potential_handler_type, future in futures.items():
+                results[potential_handler_type] = future.result()
+        finally:
+            if owns_executor:
+                executor.shutdown()  # type: ignore[union-attr]
+
+        # Store handlers in the same order regardless of the order in which they finished
+        for potential_handler_type, _ in jobs:
+            potential_handler, wall_time = results[potential_handler_type]
+            logger.info(
+                "Created %s handler in %.3f s", potential_handler.type, wall_time
+            )
             sys_out.handlers.update({potential_handler.type: potential_handler})
 
         # `box` argument is only overriden if passed `None` and the input topology
@@ -273,6 +660,343 @@ class Interchange(DefaultModel):
 
         return sys_out
 
+    def update_topology(
+        self,
+        force_field: ForceField,
+        remove_atoms: Optional[Iterable[int]] = None,
+        add_molecules: Optional[Iterable[Molecule]] = None,
+        insert_at: Optional[int] = None,
+        positions=None,
+        **kwargs,
+    ) -> "Interchange":
+        """
+        Create a new object by editing the topology, re-parameterizing only the molecules added.
+
+        The terms of the removed atoms are dropped from each handler and the remaining terms
+        are re-indexed, without parameterizing the rest of the topology again. The added
+        molecules are parameterized on their own with ``force_field``, which should be the
+        force field this object was created with, and their terms spliced into each handler.
+        Removing a range of atoms and inserting molecules in its place replaces, i.e.,
+        mutates, part of the topology.
+
+        Like combining ``Interchange`` objects, the topology of the result only stores
+        an MDTraj topology, not OpenFF molecules.
+
+        .. warning :: This API is experimental and subject to change.
+
+        Parameters
+        ----------
+        force_field
+            The force field to parameterize the added molecules with.
+        remove_atoms
+            The indices of the atoms to remove. They must make up whole molecules.
+        add_molecules
+            The molecules to add.
+        insert_at
+            The index of the atom, in this object, before which the added molecules are
+            inserted. By default, they are appended to the end of the topology.
+        positions
+            The positions of the atoms of the added molecules. If not given, the first
+            conformer of each added molecule is used. Ignored if this object has no positions.
+        kwargs
+            Other arguments passed to ``Interchange.from_smirnoff`` when parameterizing the
+            added molecules, i.e. ``charge_cache``.
+
+        Examples
+        --------
+        Replace the first of two ethanol molecules with methanol
+
+        .. code-block:: pycon
+
+            >>> from openff.interchange.components.interchange import Interchange
+            >>> from openff.toolkit.topology import Molecule, Topology
+            >>> from openff.toolkit.typing.engines.smirnoff import ForceField
+            >>> parsley = ForceField("openff-1.0.0.offxml")
+            >>> ethanol = Molecule.from_smiles("CCO")
+            >>> topology = Topology.from_molecules([ethanol, ethanol])
+            >>> interchange = Interchange.from_smirnoff(parsley, topology)
+            >>> interchange.update_topology(
+            ...     parsley,
+            ...     remove_atoms=range(9),
+            ...     add_molecules=[Molecule.from_smiles("CO")],
+            ...     insert_at=0,
+            ... )
+            Interchange with 15 atoms, non-periodic topology
+
+        """
+        mdtop = self.topology.mdtop
+        n_atoms = mdtop.n_atoms
+
+        removed = np.zeros(n_atoms, dtype=bool)
+        if remove_atoms is not None:
+            remove_indices = np.fromiter(remove_atoms, dtype=np.int64)
+            if np.any((remove_indices < 0) | (remove_indices >= n_atoms)):
+                raise InvalidTopologyError(
+                    f"Cannot remove atoms outside of a topology with {n_atoms} atoms"
+                )
+            removed[remove_indices] = True
+
+            for bond in mdtop.bonds:
+                if removed[bond.atom1.index] != removed[bond.atom2.index]:
+                    raise InvalidTopologyError(
+                        "Removed atoms must make up whole molecules, but found a bond "
+                        f"between atoms {bond.atom1.index} and {bond.atom2.index}, only "
+                        "one of which is removed."
+                    )
+
+        if insert_at is None:
+            insert_at = n_atoms
+        elif not 0 <= insert_at <= n_atoms:
+            raise InvalidTopologyError(
+                f"Cannot insert molecules at atom {insert_at} of a topology with "
+                f"{n_atoms} atoms"
+            )
+
+        molecules = list(add_molecules or [])
+
+        if molecules:
+            added = Interchange.from_smirnoff(
+                force_field,
+                _OFFBioTop.from_molecules(
+                    mdtop=md.Topology.from_openmm(
+                        Topology.from_molecules(molecules).to_openmm()
+                    ),
+                    molecules=molecules,
+                ),
+                **kwargs,
+            )
+            added_mdtop = added.topology.mdtop
+        else:
+            added = Interchange()
+            added_mdtop = md.Topology()
+
+        n_added = added_mdtop.n_atoms
+
+        # Kept atoms stay in order, shifted past the inserted atoms if after them
+        kept_rank = np.cumsum(~removed) - 1
+        offset = int((~removed[:insert_at]).sum())
+        index_map = np.where(
+            removed, -1, kept_rank + np.where(kept_rank >= offset, n_added, 0)
+        )
+
+        # Terms whose atoms all come before this index are unchanged
+        first_changed = min(
+            insert_at if n_added else n_atoms,
+            int(np.argmax(removed)) if removed.any() else n_atoms,
+        )
+
+        spliced = Interchange()
+        spliced.topology = _OFFBioTop(
+            mdtop=_splice_topologies(mdtop, index_map, insert_at, added_mdtop)
+        )
+        spliced.box = self.box
+
+        for handler_name, handler in self.handlers.items():
+            spliced.handlers[handler_name] = _splice_handler(
+                handler,
+                added.handlers.get(handler_name),
+                index_map,
+                first_changed,
+                offset,
+            )
+
+        for handler_name, handler in added.handlers.items():
+            if handler_name not in spliced.handlers:
+                spliced.handlers[handler_name] = _splice_handler(
+                    handler.copy(update={"slot_map": dict(), "potentials": dict()}),
+                    handler,
+                    index_map,
+                    first_changed,
+                    offset,
+                )
+
+        if self.positions is not None:
+            new_positions = None
+
+            if n_added == 0:
+                new_positions = np.zeros((0, 3))
+            elif positions is not None:
+                if not isinstance(positions, unit.Quantity):
+                    positions = from_openmm(positions)
+                new_positions = positions.m_as(unit.nanometer)
+            elif all(molecule.conformers for molecule in molecules):
+                new_positions = np.concatenate(
+                    [
+                        from_openmm(molecule.conformers[0]).m_as(unit.nanometer)
+                        for molecule in molecules
+                    ]
+                )
+
+            if new_positions is None:
+                warnings.warn(
+                    "Setting positions to None because no positions were given for the "
+                    "added molecules, which have no conformers."
+                )
+            else:
+                old_positions = self.positions.m_as(unit.nanometer)[~removed]
+                spliced_positions = np.concatenate(
+                    [
+                        old_positions[:offset],
+                        np.reshape(new_positions, (n_added, 3)),
+                        old_positions[offset:],
+                    ]
+                )
+                spliced.positions = spliced_positions * unit.nanometer
+
+        return spliced
+
+    def update_force_field(
+        self,
+        force_field: ForceField,
+        charge_cache: Optional[Union[PartialChargeCache, str, Path]] = None,
+        bond_order_cache: Optional[Union[FractionalBondOrderCache, str, Path]] = None,
+    ) -> "Interchange":
+        """
+        Create a new object by re-parameterizing this one with a modified SMIRNOFF force field.
+
+        The parameter handlers of ``force_field`` are compared with those this object was
+        created from, and each potential handler is
+
+        * reused if none of its parameter handlers changed,
+        * refreshed, by only looking up the potentials of its existing terms again, if only
+          the values of parameters changed, or
+        * created from scratch, matching parameters to the topology again, if parameters
+          were added, removed or reordered, or handler attributes (i.e. cutoffs) changed.
+
+        Since charges are assigned while matching parameters, electrostatics are always
+        created from scratch if any of their parameter handlers changed. Constraints are
+        refreshed if only the values of bond parameters changed. If this
+        object was not created by ``Interchange.from_smirnoff``, all handlers are created
+        from scratch. Creating handlers from scratch requires the topology of this object
+        to store OpenFF molecules.
+
+        .. warning :: This API is experimental and subject to change.
+
+        Parameters
+        ----------
+        force_field
+            The modified force field.
+        charge_cache
+            A persistent cache of partial charges computed by toolkit wrappers, used if
+            electrostatics are created from scratch. If a path is given, an SQLite cache is
+            opened (or created) at that path.
+        bond_order_cache
+            A persistent cache of fractional bond orders computed by toolkit wrappers, used if
+            bonds or torsions are created from scratch. If a path is given, an SQLite cache is
+            opened (or created) at that path.
+
+        Examples
+        --------
+        Re-parameterize with a stiffer bond parameter
+
+        .. code-block:: pycon
+
+            >>> from openff.interchange.components.interchange import Interchange
+            >>> from openff.toolkit.topology import Molecule
+            >>> from openff.toolkit.typing.engines.smirnoff import ForceField
+            >>> parsley = ForceField("openff-1.0.0.offxml")
+            >>> topology = Molecule.from_smiles("CCO").to_topology()
+            >>> interchange = Interchange.from_smirnoff(parsley, topology)
+            >>> parsley["Bonds"].parameters["[#6X4:1]-[#6X4:2]"].k *= 2
+            >>> interchange.update_force_field(parsley)
+            Interchange with 9 atoms, non-periodic topology
+
+        """
+        if isinstance(charge_cache, (str, Path)):
+            charge_cache = SQLitePartialChargeCache(charge_cache)
+        if isinstance(bond_order_cache, (str, Path)):
+            bond_order_cache = SQLiteFractionalBondOrderCache(bond_order_cache)
+
+        jobs = self._get_smirnoff_jobs(force_field)
+        parameter_data = _get_smirnoff_parameter_data(jobs)
+        old_parameter_data = self._inner_data._smirnoff_parameter_data or dict()
+
+        old_handlers = {type(handler): handler for handler in self.handlers.values()}
+        new_handlers: Dict[Type[SMIRNOFFPotentialHandler], PotentialHandler] = dict()
+        refreshed_types: Set[Type[SMIRNOFFPotentialHandler]] = set()
+
+        # Jobs are ordered such that handlers come after any handlers they depend on
+        for potential_handler_type, parameter_handlers in jobs:
+            old_handler = old_handlers.get(potential_handler_type)
+
+            old_data = [
+                old_parameter_data.get(parameter_handler._TAGNAME)
+                for parameter_handler in parameter_handlers
+            ]
+            new_data = [
+                parameter_data[parameter_handler._TAGNAME]
+                for parameter_handler in parameter_handlers
+            ]
+
+            if old_handler is None:
+                pass
+            elif old_data == new_data:
+                new_handlers[potential_handler_type] = _copy_handler(old_handler)
+                logger.info("Reused %s handler", old_handler.type)
+                continue
+            elif potential_handler_type in _REFRESHABLE_SMIRNOFF_HANDLERS:
+                if _only_parameter_values_changed(old_data[0], new_data[0]):
+                    refreshed = _copy_handler(old_handler, potentials=dict())
+                    refreshed.store_potentials(  # type: ignore[attr-defined]
+                        parameter_handler=parameter_handlers[0]
+                    )
+                    new_handlers[potential_handler_type] = refreshed
+                    refreshed_types.add(potential_handler_type)
+                    logger.info("Refreshed potentials of %s handler", refreshed.type)
+                    continue
+            elif potential_handler_type is SMIRNOFFConstraintHandler:
+                # Constraints without a distance only take the lengths of bonds, so are
+                # unchanged if only the values of bond parameters changed
+                constraints_data = parameter_data.get("Constraints")
+                if SMIRNOFFBondHandler in refreshed_types:
+                    if old_parameter_data.get("Constraints") == constraints_data:
+                        refreshed = _copy_handler(old_handler)
+                        refreshed.update_bond_lengths(  # type: ignore[attr-defined]
+                            new_handlers[SMIRNOFFBondHandler]
+                        )
+                        new_handlers[potential_handler_type] = refreshed
+                        refreshed_types.add(potential_handler_type)
+                        logger.info(
+                            "Refreshed potentials of %s handler", refreshed.type
+                        )
+                        continue
+
+            if self.topology.n_topology_molecules == 0 and self.topology.mdtop.n_atoms:
+                raise InvalidTopologyError(
+                    "Cannot match parameters to a topology that does not store OpenFF "
+                    "molecules, i.e. one created from an OpenFF Topology rather than an "
+                    "_OFFBioTop, or by combining Interchange objects."
+                )
+
+            dependencies = {
+                new_handlers[dependency].type: new_handlers[dependency]
+                for dependency in potential_handler_type.handler_dependencies()
+                if dependency in new_handlers
+            }
+            potential_handler, wall_time = _create_smirnoff_potential_handler(
+                potential_handler_type,
+                parameter_handlers,
+                self.topology,
+                charge_cache,
+                dependencies,
+                bond_order_cache,
+            )
+            new_handlers[potential_handler_type] = potential_handler
+            logger.info(
+                "Created %s handler in %.3f s", potential_handler.type, wall_time
+            )
+
+        updated = Interchange()
+        updated._inner_data._smirnoff_parameter_data = parameter_data
+        updated.topology = self.topology
+        updated.box = self.box
+        updated.positions = self.positions
+
+        for potential_handler in new_handlers.values():
+            updated.handlers.update({potential_handler.type: potential_handler})
+
+        return updated
+
     def visualize(self, backend: str = "nglview"):
         """
         Visualize this Interchange.
@@ -358,11 +1082,59 @@ class Interchange(DefaultModel):
         else:
             raise UnsupportedExportError
 
-    def to_openmm(self, combine_nonbonded_forces: bool = False):
-        """Export this Interchange to an OpenMM System."""
+    def to_openmm(
+        self,
+        combine_nonbonded_forces: bool = False,
+        parameter_map: Optional["OpenMMParameterMap"] = None,
+    ):
+        """
+        Export this Interchange to an OpenMM System.
+
+        If an (empty) ``OpenMMParameterMap`` is passed as ``parameter_map``, it is populated
+        with the force terms each potential is exported to, so that parameters changed
+        later can be pushed into the returned system with
+        ``OpenMMParameterMap.update_parameters``.
+        """
         from openff.interchange.interop.openmm import to_openmm as to_openmm_
 
-        return to_openmm_(self, combine_nonbonded_forces=combine_nonbonded_forces)
+        return to_openmm_(
+            self,
+            combine_nonbonded_forces=combine_nonbonded_forces,
+            parameter_map=parameter_map,
+        )
+
+    def to_file(self, file_path: Union[Path, str]):
+        """
+        Write this Interchange to a binary file.
+
+        The file stores the data of each handler as arrays (with one unit per column of
+        parameters), which can be memory-mapped when the file is read with ``from_file``.
+
+        .. warning :: This API is experimental and subject to change.
+        """
+        from openff.interchange.interop.internal.binary import to_file
+
+        to_file(self, file_path)
+
+    @classmethod
+    def from_file(
+        cls,
+        file_path: Union[Path, str],
+        handlers: Optional[Iterable[str]] = None,
+        mmap: bool = True,
+    ) -> "Interchange":
+        """
+        Read an Interchange from a binary file written by ``Interchange.to_file``.
+
+        Handler data is memory-mapped from the file (unless ``mmap=False``) and the slot
+        maps and potentials of handlers are only created when first accessed. Pass
+        ``handlers`` to only load some handlers.
+
+        .. warning :: This API is experimental and subject to change.
+        """
+        from openff.interchange.interop.internal.binary import from_file
+
+        return from_file(file_path, handlers=handlers, mmap=mmap)
 
     def to_prmtop(self, file_path: Union[Path, str], writer="internal"):
         """Export this Interchange to an Amber .prmtop file."""
@@ -431,11 +1203,19 @@ class Interchange(DefaultModel):
     @classmethod
     @requires_package("foyer")
     def from_foyer(
-        cls, topology: "_OFFBioTop", force_field: "FoyerForcefield", **kwargs
+        cls,
+        topology: "_OFFBioTop",
+        force_field: "FoyerForcefield",
+        n_workers: int = 1,
+        **kwargs,
     ) -> "Interchange":
         """
         Create an Interchange object from a Foyer force field and an OpenFF topology.
 
+        Atom types are found once per unique molecule and copied to identical molecules.
+        If ``n_workers`` is greater than 1, unique molecules are typed concurrently on a
+        process pool with this many workers.
+
         Examples
         --------
         Generate an Interchange object from a single-molecule (OpenFF) topology and
@@ -475,14 +1255,22 @@ class Interchange(DefaultModel):
 
             system.handlers[name] = handler
 
-        system.handlers["vdW"].store_matches(force_field, topology=system.topology)
-        system.handlers["vdW"].store_potentials(force_field=force_field)
+        system.handlers["vdW"].store_matches(
+            force_field, topology=system.topology, n_workers=n_workers
+        )
+        # Parameters are looked up once per unique atom type (or tuple of them)
+        parameter_cache: Dict = dict()
+
+        system.handlers["vdW"].store_potentials(
+            force_field=force_field, parameter_cache=parameter_cache
+        )
 
         atom_slots = system.handlers["vdW"].slot_map
 
         system.handlers["Electrostatics"].store_charges(
             atom_slots=atom_slots,
             force_field=force_field,
+            parameter_cache=parameter_cache,
         )
 
         system.handlers["vdW"].scale_14 = force_field.lj14scale
@@ -491,7 +1279,7 @@ class Interchange(DefaultModel):
         for name, handler in system.handlers.items():
             if name not in ["vdW", "Electrostatics"]:
                 handler.store_matches(atom_slots, topology=system.topology)
-                handler.store_potentials(force_field)
+                handler.store_potentials(force_field, parameter_cache=parameter_cache)
 
         return system
 
@@ -690,3 +1478,249 @@ class Interchange(DefaultModel):
         except NameError:
             n_atoms = self.topology.n_topology_atoms
         return f"Interchange with {n_atoms} atoms, {'' if periodic else 'non-'}periodic topology"
+
+
+def _splice_handler(
+    handler: PotentialHandler,
+    added_handler: Optional[PotentialHandler],
+    index_map: np.ndarray,
+    first_changed: int,
+    offset: int,
+) -> PotentialHandler:
+    """
+    Re-index the terms of a handler and add the terms of another one.
+
+    ``index_map`` maps old atom indices to new ones, or to -1 for removed atoms, whose
+    terms are dropped. Terms only involving atoms before ``first_changed`` keep their
+    keys. The atom indices of the terms of ``added_handler`` are shifted by ``offset``.
+    """
+    mapped = index_map.tolist()
+    slot_map: Dict = dict()
+
+    for topology_key, potential_key in handler.slot_map.items():
+        atom_indices = topology_key.atom_indices
+        if max(atom_indices, default=-1) < first_changed:
+            slot_map[topology_key] = potential_key
+            continue
+        new_indices = tuple(mapped[index] for index in atom_indices)
+        if -1 in new_indices:
+            continue
+        slot_map[
+            topology_key.copy(update={"atom_indices": new_indices})
+        ] = potential_key
+
+    removed_terms = len(slot_map) < len(handler.slot_map)
+
+    update = {"slot_map": slot_map, "potentials": dict(handler.potentials)}
+    # SMIRNOFFConstraintHandler stores its potentials separately
+    if hasattr(handler, "constraints"):
+        update["constraints"] = dict(handler.constraints)  # type: ignore[attr-defined]
+
+    if added_handler is not None:
+        for topology_key, potential_key in added_handler.slot_map.items():
+            new_indices = tuple(index + offset for index in topology_key.atom_indices)
+            slot_map[
+                topology_key.copy(update={"atom_indices": new_indices})
+            ] = potential_key
+
+        update["potentials"].update(added_handler.potentials)
+        if "constraints" in update:
+            update["constraints"].update(added_handler.constraints)  # type: ignore[attr-defined]
+
+    if removed_terms:
+        # Drop the potentials that were only used by removed terms
+        used = set(slot_map.values())
+        for name in ("potentials", "constraints"):
+            if name in update:
+                update[name] = {
+                    key: value for key, value in update[name].items() if key in used
+                }
+
+    # Keys are copied or created from validated keys, so are not validated again
+    return handler.copy(
+        update={name: _TrackedDict(value) for name, value in update.items()}
+    )
+
+
+def _copy_handler(handler: PotentialHandler, **update) -> PotentialHandler:
+    """
+    Copy a handler and the dicts storing its terms and potentials, but not their contents.
+
+    Dicts in ``update`` replace the corresponding dicts of ``handler``.
+    """
+    # SMIRNOFFConstraintHandler stores its potentials separately
+    for name in ("slot_map", "potentials", "constraints"):
+        if name not in update and hasattr(handler, name):
+            update[name] = getattr(handler, name)
+
+    return handler.copy(
+        update={name: _TrackedDict(value) for name, value in update.items()}
+    )
+
+
+def _get_smirnoff_parameter_data(
+    jobs: List[Tuple[Type[SMIRNOFFPotentialHandler], List[ParameterHandler]]],
+) -> Dict[str, Tuple[Dict, List[Dict]]]:
+    """
+    Record the attributes and parameters of the parameter handlers of ``_get_smirnoff_jobs``.
+
+    The data is keyed by the tag name of each parameter handler and stores a dict of its
+    attributes and a list of dicts of its parameters, in order. It is a snapshot, so that
+    it can be compared with the force field after it is modified in place.
+    """
+    parameter_data = dict()
+
+    for _, parameter_handlers in jobs:
+        for parameter_handler in parameter_handlers:
+            attributes = {
+                key: value
+                for key, value in parameter_handler.to_dict().items()
+                if not isinstance(value, list)
+            }
+            parameters = [
+                parameter.to_dict() for parameter in parameter_handler.parameters
+            ]
+            parameter_data[parameter_handler._TAGNAME] = (attributes, parameters)
+
+    return parameter_data
+
+
+def _only_parameter_values_changed(
+    old_data: Optional[Tuple[Dict, List[Dict]]],
+    new_data: Tuple[Dict, List[Dict]],
+) -> bool:
+    """
+    Return whether two snapshots of a parameter handler only differ in parameter values.
+
+    If so, the same parameters (with the same attributes) are matched to the same terms.
+    """
+    if old_data is None:
+        return False
+
+    old_attributes, old_parameters = old_data
+    new_attributes, new_parameters = new_data
+
+    if old_attributes != new_attributes or len(old_parameters) != len(new_parameters):
+        return False
+
+    for old_parameter, new_parameter in zip(old_parameters, new_parameters):
+        if old_parameter["smirks"] != new_parameter["smirks"]:
+            return False
+        if old_parameter.keys() != new_parameter.keys():
+            return False
+
+    return True
+
+
+def _create_smirnoff_potential_handler(
+    potential_handler_type: Type[SMIRNOFFPotentialHandler],
+    parameter_handlers: List[ParameterHandler],
+    topology: _OFFBioTop,
+    charge_cache: Optional[PartialChargeCache] = None,
+    dependencies: Optional[Dict[str, SMIRNOFFPotentialHandler]] = None,
+    bond_order_cache: Optional[FractionalBondOrderCache] = None,
+    n_workers: int = 1,
+) -> Tuple[SMIRNOFFPotentialHandler, float]:
+    """
+    Create a potential handler from toolkit parameter handlers and report the wall time it took.
+
+    ``dependencies`` holds the already-created handlers, keyed by type, that this handler
+    declares in ``handler_dependencies``. Fractional bond orders that are not found in
+    ``bond_order_cache`` are computed on ``n_workers`` processes. This is a module-level
+    function so that it can be submitted to process pools.
+    """
+    start = time.perf_counter()
+
+    if potential_handler_type.handler_dependencies():
+        potential_handler = potential_handler_type._from_toolkit(  # type: ignore
+            parameter_handler=parameter_handlers,
+            topology=topology,
+            dependencies=dependencies,
+        )
+    elif potential_handler_type in (SMIRNOFFBondHandler, SMIRNOFFProperTorsionHandler):
+        potential_handler = potential_handler_type._from_toolkit(  # type: ignore
+            parameter_handler=parameter_handlers[0],
+            topology=topology,
+            bond_order_cache=bond_order_cache,
+            n_workers=n_workers,
+        )
+    elif potential_handler_type == SMIRNOFFElectrostaticsHandler:
+        potential_handler = SMIRNOFFElectrostaticsHandler._from_toolkit(
+            parameter_handler=parameter_handlers,
+            topology=topology,
+            charge_cache=charge_cache,
+        )
+    elif len(potential_handler_type.allowed_parameter_handlers()) > 1:
+        potential_handler = potential_handler_type._from_toolkit(  # type: ignore
+            parameter_handler=parameter_handlers,
+            topology=topology,
+        )
+    else:
+        potential_handler = potential_handler_type._from_toolkit(  # type: ignore
+            parameter_handler=parameter_handlers[0],
+            topology=topology,
+        )
+
+    return potential_handler, time.perf_counter() - start
+
+
+_BATCH_WORKER_STATE: Dict = dict()
+
+
+def _initialize_batch_worker(
+    jobs: List[Tuple[Type[SMIRNOFFPotentialHandler], List[ParameterHandler]]],
+    charge_cache: Optional[PartialChargeCache],
+    bond_order_cache: Optional[FractionalBondOrderCache] = None,
+    parameter_data: Optional[Dict] = None,
+) -> None:
+    """Store the force field data shared by every item processed by a batch worker."""
+    _BATCH_WORKER_STATE["jobs"] = jobs
+    _BATCH_WORKER_STATE["charge_cache"] = charge_cache
+    _BATCH_WORKER_STATE["bond_order_cache"] = bond_order_cache
+    _BATCH_WORKER_STATE["parameter_data"] = parameter_data
+
+
+def _parameterize_batch_item(
+    topology: Union[_OFFBioTop, Topology],
+    jobs: Optional[
+        List[Tuple[Type[SMIRNOFFPotentialHandler], List[ParameterHandler]]]
+    ] = None,
+    charge_cache: Optional[PartialChargeCache] = None,
+    bond_order_cache: Optional[FractionalBondOrderCache] = None,
+    parameter_data: Optional[Dict] = None,
+) -> Union[Interchange, BaseException]:
+    """
+    Parameterize one topology of a batch, returning rather than raising any error.
+
+    If ``jobs`` is not provided, the force field data stored by ``_initialize_batch_worker``
+    is used.
+    """
+    if jobs is None:
+        jobs = _BATCH_WORKER_STATE["jobs"]
+        charge_cache = _BATCH_WORKER_STATE["charge_cache"]
+        bond_order_cache = _BATCH_WORKER_STATE["bond_order_cache"]
+        parameter_data = _BATCH_WORKER_STATE["parameter_data"]
+
+    try:
+        return Interchange._from_smirnoff_jobs(
+            jobs=jobs,  # type: ignore[arg-type]
+            topology=topology,
+            charge_cache=charge_cache,
+            bond_order_cache=bond_order_cache,
+            parameter_data=parameter_data,
+        )
+    except (KeyboardInterrupt, SystemExit):
+        raise
+    # Many exceptions in this package subclass BaseException
+    except BaseException as error:
+        return error
+
+
+def _get_batch_result(future: Future) -> Union[Interchange, BaseException]:
+    """Get the result of a batch item, including errors raised while sending it between processes."""
+    try:
+        return future.result()
+    except (KeyboardInterrupt, SystemExit):
+        raise
+    except BaseException as error:
+        return error
@@ -3,6 +3,7 @@ import copy
 from typing import TYPE_CHECKING, Any, Generator, List, Tuple
 
 import mdtraj as md
+import numpy as np
 from openff.toolkit.topology import Molecule, Topology
 
 if TYPE_CHECKING:
@@ -124,6 +125,60 @@ def _iterate_pairs(mdtop: md.Topology) -> Generator[Tuple["Atom", "Atom"], None,
                         yield (atom_i_partner, atom_j_partner)
 
 
+def _get_bonded_pairs(mdtop: md.Topology) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the pairs of atoms separated by one, two, and three bonds.
+
+    Each array has shape (n_pairs, 2) and stores each pair once, sorted, with the lower
+    index first. Pairs are assigned to their shortest separation, i.e. as with
+    openmm.NonbondedForce.createExceptionsFromBonds, a pair separated by both one and
+    three bonds (as in a four-membered ring) is only a 1-2 pair.
+    """
+    n_atoms = mdtop.n_atoms
+
+    bonds = np.array(
+        [(bond.atom1.index, bond.atom2.index) for bond in mdtop.bonds], dtype=np.int64
+    ).reshape(-1, 2)
+
+    # Directed edges, grouped by their first atom, so that the edges leaving atom i are
+    # edges[offsets[i]:offsets[i + 1]]
+    edges = np.concatenate([bonds, bonds[:, ::-1]])
+    edges = edges[np.argsort(edges[:, 0], kind="stable")]
+    offsets = np.searchsorted(edges[:, 0], np.arange(n_atoms + 1))
+
+    def _extend(paths: np.ndarray) -> np.ndarray:
+        """Extend each path by every edge leaving its last atom, without revisiting atoms."""
+        last = paths[:, -1]
+        counts = offsets[last + 1] - offsets[last]
+        first_edges = np.repeat(offsets[last], counts)
+        edge_indices = first_edges + (
+            np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        )
+        extended = np.hstack(
+            [np.repeat(paths, counts, axis=0), edges[edge_indices, 1:]]
+        )
+        return extended[(extended[:, :-1] != extended[:, -1:]).all(axis=1)]
+
+    def _encode(paths: np.ndarray) -> np.ndarray:
+        """Encode the end atoms of each path as a single integer, sorted and unique."""
+        ends = np.sort(paths[:, [0, -1]], axis=1)
+        return np.unique(ends[:, 0] * n_atoms + ends[:, 1])
+
+    angles = _extend(edges)
+    propers = _extend(angles)
+
+    pairs_12 = _encode(edges)
+    pairs_13 = np.setdiff1d(_encode(angles), pairs_12, assume_unique=True)
+    pairs_14 = np.setdiff1d(
+        _encode(propers), np.union1d(pairs_12, pairs_13), assume_unique=True
+    )
+
+    return tuple(  # type: ignore[return-value]
+        np.stack(np.divmod(pairs, n_atoms), axis=1)
+        for pairs in (pairs_12, pairs_13, pairs_14)
+    )
+
+
 def _get_num_h_bonds(mdtop: md.Topology) -> int:
     """Get the number of (covalent) bonds containing a hydrogen atom."""
     n_bonds_containing_hydrogen = 0
@@ -187,3 +242,59 @@ def _combine_topologies(topology1: _OFFBioTop, topology2: _OFFBioTop) -> _OFFBio
     combined_topology = _OFFBioTop(mdtop=mdtop)
 
     return combined_topology
+
+
+def _splice_topologies(
+    mdtop: md.Topology,
+    index_map: np.ndarray,
+    insert_at: int,
+    inserted: md.Topology,
+) -> md.Topology:
+    """
+    Remove atoms from an MDTraj topology and insert the atoms of another one.
+
+    ``index_map`` maps each atom index in ``mdtop`` to its index in the new topology, or
+    to -1 if the atom is removed. The atoms of ``inserted`` are placed before the atom
+    of ``mdtop`` with index ``insert_at``. Chains and residues that are split by the
+    insertion are split in the new topology.
+    """
+    spliced = md.Topology()
+    mapped = index_map.tolist()
+
+    def _copy_atoms(source: md.Topology, selected) -> None:
+        for chain in source.chains:
+            new_chain = None
+            for residue in chain.residues:
+                new_residue = None
+                for atom in residue.atoms:
+                    if not selected(atom.index):
+                        continue
+                    if new_chain is None:
+                        new_chain = spliced.add_chain()
+                    if new_residue is None:
+                        new_residue = spliced.add_residue(
+                            name=residue.name,
+                            chain=new_chain,
+                            resSeq=residue.resSeq,
+                            segment_id=residue.segment_id,
+                        )
+                    spliced.add_atom(atom.name, atom.element, new_residue)
+
+    _copy_atoms(mdtop, lambda index: index < insert_at and mapped[index] >= 0)
+    _copy_atoms(inserted, lambda index: True)
+    _copy_atoms(mdtop, lambda index: index >= insert_at and mapped[index] >= 0)
+
+    for bond in mdtop.bonds:
+        atom1, atom2 = mapped[bond.atom1.index], mapped[bond.atom2.index]
+        if atom1 >= 0 and atom2 >= 0:
+            spliced.add_bond(spliced.atom(atom1), spliced.atom(atom2))
+
+    offset = sum(index >= 0 for index in mapped[:insert_at])
+
+    for bond in inserted.bonds:
+        spliced.add_bond(
+            spliced.atom(bond.atom1.index + offset),
+            spliced.atom(bond.atom2.index + offset),
+        )
+
+    return spliced
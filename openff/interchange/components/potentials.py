@@ -1,8 +1,23 @@
 """Models for storing applied force field parameters."""
 import ast
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+import numpy as np
 from openff.toolkit.typing.engines.smirnoff.parameters import ParameterHandler
+from openff.units import unit
 from openff.utilities.utilities import has_package, requires_package
 from pydantic import Field, PrivateAttr, validator
 
@@ -13,9 +28,14 @@ from openff.interchange.models import (
     TopologyKey,
     VirtualSiteKey,
 )
-from openff.interchange.types import ArrayQuantity, FloatQuantity
+from openff.interchange.types import (
+    ArrayQuantity,
+    FloatQuantity,
+    _from_trusted_quantity,
+)
 
 if has_package("jax"):
+    import jax
     from jax import numpy
 else:
     # Known mypy bug/limitation: https://github.com/python/mypy/issues/1153
@@ -27,8 +47,12 @@ if TYPE_CHECKING:
     from openff.interchange.components.mdtraj import _OFFBioTop
 
     if has_package("jax"):
+        from jax.experimental.sparse import BCOO
         from jaxlib.xla_extension import DeviceArray
 
+    if has_package("scipy"):
+        from scipy.sparse import csr_matrix
+
 
 class Potential(DefaultModel):
     """Base class for storing applied parameters."""
@@ -36,20 +60,45 @@ class Potential(DefaultModel):
     parameters: Dict[str, FloatQuantity] = dict()
     map_key: Optional[int] = None
 
-    @validator("parameters")
+    @validator("parameters", always=True)
     def validate_parameters(
         cls, v: Dict[str, Union[ArrayQuantity, FloatQuantity]]
     ) -> Dict[str, FloatQuantity]:
+        validated = _ParameterDict()
         for key, val in v.items():
             if isinstance(val, list):
-                v[key] = ArrayQuantity.validate_type(val)
+                dict.__setitem__(validated, key, ArrayQuantity.validate_type(val))
             else:
-                v[key] = FloatQuantity.validate_type(val)
-        return v  # type: ignore[return-value]
+                dict.__setitem__(validated, key, FloatQuantity.validate_type(val))
+        return validated  # type: ignore[return-value]
 
     def __hash__(self) -> int:
         return hash(tuple(self.parameters.values()))
 
+    def __setattr__(self, name, value) -> None:
+        super().__setattr__(name, value)
+        if name == "parameters":
+            self.parameters._touch()  # type: ignore[attr-defined]
+
+    @classmethod
+    def _from_trusted(
+        cls, parameters: Dict[str, unit.Quantity], map_key: Optional[int] = None
+    ) -> "Potential":
+        """
+        Create a Potential from trusted parameters without validating them.
+
+        This is used by importers, which already produce unit-tagged parameters, to avoid
+        validating each of many potentials. Parameters tagged with OpenMM units are still
+        converted. Use ``Interchange.check_consistency`` to validate the result.
+        """
+        return cls.construct(
+            parameters=_ParameterDict(
+                (name, _from_trusted_quantity(value))
+                for name, value in parameters.items()
+            ),
+            map_key=map_key,
+        )
+
 
 class WrappedPotential(DefaultModel):
     """Model storing other Potential model(s) inside inner data."""
@@ -91,6 +140,618 @@ class WrappedPotential(DefaultModel):
         return str(self._inner_data.data)
 
 
+_DICT_VERSIONS = itertools.count()
+
+
+class _TrackedDict(dict):
+    """
+    A dict that records a new version number every time it is modified.
+
+    ``PotentialHandler.slot_map`` and ``PotentialHandler.potentials`` are stored as
+    instances of this class so that data derived from them can be cached and cheaply
+    invalidated. Modifying a stored ``Potential`` in place is tracked separately, see
+    ``_ParameterDict``.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = next(_DICT_VERSIONS)
+
+    def _touch(self) -> None:
+        self.version = next(_DICT_VERSIONS)
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._touch()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._touch()
+
+    def __ior__(self, other):
+        super().update(other)
+        self._touch()
+        return self
+
+    def update(self, *args, **kwargs) -> None:  # type: ignore[override]
+        super().update(*args, **kwargs)
+        self._touch()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._touch()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._touch()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+_PARAMETERS_VERSION = -1
+
+
+class _ParameterDict(_TrackedDict):
+    """
+    A ``_TrackedDict`` storing the parameters of a ``Potential``.
+
+    A potential does not know which handlers store it, so every modification is also
+    recorded in ``_PARAMETERS_VERSION``, which is part of the key under which handlers
+    cache data derived from their potentials.
+    """
+
+    def _touch(self) -> None:
+        global _PARAMETERS_VERSION
+
+        super()._touch()
+        _PARAMETERS_VERSION = self.version
+
+
+class _LazyTrackedDict(_TrackedDict):
+    """
+    A ``_TrackedDict`` whose contents are only generated when they are first needed.
+
+    After being populated, instances turn into plain ``_TrackedDict`` objects so that
+    there is no overhead on later lookups.
+    """
+
+    def __init__(self, loader: Callable[[], Dict]) -> None:
+        super().__init__()
+        self._loader = loader
+
+    def _load(self) -> None:
+        dict.update(self, self._loader())
+        del self._loader
+        self.__class__ = _TrackedDict  # type: ignore[assignment]
+
+
+def _load_then(name: str) -> Callable:
+    def method(self, *args, **kwargs):
+        self._load()
+        return getattr(self, name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+for _name in (
+    "__getitem__",
+    "__contains__",
+    "__iter__",
+    "__reversed__",
+    "__len__",
+    "__eq__",
+    "__ne__",
+    "__repr__",
+    "__or__",
+    "__ior__",
+    "__setitem__",
+    "__delitem__",
+    "__reduce__",
+    "get",
+    "keys",
+    "values",
+    "items",
+    "copy",
+    "update",
+    "pop",
+    "popitem",
+    "clear",
+    "setdefault",
+):
+    setattr(_LazyTrackedDict, _name, _load_then(_name))
+
+
+class PotentialArrays:
+    """
+    A columnar (array-backed) representation of the slot map and potentials of a handler.
+
+    Terms (the keys of ``PotentialHandler.slot_map``) are stored as rows of index arrays
+    and potentials (the values of ``PotentialHandler.potentials``) as rows of a dense
+    parameter matrix with one unit per column. This avoids creating a Python object per
+    term and lets consumers, i.e. exporters, convert units once per column.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Attributes
+    ----------
+    atom_indices : np.ndarray of shape (n_terms, n_atoms_per_term)
+        The atom indices of each term, padded with -1 for terms with fewer atoms.
+    mult : np.ndarray of shape (n_terms,)
+        The ``mult`` of each term, or -1 if it is ``None``.
+    bond_order : np.ndarray of shape (n_terms,)
+        The fractional bond order of each term, or NaN if it is ``None``.
+    potential_index : np.ndarray of shape (n_terms,)
+        The index of each term's potential into ``potential_keys`` and ``parameters``.
+    virtual_site_type : np.ndarray of shape (n_terms,), optional
+        The ``type`` of each term keyed by a ``VirtualSiteKey`` and an empty string for
+        all other terms, or ``None`` if no terms are keyed by a ``VirtualSiteKey``.
+    virtual_site_match : np.ndarray of shape (n_terms,), optional
+        Like ``virtual_site_type``, but storing the ``match`` of virtual sites.
+    potential_keys : list of PotentialKey
+        The unique potential keys, in order of first appearance in the slot map followed
+        by any potentials not referenced by the slot map. A callable returning this list
+        may be passed instead, in which case the keys are only created when first needed.
+    parameter_names : tuple of str
+        The name of the parameter stored in each column of ``parameters``.
+    parameter_units : tuple of openff.units.unit.Unit
+        The units of the values stored in each column of ``parameters``.
+    parameters : np.ndarray of shape (n_potentials, n_parameters)
+        Parameter values, NaN where a potential does not define a parameter. The values
+        of interpolated (wrapped) potentials are the interpolated parameters.
+    map_key : np.ndarray of shape (n_potentials,)
+        The ``map_key`` of each potential, or -1 if it is ``None``.
+    ragged_parameter_names : tuple of str
+        The names of array-valued parameters, i.e. ``charge_increments``.
+    ragged_parameter_units : tuple of openff.units.unit.Unit
+        The units of the values of each array-valued parameter.
+    ragged_parameter_lengths : np.ndarray of shape (n_potentials, n_ragged_parameters)
+        The length of the value of each array-valued parameter of each potential, or -1
+        where a potential does not define the parameter.
+    ragged_parameters : np.ndarray of shape (n_ragged_values,)
+        The values of all array-valued parameters, concatenated in the order of the
+        rows (potentials) and then columns of ``ragged_parameter_lengths``.
+    component_potential_index : np.ndarray of shape (n_components,)
+        The index of the wrapped potential each component potential belongs to. Plain
+        potentials have no components.
+    component_coefficients : np.ndarray of shape (n_components,)
+        The coefficient of each component in its wrapped potential.
+    component_map_key : np.ndarray of shape (n_components,)
+        The ``map_key`` of each component, or -1 if it is ``None``.
+    component_parameters : np.ndarray of shape (n_components, n_parameters)
+        Like ``parameters``, but storing the parameters of each component.
+
+    """
+
+    def __init__(
+        self,
+        atom_indices: np.ndarray,
+        mult: np.ndarray,
+        bond_order: np.ndarray,
+        potential_index: np.ndarray,
+        potential_keys: Union[List[PotentialKey], Callable[[], List[PotentialKey]]],
+        parameter_names: Sequence[str],
+        parameter_units: Sequence[unit.Unit],
+        parameters: np.ndarray,
+        virtual_site_type: Optional[np.ndarray] = None,
+        virtual_site_match: Optional[np.ndarray] = None,
+        map_key: Optional[np.ndarray] = None,
+        ragged_parameter_names: Sequence[str] = tuple(),
+        ragged_parameter_units: Sequence[unit.Unit] = tuple(),
+        ragged_parameter_lengths: Optional[np.ndarray] = None,
+        ragged_parameters: Optional[np.ndarray] = None,
+        component_potential_index: Optional[np.ndarray] = None,
+        component_coefficients: Optional[np.ndarray] = None,
+        component_map_key: Optional[np.ndarray] = None,
+        component_parameters: Optional[np.ndarray] = None,
+    ) -> None:
+        self.atom_indices = atom_indices
+        self.mult = mult
+        self.bond_order = bond_order
+        self.potential_index = potential_index
+        self._potential_keys = potential_keys
+        self.parameter_names = tuple(parameter_names)
+        self.parameter_units = tuple(parameter_units)
+        self.parameters = parameters
+        self.virtual_site_type = virtual_site_type
+        self.virtual_site_match = virtual_site_match
+
+        n_potentials = parameters.shape[0]
+        self.map_key = (
+            np.full(n_potentials, -1, dtype=np.int64) if map_key is None else map_key
+        )
+        self.ragged_parameter_names = tuple(ragged_parameter_names)
+        self.ragged_parameter_units = tuple(ragged_parameter_units)
+        self.ragged_parameter_lengths = (
+            np.full(
+                (n_potentials, len(self.ragged_parameter_names)), -1, dtype=np.int64
+            )
+            if ragged_parameter_lengths is None
+            else ragged_parameter_lengths
+        )
+        self.ragged_parameters = (
+            np.empty(0) if ragged_parameters is None else ragged_parameters
+        )
+
+        if component_potential_index is None:
+            component_potential_index = np.empty(0, dtype=np.int64)
+            component_coefficients = np.empty(0)
+            component_map_key = np.empty(0, dtype=np.int64)
+            component_parameters = np.empty((0, len(self.parameter_names)))
+        self.component_potential_index = component_potential_index
+        self.component_coefficients = component_coefficients
+        self.component_map_key = component_map_key
+        self.component_parameters = component_parameters
+
+        self._potential_key_index: Optional[Dict[PotentialKey, int]] = None
+
+    @property
+    def n_terms(self) -> int:
+        """The number of terms, i.e. entries in the slot map."""
+        return self.potential_index.shape[0]
+
+    @property
+    def n_potentials(self) -> int:
+        """The number of unique potentials."""
+        return self.parameters.shape[0]
+
+    @property
+    def potential_keys(self) -> List[PotentialKey]:
+        """The unique potential keys, in the order of the rows of ``parameters``."""
+        if callable(self._potential_keys):
+            self._potential_keys = self._potential_keys()
+        return self._potential_keys
+
+    @property
+    def potential_key_index(self) -> Dict[PotentialKey, int]:
+        """A mapping between each PotentialKey and its row in ``parameters``."""
+        if self._potential_key_index is None:
+            self._potential_key_index = {
+                potential_key: index
+                for index, potential_key in enumerate(self.potential_keys)
+            }
+        return self._potential_key_index
+
+    def parameter(
+        self, name: str, units: Optional[Union[str, unit.Unit]] = None
+    ) -> np.ndarray:
+        """
+        Return the value of a parameter for each potential.
+
+        If ``units`` is given, the values are converted with a single unit conversion.
+        """
+        column = self.parameter_names.index(name)
+        values = self.parameters[:, column]
+        if units is None:
+            return values
+        return (values * self.parameter_units[column]).m_as(units)
+
+    def term_parameter(
+        self, name: str, units: Optional[Union[str, unit.Unit]] = None
+    ) -> np.ndarray:
+        """Return the value of a parameter for each term."""
+        return self.parameter(name, units)[self.potential_index]
+
+    def term_atom_indices(self, row: int) -> Tuple[int, ...]:
+        """Return the atom indices of a single term, stripped of padding."""
+        return tuple(int(i) for i in self.atom_indices[row] if i >= 0)
+
+    @classmethod
+    def from_handler(cls, handler: "PotentialHandler") -> "PotentialArrays":
+        """Build a columnar representation of the data in a PotentialHandler."""
+        slot_map = handler.slot_map
+        potentials = handler.potentials
+        n_terms = len(slot_map)
+
+        potential_key_index: Dict[PotentialKey, int] = dict()
+        for potential_key in itertools.chain(slot_map.values(), potentials):
+            if potential_key not in potential_key_index:
+                potential_key_index[potential_key] = len(potential_key_index)
+
+        width = max((len(key.atom_indices) for key in slot_map), default=0)
+        atom_indices = np.full((n_terms, width), -1, dtype=np.int64)
+        mult = np.full(n_terms, -1, dtype=np.int64)
+        bond_order = np.full(n_terms, np.nan)
+        potential_index = np.empty(n_terms, dtype=np.int64)
+        virtual_sites: Dict[int, VirtualSiteKey] = dict()
+
+        for row, (topology_key, potential_key) in enumerate(slot_map.items()):
+            atom_indices[
+                row, : len(topology_key.atom_indices)
+            ] = topology_key.atom_indices
+            potential_index[row] = potential_key_index[potential_key]
+            if isinstance(topology_key, VirtualSiteKey):
+                virtual_sites[row] = topology_key
+                continue
+            if topology_key.mult is not None:
+                mult[row] = topology_key.mult
+            if topology_key.bond_order is not None:
+                bond_order[row] = topology_key.bond_order
+
+        if virtual_sites:
+            virtual_site_type = np.full(n_terms, "", dtype=object)
+            virtual_site_match = np.full(n_terms, "", dtype=object)
+            for row, virtual_site_key in virtual_sites.items():
+                virtual_site_type[row] = virtual_site_key.type
+                virtual_site_match[row] = virtual_site_key.match
+            virtual_site_type = virtual_site_type.astype(str)
+            virtual_site_match = virtual_site_match.astype(str)
+        else:
+            virtual_site_type, virtual_site_match = None, None
+
+        parameter_units: Dict[str, unit.Unit] = dict()
+        ragged_parameter_units: Dict[str, unit.Unit] = dict()
+        rows: List[Dict[str, float]] = list()
+        ragged_rows: List[Dict[str, np.ndarray]] = list()
+        map_key = np.full(len(potential_key_index), -1, dtype=np.int64)
+        component_rows: List[Dict[str, float]] = list()
+        component_potential_index: List[int] = list()
+        component_coefficients: List[float] = list()
+        component_map_key: List[int] = list()
+
+        for row, potential_key in enumerate(potential_key_index):
+            try:
+                potential = potentials[potential_key]
+            except KeyError:
+                raise MissingParametersError(
+                    f"Handler {handler.type} has no potential associated with "
+                    f"{potential_key}"
+                )
+            values, ragged_values = _get_parameter_values(
+                potential, potential_key, parameter_units, ragged_parameter_units
+            )
+            rows.append(values)
+            ragged_rows.append(ragged_values)
+
+            if not isinstance(potential, WrappedPotential):
+                if potential.map_key is not None:
+                    map_key[row] = potential.map_key
+                continue
+
+            for component, coefficient in potential._inner_data.data.items():
+                values, ragged_values = _get_parameter_values(
+                    component, potential_key, parameter_units, ragged_parameter_units
+                )
+                if ragged_values:
+                    raise NotImplementedError(
+                        f"Potential {potential_key} wraps potentials with array-valued "
+                        "parameters, which cannot be stored in a columnar representation."
+                    )
+                component_rows.append(values)
+                component_potential_index.append(row)
+                component_coefficients.append(coefficient)
+                component_map_key.append(
+                    -1 if component.map_key is None else component.map_key
+                )
+
+        columns = {name: index for index, name in enumerate(parameter_units)}
+
+        ragged_parameter_lengths = np.full(
+            (len(ragged_rows), len(ragged_parameter_units)), -1, dtype=np.int64
+        )
+        ragged_parameters: List[np.ndarray] = [np.empty(0)]
+        for row, ragged_values in enumerate(ragged_rows):
+            for column, name in enumerate(ragged_parameter_units):
+                if name in ragged_values:
+                    ragged_parameter_lengths[row, column] = ragged_values[name].size
+                    ragged_parameters.append(ragged_values[name])
+
+        arrays = cls(
+            atom_indices=atom_indices,
+            mult=mult,
+            bond_order=bond_order,
+            potential_index=potential_index,
+            potential_keys=[*potential_key_index],
+            parameter_names=[*parameter_units.keys()],
+            parameter_units=[*parameter_units.values()],
+            parameters=_to_parameter_matrix(rows, columns),
+            virtual_site_type=virtual_site_type,
+            virtual_site_match=virtual_site_match,
+            map_key=map_key,
+            ragged_parameter_names=[*ragged_parameter_units.keys()],
+            ragged_parameter_units=[*ragged_parameter_units.values()],
+            ragged_parameter_lengths=ragged_parameter_lengths,
+            ragged_parameters=np.concatenate(ragged_parameters),
+            component_potential_index=np.array(
+                component_potential_index, dtype=np.int64
+            ),
+            component_coefficients=np.array(component_coefficients, dtype=np.float64),
+            component_map_key=np.array(component_map_key, dtype=np.int64),
+            component_parameters=_to_parameter_matrix(component_rows, columns),
+        )
+        arrays._potential_key_index = potential_key_index
+
+        return arrays
+
+    def to_slot_map(self) -> Dict[Union[TopologyKey, VirtualSiteKey], PotentialKey]:
+        """Build the dict representation of the slot map stored in these arrays."""
+        slot_map: Dict[Union[TopologyKey, VirtualSiteKey], PotentialKey] = dict()
+
+        mult = self.mult.tolist()
+        bond_order = self.bond_order.tolist()
+        potential_index = self.potential_index.tolist()
+
+        for row, atom_indices in enumerate(self.atom_indices.tolist()):
+            indices = tuple(index for index in atom_indices if index >= 0)
+            potential_key = self.potential_keys[potential_index[row]]
+            if self.virtual_site_type is not None and self.virtual_site_type[row]:
+                slot_map[
+                    VirtualSiteKey(
+                        atom_indices=indices,
+                        type=str(self.virtual_site_type[row]),
+                        match=str(self.virtual_site_match[row]),  # type: ignore[index]
+                    )
+                ] = potential_key
+            else:
+                slot_map[
+                    TopologyKey(
+                        atom_indices=indices,
+                        mult=None if mult[row] < 0 else mult[row],
+                        bond_order=None
+                        if np.isnan(bond_order[row])
+                        else bond_order[row],
+                    )
+                ] = potential_key
+
+        return slot_map
+
+    def to_potentials(
+        self,
+    ) -> Dict[PotentialKey, Union["Potential", "WrappedPotential"]]:
+        """Build the dict representation of the potentials stored in these arrays."""
+        columns = [*zip(self.parameter_names, self.parameter_units)]
+        ragged_columns = [
+            *zip(self.ragged_parameter_names, self.ragged_parameter_units)
+        ]
+
+        ragged_ends = np.cumsum(np.maximum(self.ragged_parameter_lengths, 0)).reshape(
+            self.ragged_parameter_lengths.shape
+        )
+
+        def to_parameters(row: List[float]) -> Dict[str, unit.Quantity]:
+            return {
+                name: value * units
+                for (name, units), value in zip(columns, row)
+                if not np.isnan(value)
+            }
+
+        components: Dict[int, Dict[Potential, float]] = dict()
+        for index, coefficient, map_key, row in zip(
+            self.component_potential_index.tolist(),
+            self.component_coefficients.tolist(),
+            self.component_map_key.tolist(),
+            self.component_parameters.tolist(),
+        ):
+            components.setdefault(index, dict())[
+                Potential._from_trusted(
+                    to_parameters(row), map_key=None if map_key < 0 else map_key
+                )
+            ] = coefficient
+
+        potentials: Dict[PotentialKey, Union[Potential, WrappedPotential]] = dict()
+
+        for index, (potential_key, row, map_key, lengths, ends) in enumerate(
+            zip(
+                self.potential_keys,
+                self.parameters.tolist(),
+                self.map_key.tolist(),
+                self.ragged_parameter_lengths.tolist(),
+                ragged_ends.tolist(),
+            )
+        ):
+            if index in components:
+                potentials[potential_key] = WrappedPotential(components[index])
+                continue
+
+            parameters = to_parameters(row)
+            for (name, units), length, end in zip(ragged_columns, lengths, ends):
+                if length >= 0:
+                    parameters[name] = (
+                        np.asarray(self.ragged_parameters[end - length : end]) * units
+                    )
+            potentials[potential_key] = Potential._from_trusted(
+                parameters, map_key=None if map_key < 0 else map_key
+            )
+
+        return potentials
+
+
+def _get_parameter_values(
+    potential: Union[Potential, WrappedPotential],
+    potential_key: PotentialKey,
+    parameter_units: Dict[str, unit.Unit],
+    ragged_parameter_units: Dict[str, unit.Unit],
+) -> Tuple[Dict[str, float], Dict[str, np.ndarray]]:
+    """
+    Split the parameters of a potential into scalar and array-valued magnitudes.
+
+    The units of each parameter are those it was first found with, which are recorded
+    in ``parameter_units`` or ``ragged_parameter_units``.
+    """
+    values: Dict[str, float] = dict()
+    ragged_values: Dict[str, np.ndarray] = dict()
+
+    for name, quantity in potential.parameters.items():
+        if not isinstance(quantity, unit.Quantity):
+            quantity = unit.Quantity(quantity, unit.dimensionless)
+
+        if np.ndim(quantity.m) == 0:
+            units, other_units = parameter_units, ragged_parameter_units
+        else:
+            units, other_units = ragged_parameter_units, parameter_units
+
+        if name in other_units:
+            raise NotImplementedError(
+                f"Parameter {name} of potential {potential_key} is a scalar for some "
+                "potentials and an array for others and cannot be stored in a columnar "
+                "representation."
+            )
+        if name not in units:
+            units[name] = quantity.units
+
+        magnitude = quantity.m_as(units[name])
+
+        if np.ndim(magnitude) == 0:
+            values[name] = magnitude
+        elif np.ndim(magnitude) == 1:
+            ragged_values[name] = np.asarray(magnitude, dtype=np.float64)
+        else:
+            raise NotImplementedError(
+                f"Parameter {name} of potential {potential_key} is a multi-dimensional "
+                "array and cannot be stored in a columnar representation."
+            )
+
+    return values, ragged_values
+
+
+def _to_parameter_matrix(
+    rows: List[Dict[str, float]], columns: Dict[str, int]
+) -> np.ndarray:
+    parameters = np.full((len(rows), len(columns)), np.nan)
+    for row, values in enumerate(rows):
+        for name, value in values.items():
+            parameters[row, columns[name]] = value
+    return parameters
+
+
+TH = TypeVar("TH", bound="PotentialHandler")
+
+
+def _assign_parameters(
+    p: "ArrayLike",
+    term_index: np.ndarray,
+    potential_index: np.ndarray,
+    coefficients: np.ndarray,
+    n_terms: int,
+) -> numpy.ndarray:
+    """Sum the rows of force field parameters, weighted by coefficients, assigned to each term."""
+    weighted = coefficients[:, None] * p[potential_index]  # type: ignore[index]
+
+    if has_package("jax"):
+        return jax.ops.segment_sum(weighted, term_index, num_segments=n_terms)
+
+    q = np.zeros((n_terms, *weighted.shape[1:]), dtype=weighted.dtype)
+    np.add.at(q, term_index, weighted)
+
+    return q
+
+
+if has_package("jax"):
+    _assign_parameters = jax.jit(_assign_parameters, static_argnums=4)
+
+
 class PotentialHandler(DefaultModel):
     """Base class for storing parametrized force field data."""
 
@@ -108,6 +769,59 @@ class PotentialHandler(DefaultModel):
         description="A mapping between PotentialKey objects and Potential objects.",
     )
 
+    _arrays: Optional[PotentialArrays] = PrivateAttr(None)
+    _arrays_version: Optional[Tuple[int, int, int]] = PrivateAttr(None)
+    _assignment: Optional[Tuple] = PrivateAttr(None)
+    _assignment_version: Optional[Tuple[int, int, int]] = PrivateAttr(None)
+
+    @validator("slot_map", "potentials", always=True)
+    def wrap_in_tracked_dict(cls, v: Dict) -> _TrackedDict:
+        if isinstance(v, _TrackedDict):
+            return v
+        return _TrackedDict(v)
+
+    def _data_version(self) -> Optional[Tuple[int, int, int]]:
+        """Return a key identifying the current contents of the slot map and potentials."""
+        try:
+            return (
+                self.slot_map.version,  # type: ignore[attr-defined]
+                self.potentials.version,  # type: ignore[attr-defined]
+                _PARAMETERS_VERSION,
+            )
+        except AttributeError:
+            # i.e. this handler was built with `.construct()`, which skips validators
+            return None
+
+    def to_arrays(self) -> PotentialArrays:
+        """
+        Return a columnar representation of the slot map and potentials of this handler.
+
+        The result is cached until the slot map, potentials or parameters of any potential
+        are modified.
+        """
+        version = self._data_version()
+        if version is None or version != self._arrays_version:
+            self._arrays = PotentialArrays.from_handler(self)
+            self._arrays_version = version
+        return self._arrays  # type: ignore[return-value]
+
+    @classmethod
+    def from_arrays(cls: Type[TH], arrays: PotentialArrays, **kwargs) -> TH:
+        """
+        Create a handler backed by a columnar representation of its data.
+
+        The slot map and potentials are only materialized as dicts when first accessed.
+        """
+        handler = cls(**kwargs)
+        # Bypass validation, which would materialize the lazy dicts
+        object.__setattr__(handler, "slot_map", _LazyTrackedDict(arrays.to_slot_map))
+        object.__setattr__(
+            handler, "potentials", _LazyTrackedDict(arrays.to_potentials)
+        )
+        handler._arrays = arrays
+        handler._arrays_version = handler._data_version()
+        return handler
+
     @property
     def independent_variables(self) -> Set[str]:
         """
@@ -145,42 +859,113 @@ class PotentialHandler(DefaultModel):
             f"associated with atoms {atom_indices}"
         )
 
+    def _get_parameter_assignment(
+        self,
+    ) -> Tuple[List[List[Potential]], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return how the force field parameters of this handler are assigned to its terms.
+
+        Force field potentials are the potentials of this handler, except that each
+        WrappedPotential is replaced by the potentials it interpolates. These are shared
+        between all wrapped potentials with the same key, up to the bond order, and map key.
+
+        Returns a list of the copies of each force field potential stored in this handler,
+        in order of first appearance in the slot map, and three arrays with an entry per
+        pair of a term and a force field potential contributing to it: the row of the term
+        in the slot map, the index of the force field potential and its coefficient. The
+        result is cached until the slot map, potentials or parameters of any potential are
+        modified.
+        """
+        version = self._data_version()
+        if version is not None and version == self._assignment_version:
+            return self._assignment  # type: ignore[return-value]
+
+        arrays = self.to_arrays()
+
+        force_field_index: Dict[Tuple, int] = dict()
+        force_field_potentials: List[List[Potential]] = list()
+        n_components: List[int] = list()
+        component_index: List[int] = list()
+        component_coefficients: List[float] = list()
+
+        for potential_key in arrays.potential_keys:
+            potential = self.potentials[potential_key]
+            if isinstance(potential, WrappedPotential):
+                unwrapped_key = potential_key.copy(update={"bond_order": None})
+                components = [
+                    ((unwrapped_key, inner.map_key), inner, coefficient)
+                    for inner, coefficient in potential._inner_data.data.items()
+                ]
+            else:
+                components = [((potential_key, None), potential, 1.0)]
+
+            n_components.append(len(components))
+            for force_field_key, inner, coefficient in components:
+                if force_field_key not in force_field_index:
+                    force_field_index[force_field_key] = len(force_field_potentials)
+                    force_field_potentials.append(list())
+                index = force_field_index[force_field_key]
+                force_field_potentials[index].append(inner)
+                component_index.append(index)
+                component_coefficients.append(coefficient)
+
+        # Expand the components of each potential into the terms it is assigned to
+        counts = np.array(n_components, dtype=np.int64)[arrays.potential_index]
+        offsets = np.concatenate([[0], np.cumsum(n_components)[:-1]]).astype(np.int64)
+        term_starts = np.cumsum(counts) - counts
+        components_per_term = np.arange(counts.sum()) + np.repeat(
+            offsets[arrays.potential_index] - term_starts, counts
+        )
+
+        self._assignment = (
+            force_field_potentials,
+            np.repeat(np.arange(arrays.n_terms), counts),
+            np.array(component_index, dtype=np.int64)[components_per_term],
+            np.array(component_coefficients, dtype=float)[components_per_term],
+        )
+        self._assignment_version = version
+
+        return self._assignment
+
     def get_force_field_parameters(self) -> "ArrayLike":
-        """Return a flattened representation of the force field parameters."""
-        # TODO: Handle WrappedPotential
-        if any(
-            isinstance(potential, WrappedPotential)
-            for potential in self.potentials.values()
-        ):
-            raise NotImplementedError
+        """
+        Return a flattened representation of the force field parameters.
+
+        Each row stores the parameters of a potential, or of a potential interpolated by
+        WrappedPotential objects, in order of first appearance in the slot map.
+        """
+        force_field_potentials, *_ = self._get_parameter_assignment()
 
         return numpy.array(
             [
                 [
-                    v.m for v in p.parameters.values()  # type:ignore[attr-defined]
+                    v.m
+                    for v in potentials[
+                        0
+                    ].parameters.values()  # type:ignore[attr-defined]
                 ]
-                for p in self.potentials.values()
+                for potentials in force_field_potentials
             ]
         )
 
     def set_force_field_parameters(self, new_p: "ArrayLike") -> None:
         """Set the force field parameters from a flattened representation."""
-        mapping = self.get_mapping()
-        if new_p.shape[0] != len(mapping):  # type: ignore
+        force_field_potentials, *_ = self._get_parameter_assignment()
+        if new_p.shape[0] != len(force_field_potentials):  # type: ignore
             raise RuntimeError
 
-        for potential_key, potential_index in self.get_mapping().items():
-            potential = self.potentials[potential_key]
-            if len(new_p[potential_index, :]) != len(potential.parameters):  # type: ignore
-                raise RuntimeError
+        for potential_index, potentials in enumerate(force_field_potentials):
+            for potential in potentials:
+                if len(new_p[potential_index, :]) != len(potential.parameters):  # type: ignore
+                    raise RuntimeError
 
-            for parameter_index, parameter_key in enumerate(potential.parameters):
-                parameter_units = potential.parameters[parameter_key].units  # type: ignore
-                modified_parameter = new_p[potential_index, parameter_index]  # type: ignore
+                for parameter_index, parameter_key in enumerate(potential.parameters):
+                    parameter_units = potential.parameters[parameter_key].units  # type: ignore
+                    modified_parameter = new_p[potential_index, parameter_index]  # type: ignore
 
-                self.potentials[potential_key].parameters[parameter_key] = (
-                    modified_parameter * parameter_units
-                )
+                    potential.parameters[parameter_key] = (
+                        modified_parameter * parameter_units
+                    )
 
     def get_system_parameters(self, p=None) -> numpy.ndarray:
         """
@@ -188,23 +973,10 @@ class PotentialHandler(DefaultModel):
 
         These values are effectively force field parameters as applied to a chemical topology.
         """
-        # TODO: Handle WrappedPotential
-        if any(
-            isinstance(potential, WrappedPotential)
-            for potential in self.potentials.values()
-        ):
-            raise NotImplementedError
-
         if p is None:
             p = self.get_force_field_parameters()
-        mapping = self.get_mapping()
 
-        q: List = list()
-        for potential_key in self.slot_map.values():
-            index = mapping[potential_key]
-            q.append(p[index])
-
-        return numpy.array(q)
+        return self.parametrize_partial()(p)
 
     def get_mapping(self) -> Dict[PotentialKey, int]:
         """Get a mapping between potentials and array indices."""
@@ -224,29 +996,86 @@ class PotentialHandler(DefaultModel):
 
         return self.get_system_parameters(p=p)
 
-    def parametrize_partial(self):
-        """Return a function that will call `self.parametrize()` with arguments specified by `self.mapping`."""
-        from functools import partial
+    def parametrize_partial(self) -> Callable:
+        """
+        Return a function mapping force field parameters to system parameters.
+
+        The function gathers rows of force field parameters, summing those of potentials
+        interpolated by a WrappedPotential, and does not depend on the state of this
+        handler. If JAX is installed, it is compiled with ``jax.jit``.
+        """
+        _, term_index, potential_index, coefficients = self._get_parameter_assignment()
+        n_terms = len(self.slot_map)
+
+        def parametrize(p):
+            return _assign_parameters(
+                p, term_index, potential_index, coefficients, n_terms
+            )
+
+        return parametrize
+
+    def _get_param_matrix_entries(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[int, int]]:
+        """Return the rows, columns, values and shape of the nonzero entries of the parameter matrix."""
+        (
+            force_field_potentials,
+            term_index,
+            potential_index,
+            coefficients,
+        ) = self._get_parameter_assignment()
 
-        return partial(
-            self.parametrize,
-            mapping=self.get_mapping(),
+        if force_field_potentials:
+            n_parameters = len(force_field_potentials[0][0].parameters)
+        else:
+            n_parameters = 0
+
+        parameter_offsets = np.arange(n_parameters)
+        rows = (term_index[:, None] * n_parameters + parameter_offsets).ravel()
+        columns = (potential_index[:, None] * n_parameters + parameter_offsets).ravel()
+        values = np.repeat(coefficients, n_parameters)
+        shape = (
+            len(self.slot_map) * n_parameters,
+            len(force_field_potentials) * n_parameters,
         )
 
+        return rows, columns, values, shape
+
     @requires_package("jax")
-    def get_param_matrix(self) -> "DeviceArray":
-        """Get a matrix representing the mapping between force field and system parameters."""
-        from functools import partial
+    def get_param_matrix(self, sparse: bool = False) -> Union["DeviceArray", "BCOO"]:
+        """
+        Get a matrix representing the mapping between force field and system parameters.
 
-        import jax
+        Rows correspond to the flattened system parameters and columns to the flattened
+        force field parameters. Entries are 1 where a term is assigned a potential, or the
+        coefficient of a potential interpolated by a WrappedPotential. If ``sparse`` is
+        True, a ``jax.experimental.sparse.BCOO`` matrix is returned instead of a dense one.
+        """
+        rows, columns, values, shape = self._get_param_matrix_entries()
 
-        p = self.get_force_field_parameters()
+        if sparse:
+            from jax.experimental.sparse import BCOO
 
-        parametrize_partial = partial(
-            self.parametrize,
-        )
+            return BCOO(
+                (numpy.asarray(values), numpy.asarray(np.stack([rows, columns], -1))),
+                shape=shape,
+            )
+
+        matrix = np.zeros(shape)
+        matrix[rows, columns] = values
+
+        return numpy.asarray(matrix)
+
+    @requires_package("scipy")
+    def get_sparse_param_matrix(self) -> "csr_matrix":
+        """
+        Get a sparse matrix representing the mapping between force field and system parameters.
+
+        This is equivalent to ``get_param_matrix``, stored as a ``scipy.sparse.csr_matrix``
+        with one entry per system parameter or interpolated force field parameter.
+        """
+        from scipy.sparse import csr_matrix
 
-        jac_parametrize = jax.jacfwd(parametrize_partial)
-        jac_res = jac_parametrize(p)
+        rows, columns, values, shape = self._get_param_matrix_entries()
 
-        return jac_res.reshape(-1, p.flatten().shape[0])  # type: ignore[union-attr]
+        return csr_matrix((values, (rows, columns)), shape=shape)
@@ -9,6 +9,7 @@ from typing import (
     DefaultDict,
     Dict,
     List,
+    Optional,
     Tuple,
     Type,
     TypeVar,
@@ -36,11 +37,20 @@ from openff.toolkit.typing.engines.smirnoff.parameters import (
 from openff.units import unit
 from openff.units.openmm import from_openmm
 from openmm import unit as omm_unit
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from typing_extensions import Literal
 
+from openff.interchange.components.bond_order_cache import (
+    FractionalBondOrderCache,
+    assign_fractional_bond_orders,
+)
+from openff.interchange.components.charge_cache import (
+    PartialChargeCache,
+    get_partial_charge_cache_key,
+)
 from openff.interchange.components.potentials import (
     Potential,
+    PotentialArrays,
     PotentialHandler,
     WrappedPotential,
 )
@@ -94,6 +104,16 @@ class SMIRNOFFPotentialHandler(PotentialHandler, abc.ABC):
     #        """Return an interable of all of one type of valence term in this topology."""
     #        raise NotImplementedError()
 
+    @classmethod
+    def handler_dependencies(cls) -> List[Type["SMIRNOFFPotentialHandler"]]:
+        """
+        Return the types of potential handlers that this handler is created from.
+
+        When creating an ``Interchange``, handlers of these types are created first and
+        passed to ``_from_toolkit`` as ``dependencies``, keyed by their ``type``.
+        """
+        return list()
+
     @classmethod
     def check_supported_parameters(cls, parameter_handler: ParameterHandler):
         """Verify that a parameter handler is in an allowed list of handlers."""
@@ -115,7 +135,7 @@ class SMIRNOFFPotentialHandler(PotentialHandler, abc.ABC):
             # TODO: Should the slot_map always be reset, or should we be able to partially
             # update it? Also Note the duplicated code in the child classes
             self.slot_map = dict()
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches(parameter_handler, topology)
         for key, val in matches.items():
             topology_key = TopologyKey(atom_indices=key)
             potential_key = PotentialKey(
@@ -196,7 +216,7 @@ class SMIRNOFFBondHandler(SMIRNOFFPotentialHandler):
             # TODO: Should the slot_map always be reset, or should we be able to partially
             # update it? Also Note the duplicated code in the child classes
             self.slot_map = dict()
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches(parameter_handler, topology)
         for key, val in matches.items():
             param = val.parameter_type
             if param.k_bondorder or param.length_bondorder:
@@ -233,9 +253,10 @@ class SMIRNOFFBondHandler(SMIRNOFFPotentialHandler):
         """
         if self.potentials:
             self.potentials = dict()
-        for topology_key, potential_key in self.slot_map.items():
+        parameter_types = _get_parameters_by_smirks(parameter_handler)
+        for potential_key, topology_key in _get_unique_slots(self.slot_map).items():
             smirks = potential_key.id
-            parameter = parameter_handler.get_parameter({"smirks": smirks})[0]
+            parameter = parameter_types[smirks]
             if topology_key.bond_order:  # type: ignore[union-attr]
                 bond_order = topology_key.bond_order  # type: ignore[union-attr]
                 if parameter.k_bondorder:
@@ -250,7 +271,7 @@ class SMIRNOFFBondHandler(SMIRNOFFPotentialHandler):
                 map_keys = [*data.keys()]
                 for map_key in map_keys:
                     pots.append(
-                        Potential(
+                        Potential._from_trusted(
                             parameters={
                                 "k": parameter.k_bondorder[map_key],
                                 "length": parameter.length_bondorder[map_key],
@@ -262,7 +283,7 @@ class SMIRNOFFBondHandler(SMIRNOFFPotentialHandler):
                     {pot: coeff for pot, coeff in zip(pots, coeffs)}
                 )
             else:
-                potential = Potential(  # type: ignore[assignment]
+                potential = Potential._from_trusted(  # type: ignore[assignment]
                     parameters={
                         "k": parameter.k,
                         "length": parameter.length,
@@ -275,10 +296,15 @@ class SMIRNOFFBondHandler(SMIRNOFFPotentialHandler):
         cls: Type[T],
         parameter_handler: "BondHandler",
         topology: "Topology",
+        bond_order_cache: Optional[FractionalBondOrderCache] = None,
+        n_workers: int = 1,
     ) -> T:
         """
         Create a SMIRNOFFBondHandler from toolkit data.
 
+        If any parameters are interpolated by fractional bond order, bond orders are
+        assigned to the reference molecules of the topology, reusing any in
+        ``bond_order_cache`` and computing the rest on ``n_workers`` processes.
         """
         # TODO: This method overrides SMIRNOFFPotentialHandler.from_toolkit in order to gobble up
         # a ConstraintHandler. This seems like a good solution for the interdependence, but is also
@@ -300,13 +326,12 @@ class SMIRNOFFBondHandler(SMIRNOFFPotentialHandler):
                 for p in parameter_handler.parameters
             )
         ):
-            for ref_mol in topology.reference_molecules:
-                # TODO: expose conformer generation and fractional bond order assigment
-                # knobs to user via API
-                ref_mol.generate_conformers(n_conformers=1)
-                ref_mol.assign_fractional_bond_orders(
-                    bond_order_model=handler.fractional_bond_order_method.lower(),  # type: ignore[attr-defined]
-                )
+            assign_fractional_bond_orders(
+                topology.reference_molecules,
+                bond_order_model=handler.fractional_bond_order_method,  # type: ignore[attr-defined]
+                bond_order_cache=bond_order_cache,
+                n_workers=n_workers,
+            )
 
         handler.store_matches(parameter_handler=parameter_handler, topology=topology)
         handler.store_potentials(parameter_handler=parameter_handler)
@@ -328,6 +353,22 @@ class SMIRNOFFConstraintHandler(SMIRNOFFPotentialHandler):
         """Return a list of allowed types of ParameterHandler classes."""
         return [BondHandler, ConstraintHandler]
 
+    @classmethod
+    def handler_dependencies(cls) -> List[Type[SMIRNOFFPotentialHandler]]:
+        """Return the types of potential handlers that this handler is created from."""
+        return [SMIRNOFFBondHandler]
+
+    def to_arrays(self) -> PotentialArrays:
+        """Return a columnar representation of the slot map and constraint distances."""
+        return PotentialArrays.from_handler(
+            PotentialHandler.construct(
+                type=self.type,
+                expression=self.expression,
+                slot_map=self.slot_map,
+                potentials=self.constraints,
+            )
+        )
+
     @classmethod
     def supported_parameters(cls):
         """Return a list of supported parameter attribute names."""
@@ -338,10 +379,13 @@ class SMIRNOFFConstraintHandler(SMIRNOFFPotentialHandler):
         cls: Type[T],
         parameter_handler: List,
         topology: "Topology",
+        dependencies: Optional[Dict[str, SMIRNOFFPotentialHandler]] = None,
     ) -> T:
         """
         Create a SMIRNOFFPotentialHandler from toolkit data.
 
+        If a ``SMIRNOFFBondHandler`` created from the same topology is included in
+        ``dependencies``, bond lengths are looked up in it rather than re-created.
         """
         if isinstance(parameter_handler, list):
             parameter_handlers = parameter_handler
@@ -354,7 +398,9 @@ class SMIRNOFFConstraintHandler(SMIRNOFFPotentialHandler):
 
         handler = cls()
         handler.store_constraints(  # type: ignore[attr-defined]
-            parameter_handlers=parameter_handlers, topology=topology
+            parameter_handlers=parameter_handlers,
+            topology=topology,
+            bonds=(dependencies or dict()).get("Bonds"),
         )
 
         return handler
@@ -363,25 +409,29 @@ class SMIRNOFFConstraintHandler(SMIRNOFFPotentialHandler):
         self,
         parameter_handlers: Any,
         topology: "_OFFBioTop",
+        bonds: Optional[SMIRNOFFBondHandler] = None,
     ) -> None:
-        """Store constraints."""
+        """
+        Store constraints.
+
+        Constraints without a distance take the equilibrium length of the corresponding
+        bond in ``bonds``, which is created from the ``BondHandler`` in
+        ``parameter_handlers`` if not provided.
+        """
         if self.slot_map:
             self.slot_map = dict()
 
         constraint_handler = [
             p for p in parameter_handlers if type(p) == ConstraintHandler
         ][0]
-        constraint_matches = constraint_handler.find_matches(topology)
+        constraint_matches = _find_matches(constraint_handler, topology)
 
-        if any([type(p) == BondHandler for p in parameter_handlers]):
+        if bonds is None and any([type(p) == BondHandler for p in parameter_handlers]):
             bond_handler = [p for p in parameter_handlers if type(p) == BondHandler][0]
             bonds = SMIRNOFFBondHandler._from_toolkit(
                 parameter_handler=bond_handler,
                 topology=topology,
             )
-        else:
-            bond_handler = None
-            bonds = None
 
         for key, match in constraint_matches.items():
             topology_key = TopologyKey(atom_indices=key)
@@ -395,23 +445,37 @@ class SMIRNOFFConstraintHandler(SMIRNOFFPotentialHandler):
                 distance = match.parameter_type.distance
             else:
                 # This constraint parameter depends on the BondHandler ...
-                if bond_handler is None:
+                if bonds is None:
                     raise MissingParametersError(
                         f"Constraint with SMIRKS pattern {smirks} found with no distance "
                         "specified, and no corresponding bond parameters were found. The distance "
                         "of this constraint is not specified."
                     )
                 # ... so use the same PotentialKey instance as the BondHandler to look up the distance
-                potential_key = bonds.slot_map[topology_key]  # type: ignore[union-attr]
+                potential_key = bonds.slot_map[topology_key]
                 self.slot_map[topology_key] = potential_key
-                distance = bonds.potentials[potential_key].parameters["length"]  # type: ignore[union-attr]
-            potential = Potential(
+                distance = bonds.potentials[potential_key].parameters["length"]
+            potential = Potential._from_trusted(
                 parameters={
                     "distance": distance,
                 }
             )
             self.constraints[potential_key] = potential  # type: ignore[assignment]
 
+    def update_bond_lengths(self, bonds: SMIRNOFFBondHandler) -> None:
+        """
+        Update the distances of constraints that take the length of a bond from ``bonds``.
+
+        The bond parameters of ``bonds`` must be matched to the same bonds as those these
+        constraints were created with, only the values of parameters may differ.
+        """
+        for potential_key in self.slot_map.values():
+            self.constraints[potential_key] = Potential._from_trusted(  # type: ignore
+                parameters={
+                    "distance": bonds.potentials[potential_key].parameters["length"],
+                }
+            )
+
 
 class SMIRNOFFAngleHandler(SMIRNOFFPotentialHandler):
     """Handler storing angle potentials as produced by a SMIRNOFF force field."""
@@ -439,12 +503,11 @@ class SMIRNOFFAngleHandler(SMIRNOFFPotentialHandler):
         Populate self.potentials with key-val pairs of [TopologyKey, PotentialKey].
 
         """
-        for potential_key in self.slot_map.values():
+        parameter_types = _get_parameters_by_smirks(parameter_handler)
+        for potential_key in _get_unique_slots(self.slot_map):
             smirks = potential_key.id
-            # ParameterHandler.get_parameter returns a list, although this
-            # should only ever be length 1
-            parameter = parameter_handler.get_parameter({"smirks": smirks})[0]
-            potential = Potential(
+            parameter = parameter_types[smirks]
+            potential = Potential._from_trusted(
                 parameters={
                     "k": parameter.k,
                     "angle": parameter.angle,
@@ -489,6 +552,47 @@ class SMIRNOFFProperTorsionHandler(SMIRNOFFPotentialHandler):
         """Return a list of supported parameter attribute names."""
         return ["smirks", "id", "k", "periodicity", "phase", "idivf", "k_bondorder"]
 
+    @classmethod
+    def _from_toolkit(
+        cls: Type[T],
+        parameter_handler: "ProperTorsionHandler",
+        topology: "Topology",
+        bond_order_cache: Optional[FractionalBondOrderCache] = None,
+        n_workers: int = 1,
+    ) -> T:
+        """
+        Create a SMIRNOFFProperTorsionHandler from toolkit data.
+
+        Fractional bond orders are usually assigned by the bonds handler, which is created
+        first. If any parameters are interpolated by fractional bond order, they are
+        assigned here to any reference molecules without them, as in the bonds handler.
+        """
+        if any(
+            getattr(p, "k_bondorder", None) is not None
+            for p in parameter_handler.parameters
+        ):
+            unassigned = [
+                ref_mol
+                for ref_mol in topology.reference_molecules
+                if any(bond.fractional_bond_order is None for bond in ref_mol.bonds)
+            ]
+
+            bond_order_model = getattr(
+                parameter_handler, "fractional_bondorder_method", None
+            )
+
+            if unassigned:
+                assign_fractional_bond_orders(
+                    unassigned,
+                    bond_order_model=bond_order_model or "AM1-Wiberg",
+                    bond_order_cache=bond_order_cache,
+                    n_workers=n_workers,
+                )
+
+        return super()._from_toolkit(  # type: ignore[misc]
+            parameter_handler=parameter_handler, topology=topology
+        )
+
     def store_matches(
         self,
         parameter_handler: "ProperTorsionHandler",
@@ -500,7 +604,7 @@ class SMIRNOFFProperTorsionHandler(SMIRNOFFPotentialHandler):
         """
         if self.slot_map:
             self.slot_map = dict()
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches(parameter_handler, topology)
         for key, val in matches.items():
             param = val.parameter_type
             n_terms = len(val.parameter_type.phase)
@@ -538,10 +642,11 @@ class SMIRNOFFProperTorsionHandler(SMIRNOFFPotentialHandler):
         Populate self.potentials with key-val pairs of [TopologyKey, PotentialKey].
 
         """
-        for topology_key, potential_key in self.slot_map.items():
+        parameter_types = _get_parameters_by_smirks(parameter_handler)
+        for potential_key, topology_key in _get_unique_slots(self.slot_map).items():
             smirks = potential_key.id
             n = potential_key.mult
-            parameter = parameter_handler.get_parameter({"smirks": smirks})[0]
+            parameter = parameter_types[smirks]
             # n_terms = len(parameter.k)
             if topology_key.bond_order:  # type: ignore[union-attr]
                 bond_order = topology_key.bond_order  # type: ignore[union-attr]
@@ -560,7 +665,7 @@ class SMIRNOFFProperTorsionHandler(SMIRNOFFPotentialHandler):
                         "idivf": parameter.idivf[n] * unit.dimensionless,
                     }
                     pots.append(
-                        Potential(
+                        Potential._from_trusted(
                             parameters=parameters,
                             map_key=map_key,
                         )
@@ -575,7 +680,7 @@ class SMIRNOFFProperTorsionHandler(SMIRNOFFPotentialHandler):
                     "phase": parameter.phase[n],
                     "idivf": parameter.idivf[n] * unit.dimensionless,
                 }
-                potential = Potential(parameters=parameters)  # type: ignore[assignment]
+                potential = Potential._from_trusted(parameters=parameters)  # type: ignore[assignment]
             self.potentials[potential_key] = potential
 
 
@@ -606,7 +711,7 @@ class SMIRNOFFImproperTorsionHandler(SMIRNOFFPotentialHandler):
         """
         if self.slot_map:
             self.slot_map = dict()
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches(parameter_handler, topology)
         for key, val in matches.items():
             parameter_handler._assert_correct_connectivity(
                 val,
@@ -644,17 +749,18 @@ class SMIRNOFFImproperTorsionHandler(SMIRNOFFPotentialHandler):
         Populate self.potentials with key-val pairs of [TopologyKey, PotentialKey].
 
         """
-        for potential_key in self.slot_map.values():
+        parameter_types = _get_parameters_by_smirks(parameter_handler)
+        for potential_key in _get_unique_slots(self.slot_map):
             smirks = potential_key.id
             n = potential_key.mult
-            parameter = parameter_handler.get_parameter({"smirks": smirks})[0]
+            parameter = parameter_types[smirks]
             parameters = {
                 "k": parameter.k[n],
                 "periodicity": parameter.periodicity[n] * unit.dimensionless,
                 "phase": parameter.phase[n],
                 "idivf": 3.0 * unit.dimensionless,
             }
-            potential = Potential(parameters=parameters)
+            potential = Potential._from_trusted(parameters=parameters)
             self.potentials[potential_key] = potential
 
 
@@ -718,11 +824,12 @@ class SMIRNOFFvdWHandler(_SMIRNOFFNonbondedHandler):
         self.method = parameter_handler.method.lower()
         self.cutoff = parameter_handler.cutoff
 
-        for potential_key in self.slot_map.values():
+        parameter_types = _get_parameters_by_smirks(parameter_handler)
+        for potential_key in _get_unique_slots(self.slot_map):
             smirks = potential_key.id
-            parameter = parameter_handler.get_parameter({"smirks": smirks})[0]
+            parameter = parameter_types[smirks]
             try:
-                potential = Potential(
+                potential = Potential._from_trusted(
                     parameters={
                         "sigma": parameter.sigma,
                         "epsilon": parameter.epsilon,
@@ -730,7 +837,7 @@ class SMIRNOFFvdWHandler(_SMIRNOFFNonbondedHandler):
                 )
             except AttributeError:
                 # Handle rmin_half pending https://github.com/openforcefield/openff-toolkit/pull/750
-                potential = Potential(
+                potential = Potential._from_trusted(
                     parameters={
                         "sigma": parameter.sigma,
                         "epsilon": parameter.epsilon,
@@ -802,7 +909,7 @@ class SMIRNOFFvdWHandler(_SMIRNOFFNonbondedHandler):
         ):
             raise NotImplementedError("Found unsupported virtual site types")
 
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches(parameter_handler, topology)
         for atoms, parameter_match in matches.items():
             virtual_site_type = parameter_match[0].parameter_type
             top_key = VirtualSiteKey(
@@ -813,7 +920,7 @@ class SMIRNOFFvdWHandler(_SMIRNOFFNonbondedHandler):
             pot_key = PotentialKey(
                 id=virtual_site_type.smirks, associated_handler=virtual_site_type.type
             )
-            pot = Potential(
+            pot = Potential._from_trusted(
                 parameters={
                     "sigma": virtual_site_type.sigma,
                     "epsilon": virtual_site_type.epsilon,
@@ -873,6 +980,11 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
         """Return a list of supported parameter attribute names."""
         pass
 
+    _charges_cache: Optional[
+        Tuple[np.ndarray, np.ndarray, Dict[VirtualSiteKey, float]]
+    ] = PrivateAttr(None)
+    _charges_version: Optional[Tuple[int, int, int]] = PrivateAttr(None)
+
     @property
     def charges(self) -> Dict[Union[TopologyKey, VirtualSiteKey], unit.Quantity]:
         """Get the total partial charge on each atom, excluding virtual sites."""
@@ -889,41 +1001,110 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
         self, include_virtual_sites=False
     ) -> Dict[Union[VirtualSiteKey, TopologyKey], unit.Quantity]:
         """Get the total partial charge on each atom or particle."""
-        charges: DefaultDict[
-            Union[TopologyKey, VirtualSiteKey], FloatQuantity
-        ] = defaultdict(lambda: 0.0 * unit.e)
+        atom_indices, atom_charges, virtual_site_charges = self._get_cached_charges()
+
+        returned_charges: Dict[Union[VirtualSiteKey, TopologyKey], unit.Quantity] = {
+            TopologyKey(atom_indices=(index,)): charge * unit.elementary_charge
+            for index, charge in zip(atom_indices.tolist(), atom_charges.tolist())
+        }
+
+        if include_virtual_sites:
+            for virtual_site_key, charge in virtual_site_charges.items():
+                returned_charges[virtual_site_key] = charge * unit.elementary_charge
+
+        return returned_charges
+
+    def get_charge_array(self, n_atoms: Optional[int] = None) -> np.ndarray:
+        """
+        Get the total partial charge on each atom, in elementary charges, as an array.
+
+        The array is indexed by atom and has ``n_atoms`` entries, or one more than the
+        largest index of an atom with a charge if ``n_atoms`` is not given. Atoms without
+        a charge have a charge of zero. Charges are only recomputed after the slot map,
+        potentials or parameters of any potential change.
+        """
+        atom_indices, atom_charges, _ = self._get_cached_charges()
+
+        if n_atoms is None:
+            n_atoms = int(atom_indices.max()) + 1 if atom_indices.size else 0
+
+        array = np.zeros(n_atoms)
+        array[atom_indices] = atom_charges
+
+        return array
+
+    def get_virtual_site_charges(self) -> Dict[VirtualSiteKey, float]:
+        """Get the charge on each virtual site, in elementary charges."""
+        return dict(self._get_cached_charges()[2])
+
+    def _get_cached_charges(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, Dict[VirtualSiteKey, float]]:
+        """
+        Get the atoms with charges, their charges and the charges of virtual sites.
+
+        The result is cached until the slot map, potentials or parameters of any potential
+        are modified.
+        """
+        version = self._data_version()
+        if version is None or version != self._charges_version:
+            self._charges_cache = self._compute_charges()
+            self._charges_version = version
+        return self._charges_cache  # type: ignore[return-value]
+
+    def _compute_charges(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, Dict[VirtualSiteKey, float]]:
+        # The charge each potential contributes to an atom or virtual site is converted
+        # to elementary charges once, not once per term it applies to
+        potential_charges: Dict[PotentialKey, Tuple[float, Optional[float]]] = dict()
+
+        atom_charges: DefaultDict[int, float] = defaultdict(float)
+        virtual_site_charges: Dict[VirtualSiteKey, float] = dict()
 
         for topology_key, potential_key in self.slot_map.items():
+            if potential_key not in potential_charges:
+                potential_charges[potential_key] = self._get_potential_charges(
+                    self.potentials[potential_key]
+                )
 
-            potential = self.potentials[potential_key]
+            atom_charge, virtual_site_charge = potential_charges[potential_key]
 
-            for parameter_key, parameter_value in potential.parameters.items():
+            if virtual_site_charge is not None:
+                if type(topology_key) is not VirtualSiteKey:
+                    raise RuntimeError
+                # assumes virtual sites can only have charges determined in one step
+                virtual_site_charges[topology_key] = virtual_site_charge  # type: ignore[index]
 
-                if parameter_key == "charge_increments":
-                    if type(topology_key) != VirtualSiteKey:
-                        raise RuntimeError
-                    charge = -1.0 * np.sum(parameter_value)
-                    # assumes virtual sites can only have charges determined in one step
-                    # also, topology_key is actually a VirtualSiteKey
-                    charges[topology_key] = charge
-                elif parameter_key in ["charge", "charge_increment"]:
-                    charge = parameter_value
-                    charges[topology_key.atom_indices[0]] += charge  # type: ignore
-                else:
-                    raise NotImplementedError()
+            atom_charges[topology_key.atom_indices[0]] += atom_charge
 
-        returned_charges: Dict[
-            Union[VirtualSiteKey, TopologyKey], unit.Quantity
-        ] = dict()
+        return (
+            np.fromiter(atom_charges.keys(), dtype=int, count=len(atom_charges)),
+            np.fromiter(atom_charges.values(), dtype=float, count=len(atom_charges)),
+            virtual_site_charges,
+        )
 
-        for index, charge in charges.items():
-            if isinstance(index, int):
-                returned_charges[TopologyKey(atom_indices=(index,))] = charge
+    @staticmethod
+    def _get_potential_charges(
+        potential: Union[Potential, WrappedPotential]
+    ) -> Tuple[float, Optional[float]]:
+        """Get the charge a potential contributes to an atom and, if any, a virtual site."""
+        atom_charge = 0.0
+        virtual_site_charge = None
+
+        for parameter_key, parameter_value in potential.parameters.items():
+            if parameter_key == "charge_increments":
+                virtual_site_charge = -1.0 * float(
+                    np.sum(parameter_value.m_as(unit.elementary_charge))
+                )
+            elif parameter_key in ["charge", "charge_increment"]:
+                # TODO: Figure out why charge increments were applied as an array
+                # to the anchor atom involved in a BondChargeVirtualSite?
+                atom_charge += np.ravel(parameter_value.m_as(unit.elementary_charge))[0]
             else:
-                if include_virtual_sites:
-                    returned_charges[index] = charge
+                raise NotImplementedError()
 
-        return returned_charges
+        return atom_charge, virtual_site_charge
 
     @classmethod
     def parameter_handler_precedence(cls) -> List[str]:
@@ -937,10 +1118,13 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
         cls: Type[T],
         parameter_handler: Any,
         topology: "Topology",
+        charge_cache: Optional[PartialChargeCache] = None,
     ) -> T:
         """
         Create a SMIRNOFFElectrostaticsHandler from toolkit data.
 
+        If ``charge_cache`` is provided, partial charges computed by toolkit wrappers are
+        looked up in and stored to it.
         """
         if isinstance(parameter_handler, list):
             parameter_handlers = parameter_handler
@@ -960,7 +1144,7 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
             method=toolkit_handler_with_metadata.method.lower(),
         )
 
-        handler.store_matches(parameter_handlers, topology)
+        handler.store_matches(parameter_handlers, topology, charge_cache=charge_cache)
 
         return handler
 
@@ -985,7 +1169,7 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
         ):
             raise NotImplementedError("Found unsupported virtual site types")
 
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches(parameter_handler, topology)
         for atom_indices, parameter_match in matches.items():
             virtual_site_type = parameter_match[0].parameter_type
 
@@ -1000,7 +1184,7 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
                 associated_handler="VirtualSiteHandler",
             )
 
-            virtual_site_potential = Potential(
+            virtual_site_potential = Potential._from_trusted(
                 parameters={
                     "charge_increments": from_openmm(
                         virtual_site_type.charge_increment
@@ -1028,7 +1212,7 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
                     virtual_site_type, f"charge_increment{i + 1}"
                 )
 
-                potential = Potential(
+                potential = Potential._from_trusted(
                     parameters={"charge_increment": from_openmm(charge_increment)}
                 )
 
@@ -1047,6 +1231,30 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
 
         return from_openmm(molecule.partial_charges)
 
+    @classmethod
+    def _get_partial_charges(
+        cls,
+        molecule: Molecule,
+        method: str,
+        charge_cache: Optional[PartialChargeCache] = None,
+    ) -> unit.Quantity:
+        """Get partial charges from a persistent cache, if provided, or compute them."""
+        if charge_cache is None:
+            return cls._compute_partial_charges(molecule, method=method)
+
+        cache_key = get_partial_charge_cache_key(molecule, method)
+
+        cached_charges = charge_cache.get(cache_key)
+
+        if cached_charges is not None:
+            return cached_charges * unit.elementary_charge
+
+        partial_charges = cls._compute_partial_charges(molecule, method=method)
+
+        charge_cache.set(cache_key, partial_charges.m_as(unit.elementary_charge))
+
+        return partial_charges
+
     @classmethod
     def _library_charge_to_potentials(
         cls,
@@ -1064,7 +1272,9 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
             potential_key = PotentialKey(
                 id=parameter.smirks, mult=i, associated_handler="LibraryCharges"
             )
-            potential = Potential(parameters={"charge": from_openmm(charge)})
+            potential = Potential._from_trusted(
+                parameters={"charge": from_openmm(charge)}
+            )
 
             matches[topology_key] = potential_key
             potentials[potential_key] = potential
@@ -1093,7 +1303,7 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
             #       maybe by implementing this in the TK?
             charge_increment = getattr(parameter, f"charge_increment{i + 1}")
 
-            potential = Potential(
+            potential = Potential._from_trusted(
                 parameters={"charge_increment": from_openmm(charge_increment)}
             )
 
@@ -1154,6 +1364,7 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
         cls,
         parameter_handler: Union["ToolkitAM1BCCHandler", ChargeIncrementModelHandler],
         reference_molecule: Molecule,
+        charge_cache: Optional[PartialChargeCache] = None,
     ) -> Tuple[Dict[TopologyKey, PotentialKey], Dict[PotentialKey, Potential]]:
         """Construct a slot and potential map for a charge model based parameter handler."""
         reference_molecule = copy.deepcopy(reference_molecule)
@@ -1163,8 +1374,8 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
 
         method = getattr(parameter_handler, "partial_charge_method", "am1bcc")
 
-        partial_charges = cls._compute_partial_charges(
-            reference_molecule, method=method
+        partial_charges = cls._get_partial_charges(
+            reference_molecule, method=method, charge_cache=charge_cache
         )
 
         matches = {}
@@ -1175,7 +1386,9 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
             potential_key = PotentialKey(
                 id=reference_smiles, mult=i, associated_handler="ToolkitAM1BCC"
             )
-            potentials[potential_key] = Potential(parameters={"charge": partial_charge})
+            potentials[potential_key] = Potential._from_trusted(
+                parameters={"charge": partial_charge}
+            )
 
             matches[TopologyKey(atom_indices=(i,))] = potential_key
 
@@ -1186,6 +1399,7 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
         cls,
         parameter_handlers: Dict[str, "ElectrostaticsHandlerType"],
         reference_molecule: Molecule,
+        charge_cache: Optional[PartialChargeCache] = None,
     ) -> Tuple[Dict[TopologyKey, PotentialKey], Dict[PotentialKey, Potential]]:
         """
         Construct a slot and potential map for a particular reference molecule and set of parameter handlers.
@@ -1215,7 +1429,7 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
             if handler_type in ["ToolkitAM1BCC", "ChargeIncrementModel"]:
 
                 am1_matches, am1_potentials = cls._find_am1_matches(
-                    parameter_handler, reference_molecule
+                    parameter_handler, reference_molecule, charge_cache=charge_cache
                 )
 
             if slot_matches is None and am1_matches is None:
@@ -1282,6 +1496,7 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
             "ElectrostaticsHandlerType", List["ElectrostaticsHandlerType"]
         ],
         topology: Union["Topology", "_OFFBioTop"],
+        charge_cache: Optional[PartialChargeCache] = None,
     ) -> None:
         """
         Populate self.slot_map with key-val pairs of slots and unique potential identifiers.
@@ -1304,7 +1519,7 @@ class SMIRNOFFElectrostaticsHandler(_SMIRNOFFNonbondedHandler):
         for reference_molecule in reference_molecules:
 
             matches, potentials = self._find_reference_matches(
-                parameter_handlers, reference_molecule
+                parameter_handlers, reference_molecule, charge_cache=charge_cache
             )
 
             match_mults = defaultdict(set)
@@ -1360,6 +1575,9 @@ class SMIRNOFFVirtualSiteHandler(SMIRNOFFPotentialHandler):
     )
     exclusion_policy: Literal["parents"] = "parents"
 
+    _local_frames: Optional[Tuple] = PrivateAttr(None)
+    _local_frames_version: Optional[Tuple[int, int, int]] = PrivateAttr(None)
+
     @classmethod
     def allowed_parameter_handlers(cls):
         """Return a list of allowed types of ParameterHandler classes."""
@@ -1386,7 +1604,7 @@ class SMIRNOFFVirtualSiteHandler(SMIRNOFFPotentialHandler):
         parameter_handler_name = getattr(parameter_handler, "_TAGNAME", None)
         if self.slot_map:
             self.slot_map = dict()
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches(parameter_handler, topology)
         for key, val_list in matches.items():
             for val in val_list:
                 virtual_site_key = VirtualSiteKey(
@@ -1408,10 +1626,11 @@ class SMIRNOFFVirtualSiteHandler(SMIRNOFFPotentialHandler):
         """Store VirtualSite-specific parameter-like data."""
         if self.potentials:
             self.potentials = dict()
-        for potential_key in self.slot_map.values():
+        parameter_types = _get_parameters_by_smirks(parameter_handler)
+        for potential_key in _get_unique_slots(self.slot_map):
             smirks = potential_key.id
-            parameter_type = parameter_handler.get_parameter({"smirks": smirks})[0]
-            potential = Potential(
+            parameter_type = parameter_types[smirks]
+            potential = Potential._from_trusted(
                 parameters={
                     "distance": parameter_type.distance,
                 },
@@ -1423,50 +1642,167 @@ class SMIRNOFFVirtualSiteHandler(SMIRNOFFPotentialHandler):
                     )
             self.potentials[potential_key] = potential
 
-    def _get_local_frame_weights(self, virtual_site_key: "VirtualSiteKey"):
-        if virtual_site_key.type == "BondCharge":
-            origin_weight = [1.0, 0.0]
-            x_direction = [-1.0, 1.0]
-            y_direction = [-1.0, 1.0]
-        elif virtual_site_key.type == "MonovalentLonePair":
-            origin_weight = [1, 0.0, 0.0]
-            x_direction = [-1.0, 1.0, 0.0]
-            y_direction = [-1.0, 0.0, 1.0]
-        elif virtual_site_key.type == "DivalentLonePair":
-            origin_weight = [0.0, 1.0, 0.0]
-            x_direction = [0.5, -1.0, 0.5]
-            y_direction = [1.0, -1.0, 1.0]
-        elif virtual_site_key.type == "TrivalentLonePair":
-            origin_weight = [0.0, 1.0, 0.0, 0.0]
-            x_direction = [1 / 3, -1.0, 1 / 3, 1 / 3]
-            y_direction = [1.0, -1.0, 0.0, 0.0]
-
-        return origin_weight, x_direction, y_direction
-
-    def _get_local_frame_position(self, virtual_site_key: "VirtualSiteKey"):
-        potential_key = self.slot_map[virtual_site_key]
-        potential = self.potentials[potential_key]
-        if virtual_site_key.type == "BondCharge":
-            distance = potential.parameters["distance"]
-            local_frame_position = np.asarray([-1.0, 0.0, 0.0]) * distance
-        elif virtual_site_key.type == "MonovalentLonePair":
-            distance = potential.parameters["distance"]
-            theta = potential.parameters["inPlaneAngle"].m_as(unit.radian)  # type: ignore
-            psi = potential.parameters["outOfPlaneAngle"].m_as(unit.radian)  # type: ignore
-            factor = np.array(
-                [np.cos(theta) * np.cos(psi), np.sin(theta) * np.cos(psi), np.sin(psi)]
+    def get_local_frames(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the local coordinate frame of every virtual site as arrays.
+
+        Virtual sites are ordered as in the slot map. The position of each virtual site
+        is defined in a frame whose origin and x- and y-directions are weighted sums of
+        the positions of its parent atoms, as in ``openmm.LocalCoordinatesSite``. The
+        result is cached until the slot map, potentials or parameters of any potential
+        are modified.
+
+        .. warning :: This API is experimental and subject to change.
+
+        Returns
+        -------
+        parent_indices : np.ndarray of shape (n_virtual_sites, 4)
+            The indices of the parent atoms of each virtual site, padded with -1.
+        origin_weights : np.ndarray of shape (n_virtual_sites, 4)
+            The weight of each parent atom in the origin, zero for padding.
+        x_weights : np.ndarray of shape (n_virtual_sites, 4)
+            The weight of each parent atom in the x-direction, zero for padding.
+        y_weights : np.ndarray of shape (n_virtual_sites, 4)
+            The weight of each parent atom in the y-direction, zero for padding.
+        local_positions : np.ndarray of shape (n_virtual_sites, 3)
+            The position of each virtual site in its local frame, in nanometers.
+
+        """
+        version = self._data_version()
+        if version is None or version != self._local_frames_version:
+            self._local_frames = self._compute_local_frames()
+            self._local_frames_version = version
+        return self._local_frames  # type: ignore[return-value]
+
+    def get_positions(self, positions) -> unit.Quantity:
+        """
+        Compute the Cartesian positions of every virtual site from the positions of atoms.
+
+        Virtual sites are ordered as in the slot map. ``positions`` may be of shape
+        ``(n_atoms, 3)`` or, i.e. for many conformers, ``(..., n_atoms, 3)`` and is
+        assumed to be in nanometers if it has no units.
+
+        .. warning :: This API is experimental and subject to change.
+        """
+        if isinstance(positions, omm_unit.Quantity):
+            positions = from_openmm(positions)
+        if isinstance(positions, unit.Quantity):
+            positions = positions.m_as(unit.nanometer)
+        positions = np.asarray(positions, dtype=float)
+
+        (
+            parent_indices,
+            origin_weights,
+            x_weights,
+            y_weights,
+            local_positions,
+        ) = self.get_local_frames()
+
+        # Padded parents have zero weights, so any valid index may stand in for them
+        parent_positions = positions[..., np.maximum(parent_indices, 0), :]
+
+        origin = np.einsum("vp,...vpi->...vi", origin_weights, parent_positions)
+        x_axis = np.einsum("vp,...vpi->...vi", x_weights, parent_positions)
+        y_axis = np.einsum("vp,...vpi->...vi", y_weights, parent_positions)
+
+        z_axis = np.cross(x_axis, y_axis)
+        y_axis = np.cross(z_axis, x_axis)
+
+        virtual_site_positions = origin
+        for axis, local_position in zip(
+            (x_axis, y_axis, z_axis), np.moveaxis(local_positions, -1, 0)
+        ):
+            norm = np.linalg.norm(axis, axis=-1, keepdims=True)
+            axis = axis / np.where(norm > 0.0, norm, 1.0)
+            virtual_site_positions = (
+                virtual_site_positions + local_position[:, None] * axis
             )
-            local_frame_position = factor * distance
-        elif virtual_site_key.type == "DivalentLonePair":
-            distance = potential.parameters["distance"]
-            theta = potential.parameters["inPlaneAngle"].m_as(unit.radian)  # type: ignore
-            factor = np.asarray([-1.0 * np.cos(theta), 0.0, np.sin(theta)])
-            local_frame_position = factor * distance
-        elif virtual_site_key.type == "TrivalentLonePair":
-            distance = potential.parameters["distance"]
-            local_frame_position = np.asarray([-1.0, 0.0, 0.0]) * distance
 
-        return local_frame_position
+        return virtual_site_positions * unit.nanometer
+
+    def _compute_local_frames(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        n_virtual_sites = len(self.slot_map)
+
+        parent_indices = np.full((n_virtual_sites, 4), -1, dtype=np.int64)
+        weights = np.zeros((3, n_virtual_sites, 4))
+        types = np.empty(n_virtual_sites, dtype=object)
+        potential_index = np.empty(n_virtual_sites, dtype=np.int64)
+
+        # Parameters are converted once per potential, not once per virtual site
+        potential_indices: Dict[PotentialKey, int] = dict()
+        potential_parameters: List[Tuple[float, float, float]] = list()
+
+        for row, (virtual_site_key, potential_key) in enumerate(self.slot_map.items()):
+            virtual_site_type = virtual_site_key.type  # type: ignore[union-attr]
+            try:
+                frame_weights = _VIRTUAL_SITE_FRAME_WEIGHTS[virtual_site_type]
+            except KeyError:
+                raise NotImplementedError(
+                    f"Virtual sites of type {virtual_site_type} are not supported"
+                )
+
+            atom_indices = virtual_site_key.atom_indices
+            parent_indices[row, : len(atom_indices)] = atom_indices
+            weights[:, row, : len(atom_indices)] = frame_weights
+            types[row] = virtual_site_type
+
+            if potential_key not in potential_indices:
+                potential_indices[potential_key] = len(potential_parameters)
+                parameters = self.potentials[potential_key].parameters
+                potential_parameters.append(
+                    (
+                        parameters["distance"].m_as(unit.nanometer),
+                        parameters.get("inPlaneAngle", 0.0 * unit.radian).m_as(
+                            unit.radian
+                        ),
+                        parameters.get("outOfPlaneAngle", 0.0 * unit.radian).m_as(
+                            unit.radian
+                        ),
+                    )
+                )
+            potential_index[row] = potential_indices[potential_key]
+
+        distance, in_plane_angle, out_of_plane_angle = (
+            np.asarray(potential_parameters, dtype=float).reshape(-1, 3)[
+                potential_index
+            ]
+        ).T
+
+        # BondCharge and TrivalentLonePair sites lie along the negative x-axis
+        directions = np.zeros((n_virtual_sites, 3))
+        directions[:, 0] = -1.0
+
+        monovalent = types == "MonovalentLonePair"
+        directions[monovalent] = np.stack(
+            [
+                np.cos(in_plane_angle) * np.cos(out_of_plane_angle),
+                np.sin(in_plane_angle) * np.cos(out_of_plane_angle),
+                np.sin(out_of_plane_angle),
+            ],
+            axis=-1,
+        )[monovalent]
+
+        divalent = types == "DivalentLonePair"
+        directions[divalent] = np.stack(
+            [
+                -np.cos(out_of_plane_angle),
+                np.zeros(n_virtual_sites),
+                np.sin(out_of_plane_angle),
+            ],
+            axis=-1,
+        )[divalent]
+
+        return (
+            parent_indices,
+            weights[0],
+            weights[1],
+            weights[2],
+            directions * distance[:, None],
+        )
 
 
 def library_charge_from_molecule(
@@ -1486,6 +1822,186 @@ def library_charge_from_molecule(
     return library_charge_type
 
 
+# The weights of the parent atoms in the origin and x- and y-directions of the local
+# frame of each type of virtual site, as in openmm.LocalCoordinatesSite
+_VIRTUAL_SITE_FRAME_WEIGHTS: Dict[str, Tuple[List[float], List[float], List[float]]] = {
+    "BondCharge": ([1.0, 0.0], [-1.0, 1.0], [-1.0, 1.0]),
+    "MonovalentLonePair": ([1.0, 0.0, 0.0], [-1.0, 1.0, 0.0], [-1.0, 0.0, 1.0]),
+    "DivalentLonePair": ([0.0, 1.0, 0.0], [0.5, -1.0, 0.5], [1.0, -1.0, 0.0]),
+    "TrivalentLonePair": (
+        [0.0, 1.0, 0.0, 0.0],
+        [1 / 3, -1.0, 1 / 3, 1 / 3],
+        [1.0, -1.0, 0.0, 0.0],
+    ),
+}
+
+_MAX_CACHED_REFERENCE_MATCHES = 1024
+
+_REFERENCE_MATCHES_CACHE: Dict[Tuple, Dict[Tuple[int, ...], Any]] = dict()
+
+
+def _get_parameter_handler_signature(parameter_handler: ParameterHandler) -> Tuple:
+    """
+    Summarize the attributes of a parameter handler that affect which parameters match a molecule.
+
+    Two parameter handlers with the same signature assign the same parameter (by position in the
+    handler) to the same atoms of a molecule, even if they are different objects.
+    """
+    return (
+        type(parameter_handler).__name__,
+        tuple(
+            (
+                type(parameter).__name__,
+                parameter.smirks,
+                getattr(parameter, "name", None),
+                getattr(parameter, "match", None),
+            )
+            for parameter in parameter_handler.parameters
+        ),
+    )
+
+
+def _find_reference_molecule_matches(
+    parameter_handler: ParameterHandler,
+    reference_molecule: Molecule,
+) -> Dict[Tuple[int, ...], Any]:
+    """
+    Find the parameters matched to a reference molecule, by their position in the parameter handler.
+
+    Each value is a tuple of the position of the matched parameter and its environment match, or a
+    list of such tuples for parameter handlers that match several parameters to the same atoms.
+
+    Results are cached on the mapped SMILES of the molecule and the signature of the parameter
+    handler, so each unique molecule is only matched once per force field, including across
+    repeated calls to ``Interchange.from_smirnoff``.
+    """
+    cache_key = (
+        reference_molecule.to_smiles(
+            isomeric=True, explicit_hydrogens=True, mapped=True
+        ),
+        _get_parameter_handler_signature(parameter_handler),
+    )
+
+    if cache_key in _REFERENCE_MATCHES_CACHE:
+        return _REFERENCE_MATCHES_CACHE[cache_key]
+
+    parameter_indices = {
+        id(parameter): index
+        for index, parameter in enumerate(parameter_handler.parameters)
+    }
+
+    found_matches = parameter_handler.find_matches(reference_molecule.to_topology())
+
+    # Keep the (possibly key-transforming) dict type used by the parameter handler
+    reference_matches = type(found_matches)()
+
+    for key, val in found_matches.items():
+        if isinstance(val, list):
+            # Virtual site handlers can match several parameters to the same atoms
+            reference_matches[key] = [
+                (parameter_indices[id(match.parameter_type)], match.environment_match)
+                for match in val
+            ]
+        else:
+            reference_matches[key] = (
+                parameter_indices[id(val.parameter_type)],
+                val.environment_match,
+            )
+
+    if len(_REFERENCE_MATCHES_CACHE) >= _MAX_CACHED_REFERENCE_MATCHES:
+        _REFERENCE_MATCHES_CACHE.pop(next(iter(_REFERENCE_MATCHES_CACHE)), None)
+
+    _REFERENCE_MATCHES_CACHE[cache_key] = reference_matches
+
+    return reference_matches
+
+
+def _find_matches(
+    parameter_handler: ParameterHandler,
+    topology: Union["Topology", "_OFFBioTop"],
+):
+    """
+    Find the parameters matched to a topology, with the same return type as ``find_matches``.
+
+    Each unique reference molecule is matched once and the matches are broadcast to every copy of
+    it in the topology by mapping the matched reference atom indices onto topology atom indices.
+    The ``environment_match`` of each returned match refers to the reference molecule, not a copy.
+    """
+    parameters = parameter_handler.parameters
+
+    def _to_match(value):
+        if isinstance(value, list):
+            return [_to_match(val) for val in value]
+        index, environment_match = value
+        return ParameterHandler._Match(parameters[index], environment_match)
+
+    matches = None
+
+    for reference_molecule in topology.reference_molecules:
+
+        reference_matches = _find_reference_molecule_matches(
+            parameter_handler, reference_molecule
+        )
+
+        if matches is None:
+            matches = type(reference_matches)()
+
+        if not reference_matches:
+            continue
+
+        topology_molecules = topology._reference_molecule_to_topology_molecules[
+            reference_molecule
+        ]
+
+        # Each row maps the atom indices of the reference molecule onto one of its copies
+        index_maps = np.empty(
+            (len(topology_molecules), reference_molecule.n_atoms), dtype=int
+        )
+        for row, topology_molecule in enumerate(topology_molecules):
+            for topology_atom in topology_molecule.atoms:
+                index_maps[
+                    row, topology_atom.atom.molecule_atom_index
+                ] = topology_atom.topology_atom_index
+
+        # Group by the number of atoms in each match, i.e. virtual sites of different types
+        keys_by_size: DefaultDict[int, List[Tuple[int, ...]]] = defaultdict(list)
+        for key in reference_matches:
+            keys_by_size[len(key)].append(key)
+
+        for keys in keys_by_size.values():
+            values = [_to_match(reference_matches[key]) for key in keys]
+            topology_keys = index_maps[:, np.asarray(keys)].tolist()
+            for copy_keys in topology_keys:
+                for key, value in zip(copy_keys, values):
+                    matches[tuple(key)] = value
+
+    return matches if matches is not None else dict()
+
+
+def _get_parameters_by_smirks(parameter_handler: ParameterHandler) -> Dict[str, Any]:
+    """
+    Index the parameters of a parameter handler by SMIRKS pattern.
+
+    Like ``ParameterHandler.get_parameter``, the first parameter with a given SMIRKS
+    pattern is used, but each lookup is then constant-time rather than a scan of all
+    parameters.
+    """
+    parameters: Dict[str, Any] = dict()
+    for parameter in parameter_handler.parameters:
+        parameters.setdefault(parameter.smirks, parameter)
+    return parameters
+
+
+def _get_unique_slots(
+    slot_map: Dict[TopologyKey, PotentialKey]
+) -> Dict[PotentialKey, TopologyKey]:
+    """Map each unique potential key in a slot map to the first slot it is applied to."""
+    unique_slots: Dict[PotentialKey, TopologyKey] = dict()
+    for topology_key, potential_key in slot_map.items():
+        unique_slots.setdefault(potential_key, topology_key)
+    return unique_slots
+
+
 def _get_interpolation_coeffs(fractional_bond_order, data):
     x1, x2 = data.keys()
     coeff1 = (x2 - fractional_bond_order) / (x2 - x1)
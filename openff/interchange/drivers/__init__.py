@@ -4,6 +4,7 @@ from openff.interchange.drivers.amber import get_amber_energies
 from openff.interchange.drivers.gromacs import get_gromacs_energies
 from openff.interchange.drivers.lammps import get_lammps_energies
 from openff.interchange.drivers.openmm import get_openmm_energies
+from openff.interchange.drivers.reference import get_reference_energies
 
 __all__ = [
     "get_openmm_energies",
@@ -11,4 +12,5 @@ __all__ = [
     "get_lammps_energies",
     "get_amber_energies",
     "get_all_energies",
+    "get_reference_energies",
 ]
@@ -120,8 +120,8 @@ def _write_lammps_input(
         vdw_hander = off_sys.handlers["vdW"]
         electrostatics_handler = off_sys.handlers["Electrostatics"]
 
-        has_electrostatics = any(
-            c.m != 0 for c in electrostatics_handler.charges.values()
+        has_electrostatics = bool(
+            np.any(electrostatics_handler.get_charge_array() != 0)
         )
 
         # TODO: Ensure units
@@ -3,10 +3,12 @@ from typing import Dict, Optional
 
 import numpy as np
 import openmm
+from openff.units import unit as off_unit
+from openff.units.openmm import from_openmm
 from openmm import unit
 
 from openff.interchange.components.interchange import Interchange
-from openff.interchange.drivers.report import EnergyReport
+from openff.interchange.drivers.report import BatchEnergyReport, EnergyReport
 
 kj_mol = unit.kilojoule_per_mole
 
@@ -59,12 +61,15 @@ def get_openmm_energies(
                     "Cannot yet split out NonbondedForce components while virtual sites are present."
                 )
 
-            n_virtual_sites = len(off_sys["VirtualSites"].slot_map)
-
-            # TODO: Actually compute virtual site positions based on initial conformers
-            virtual_site_positions = np.zeros((n_virtual_sites, 3))
-            virtual_site_positions *= off_sys.positions.units
-            positions = np.vstack([positions, virtual_site_positions])
+            # Virtual sites are added to the system after all atoms, in this order
+            virtual_site_positions = off_sys["VirtualSites"].get_positions(positions)
+            positions = np.vstack(
+                [
+                    positions.m_as(virtual_site_positions.units),
+                    virtual_site_positions.m,
+                ]
+            )
+            positions = positions * virtual_site_positions.units
 
     omm_sys: openmm.System = off_sys.to_openmm(
         combine_nonbonded_forces=combine_nonbonded_forces
@@ -191,6 +196,153 @@ def _get_openmm_energies(
     return report
 
 
+def get_openmm_energies_batch(
+    off_sys: Interchange,
+    positions,
+    combine_nonbonded_forces: bool = False,
+) -> BatchEnergyReport:
+    """
+    Given an OpenFF Interchange object, return the energies of many frames as computed by OpenMM.
+
+    The Interchange is exported once and all frames are evaluated with a single
+    ``openmm.Context``, querying one force group per energy component of each frame.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    off_sys : openff.interchange.components.interchange.Interchange
+        An OpenFF Interchange object to compute the energies of
+    positions : array-like of shape (n_frames, n_atoms, 3)
+        The positions of the atoms in each frame, in nanometers if not tagged with units.
+        Positions of virtual sites are computed from them.
+    combine_nonbonded_forces : bool, default=False
+        Whether or not to combine all non-bonded interactions (vdW, short- and long-range
+        electrostatics, and 1-4 interactions) into a single openmm.NonbondedForce.
+
+    Returns
+    -------
+    report : BatchEnergyReport
+        A `BatchEnergyReport` object containing the energies of each frame.
+
+    """
+    if isinstance(positions, unit.Quantity):
+        positions = from_openmm(positions)
+    if isinstance(positions, off_unit.Quantity):
+        positions = positions.m_as(off_unit.nanometer)
+    positions = np.asarray(positions, dtype=float)
+
+    n_atoms = off_sys.topology.mdtop.n_atoms
+    if positions.ndim != 3 or positions.shape[1:] != (n_atoms, 3):
+        raise ValueError(
+            f"Expected positions of shape (n_frames, {n_atoms}, 3), found an array of "
+            f"shape {positions.shape}."
+        )
+
+    if "VirtualSites" in off_sys.handlers:
+        if len(off_sys["VirtualSites"].slot_map) > 0:
+            if not combine_nonbonded_forces:
+                raise NotImplementedError(
+                    "Cannot yet split out NonbondedForce components while virtual sites are present."
+                )
+
+            # Virtual sites are added to the system after all atoms, in this order
+            virtual_site_positions = off_sys["VirtualSites"].get_positions(positions)
+            positions = np.concatenate(
+                [positions, virtual_site_positions.m_as(off_unit.nanometer)], axis=1
+            )
+
+    omm_sys: openmm.System = off_sys.to_openmm(
+        combine_nonbonded_forces=combine_nonbonded_forces
+    )
+
+    energy_types = _get_energy_types(omm_sys)
+
+    # Each energy component is computed from one force group. Forces that do not
+    # contribute to any component are put in a group that is never queried.
+    group_indices = {
+        energy_type: group
+        for group, energy_type in enumerate(sorted(set(energy_types.values())))
+    }
+    for force_index, force in enumerate(omm_sys.getForces()):
+        force.setForceGroup(group_indices.get(energy_types.get(force_index), 31))
+
+    integrator = openmm.VerletIntegrator(1.0 * unit.femtoseconds)
+    context = openmm.Context(omm_sys, integrator)
+
+    if off_sys.box is not None:
+        context.setPeriodicBoxVectors(
+            *(off_sys.box.m_as(off_unit.nanometer) * unit.nanometer)
+        )
+
+    n_frames = positions.shape[0]
+    raw_energies = {energy_type: np.zeros(n_frames) for energy_type in group_indices}
+
+    for frame, frame_positions in enumerate(positions):
+        context.setPositions(frame_positions * unit.nanometer)
+
+        for energy_type, group in group_indices.items():
+            state = context.getState(getEnergy=True, groups={group})
+            raw_energies[energy_type][frame] = state.getPotentialEnergy().value_in_unit(
+                kj_mol
+            )
+
+    del context
+    del integrator
+
+    energies: Dict[str, np.ndarray] = {
+        "Bond": raw_energies.get("Bond", np.zeros(n_frames)),
+        "Angle": raw_energies.get("Angle", np.zeros(n_frames)),
+        "Torsion": raw_energies.get("Torsion", np.zeros(n_frames)),
+    }
+
+    if "Nonbonded" in raw_energies:
+        energies["Nonbonded"] = sum(
+            raw_energies.get(key, np.zeros(n_frames))
+            for key in ["Nonbonded", "vdW", "Electrostatics"]
+        )
+    else:
+        energies["vdW"] = raw_energies.get("vdW", np.zeros(n_frames))
+        energies["Electrostatics"] = raw_energies.get(
+            "Electrostatics", np.zeros(n_frames)
+        )
+
+    return BatchEnergyReport(
+        energies={
+            key: value * off_unit.kilojoule / off_unit.mol
+            for key, value in energies.items()
+        }
+    )
+
+
+def _get_energy_types(omm_sys: openmm.System) -> Dict[int, str]:
+    """
+    Map the index of each force in an `openmm.System` to the energy component it contributes to.
+
+    Forces that do not contribute to any component are omitted.
+    """
+    energy_types: Dict[int, str] = dict()
+
+    for index, force in enumerate(omm_sys.getForces()):
+        if type(force) == openmm.HarmonicBondForce:
+            energy_types[index] = "Bond"
+        elif type(force) == openmm.HarmonicAngleForce:
+            energy_types[index] = "Angle"
+        elif type(force) in [openmm.PeriodicTorsionForce, openmm.RBTorsionForce]:
+            energy_types[index] = "Torsion"
+        elif type(force) in [
+            openmm.NonbondedForce,
+            openmm.CustomNonbondedForce,
+            openmm.CustomBondForce,
+        ]:
+            energy_type = _infer_nonbonded_energy_type(force)
+
+            if energy_type != "None":
+                energy_types[index] = energy_type
+
+    return energy_types
+
+
 def _infer_nonbonded_energy_type(force):
     if type(force) == openmm.NonbondedForce:
         has_electrostatics = False
@@ -0,0 +1,502 @@
+"""Functions for evaluating energies of Interchange objects directly with NumPy."""
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple
+
+import numpy as np
+from openff.units import unit
+from openff.units.openmm import from_openmm
+from openmm import unit as openmm_unit
+
+from openff.interchange.components.mdtraj import _get_bonded_pairs
+from openff.interchange.drivers.report import BatchEnergyReport, EnergyReport
+from openff.interchange.exceptions import (
+    MissingPositionsError,
+    UnimplementedCutoffMethodError,
+    UnsupportedCutoffMethodError,
+    UnsupportedExportError,
+)
+from openff.interchange.interop.openmm import _get_nonbonded_particle_parameters
+
+if TYPE_CHECKING:
+    from openff.interchange.components.interchange import Interchange
+
+kj_mol = unit.kilojoule / unit.mol
+
+# Matches the value used in the OpenMM export, in kJ/mol * nm / e ** 2
+_COULOMB_CONSTANT = 138.935456
+
+# The default solvent dielectric of reaction-field electrostatics in OpenMM
+_REACTION_FIELD_DIELECTRIC = 78.3
+
+# The number of (frame, pair) distances evaluated at once by non-bonded kernels
+_MAX_PAIR_DISTANCES = 2 ** 22
+
+
+def get_reference_energies(interchange: "Interchange", positions=None) -> EnergyReport:
+    """
+    Given an OpenFF Interchange object, return single-point energies computed with NumPy.
+
+    See ``get_reference_energies_batch`` for the supported handlers and methods.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    interchange : openff.interchange.components.interchange.Interchange
+        An OpenFF Interchange object to compute the single-point energy of
+    positions : array-like of shape (n_atoms, 3), optional
+        The positions of the atoms, in nanometers if not tagged with units. Defaults to
+        ``interchange.positions``.
+
+    Returns
+    -------
+    report : EnergyReport
+        An `EnergyReport` object containing the single-point energies.
+
+    """
+    if positions is None:
+        positions = interchange.positions
+
+    if positions is None:
+        raise MissingPositionsError(
+            "Positions are required to compute energies of an Interchange."
+        )
+
+    positions = _to_nanometer_array(positions)
+
+    return get_reference_energies_batch(interchange, positions[np.newaxis])[0]
+
+
+def get_reference_energies_batch(
+    interchange: "Interchange", positions
+) -> BatchEnergyReport:
+    """
+    Given an OpenFF Interchange object, return the energies of many frames computed with NumPy.
+
+    All frames, i.e. conformers of the same molecule(s), are evaluated at once from the
+    columnar representation of each handler (see ``PotentialHandler.to_arrays``), without
+    exporting to a simulation engine. Supported are
+
+    * harmonic bonds (excluding constrained bonds) and angles,
+    * periodic proper and improper torsions and Ryckaert-Bellemans torsions,
+    * Lennard-Jones vdW interactions with a cutoff (and switching function) or no cutoff,
+      combined with the mixing rule of the vdW handler,
+    * electrostatics with a plain cutoff, a reaction field (with a solvent dielectric of
+      78.3, as in OpenMM) or no cutoff. PME electrostatics are treated as no cutoff for
+      non-periodic systems.
+
+    As in the OpenMM export, 1-2 and 1-3 non-bonded interactions are excluded and 1-4
+    interactions are scaled by ``scale_14`` of each handler and not truncated. Periodic
+    systems use the minimum image convention for non-bonded interactions. Long-range
+    dispersion corrections are not included.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    interchange : openff.interchange.components.interchange.Interchange
+        An OpenFF Interchange object to compute the energies of
+    positions : array-like of shape (n_frames, n_atoms, 3)
+        The positions of the atoms in each frame, in nanometers if not tagged with units.
+
+    Returns
+    -------
+    report : BatchEnergyReport
+        A `BatchEnergyReport` object containing the energies of each frame.
+
+    """
+    positions = _to_nanometer_array(positions)
+
+    n_atoms = interchange.topology.mdtop.n_atoms
+    if positions.ndim != 3 or positions.shape[1:] != (n_atoms, 3):
+        raise ValueError(
+            f"Expected positions of shape (n_frames, {n_atoms}, 3), found an array of "
+            f"shape {positions.shape}."
+        )
+
+    if "VirtualSites" in interchange.handlers:
+        if len(interchange["VirtualSites"].slot_map) > 0:
+            raise NotImplementedError(
+                "Cannot yet compute reference energies while virtual sites are present."
+            )
+
+    if "Buckingham-6" in interchange.handlers:
+        raise UnsupportedExportError(
+            "Cannot compute reference energies of Buckingham-6 interactions."
+        )
+
+    box = None if interchange.box is None else interchange.box.m_as(unit.nanometer)
+
+    n_frames = positions.shape[0]
+
+    energies = {
+        "Bond": _get_bond_energies(interchange, positions),
+        "Angle": _get_angle_energies(interchange, positions),
+        "Torsion": _get_torsion_energies(interchange, positions),
+    }
+
+    if "vdW" in interchange.handlers:
+        vdw, electrostatics = _get_nonbonded_energies(interchange, positions, box)
+        energies["vdW"] = vdw
+        energies["Electrostatics"] = electrostatics
+    else:
+        energies["vdW"] = np.zeros(n_frames)
+        energies["Electrostatics"] = np.zeros(n_frames)
+
+    return BatchEnergyReport(
+        energies={key: value * kj_mol for key, value in energies.items()}
+    )
+
+
+def _to_nanometer_array(positions) -> np.ndarray:
+    """Convert positions, assumed to be in nanometers if not tagged with units, to an array."""
+    if isinstance(positions, openmm_unit.Quantity):
+        positions = from_openmm(positions)
+    if isinstance(positions, unit.Quantity):
+        positions = positions.m_as(unit.nanometer)
+    return np.asarray(positions, dtype=float)
+
+
+def _get_bond_energies(interchange: "Interchange", positions: np.ndarray) -> np.ndarray:
+    energies = np.zeros(positions.shape[0])
+
+    if "Bonds" not in interchange.handlers:
+        return energies
+
+    bond_handler = interchange["Bonds"]
+    bond_arrays = bond_handler.to_arrays()
+
+    if bond_arrays.n_terms == 0:
+        return energies
+
+    lengths = bond_arrays.term_parameter("length", unit.nanometer)
+    ks = bond_arrays.term_parameter("k", kj_mol / unit.nanometer ** 2)
+    indices = bond_arrays.atom_indices
+
+    if "Constraints" in interchange.handlers:
+        constrained = interchange["Constraints"].slot_map
+        # As in the OpenMM export, constrained bonds do not contribute to the energy
+        interacting = np.fromiter(
+            (top_key not in constrained for top_key in bond_handler.slot_map),
+            dtype=bool,
+            count=bond_arrays.n_terms,
+        )
+        indices, lengths, ks = (
+            indices[interacting],
+            lengths[interacting],
+            ks[interacting],
+        )
+
+    distances = _get_distances(positions, indices[:, 0], indices[:, 1])
+
+    return np.sum(0.5 * ks * (distances - lengths) ** 2, axis=-1)
+
+
+def _get_angle_energies(
+    interchange: "Interchange", positions: np.ndarray
+) -> np.ndarray:
+    energies = np.zeros(positions.shape[0])
+
+    if "Angles" not in interchange.handlers:
+        return energies
+
+    angle_arrays = interchange["Angles"].to_arrays()
+
+    if angle_arrays.n_terms == 0:
+        return energies
+
+    ks = angle_arrays.term_parameter("k", kj_mol / unit.radian ** 2)
+    equilibrium_angles = angle_arrays.term_parameter("angle", unit.radian)
+
+    angles = _get_angles(positions, angle_arrays.atom_indices)
+
+    return np.sum(0.5 * ks * (angles - equilibrium_angles) ** 2, axis=-1)
+
+
+def _get_torsion_energies(
+    interchange: "Interchange", positions: np.ndarray
+) -> np.ndarray:
+    energies = np.zeros(positions.shape[0])
+
+    for handler_name in ["ProperTorsions", "ImproperTorsions"]:
+        if handler_name not in interchange.handlers:
+            continue
+
+        torsion_arrays = interchange[handler_name].to_arrays()
+
+        if torsion_arrays.n_terms == 0:
+            continue
+
+        ks = torsion_arrays.term_parameter("k", kj_mol)
+        periodicities = torsion_arrays.term_parameter("periodicity")
+        phases = torsion_arrays.term_parameter("phase", unit.radian)
+
+        if "idivf" in torsion_arrays.parameter_names:
+            idivfs = torsion_arrays.term_parameter("idivf")
+            if np.any(idivfs == 0):
+                raise RuntimeError("Found an idivf of 0.")
+            ks = ks / idivfs
+
+        dihedrals = _get_dihedrals(positions, torsion_arrays.atom_indices)
+
+        energies += np.sum(
+            ks * (1 + np.cos(periodicities * dihedrals - phases)), axis=-1
+        )
+
+    if "RBTorsions" in interchange.handlers:
+        rb_arrays = interchange["RBTorsions"].to_arrays()
+
+        if rb_arrays.n_terms > 0:
+            # As in openmm.RBTorsionForce, the polymer convention is used
+            cos_psi = np.cos(_get_dihedrals(positions, rb_arrays.atom_indices) - np.pi)
+
+            for power in range(6):
+                coefficients = rb_arrays.term_parameter(f"C{power}", kj_mol)
+                energies += np.sum(coefficients * cos_psi ** power, axis=-1)
+
+    return energies
+
+
+def _get_nonbonded_energies(
+    interchange: "Interchange", positions: np.ndarray, box: Optional[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the vdW and electrostatics energies, in kJ/mol, of each frame."""
+    vdw_handler = interchange["vdW"]
+    electrostatics_handler = interchange["Electrostatics"]
+
+    vdw_method = vdw_handler.method.lower()
+    electrostatics_method = electrostatics_handler.method.lower()
+
+    if vdw_handler.mixing_rule not in ["lorentz-berthelot", "geometric"]:
+        raise UnsupportedExportError(
+            f"Mixing rule `{vdw_handler.mixing_rule}` is not supported. Supported "
+            "values are `lorentz-berthelot` and `geometric`."
+        )
+
+    if vdw_method == "cutoff":
+        vdw_cutoff = vdw_handler.cutoff.m_as(unit.nanometer)
+        switch_width = getattr(vdw_handler, "switch_width", None)
+        if switch_width is not None and switch_width.m > 0.0:
+            switching_distance = vdw_cutoff - switch_width.m_as(unit.nanometer)
+            if switching_distance < 0:
+                raise UnsupportedCutoffMethodError(
+                    "Found a 'switch_width' greater than the cutoff distance. It's not clear "
+                    "what this means and it's probably invalid. Found "
+                    f"switch_width{vdw_handler.switch_width} and cutoff {vdw_handler.cutoff}"
+                )
+        else:
+            switching_distance = None
+    elif vdw_method == "no-cutoff":
+        vdw_cutoff, switching_distance = None, None
+    else:
+        raise UnimplementedCutoffMethodError(
+            f"vdW method {vdw_method} is not supported by the reference engine."
+        )
+
+    if electrostatics_method == "pme" and box is None:
+        electrostatics_method = "no-cutoff"
+
+    if electrostatics_method in ["cutoff", "reaction-field"]:
+        electrostatics_cutoff = electrostatics_handler.cutoff.m_as(unit.nanometer)
+    elif electrostatics_method == "no-cutoff":
+        electrostatics_cutoff = None
+    else:
+        raise UnimplementedCutoffMethodError(
+            f"Electrostatics method {electrostatics_method} is not supported by the "
+            "reference engine."
+        )
+
+    charges, sigmas, epsilons = _get_nonbonded_particle_parameters(interchange)
+    geometric_sigmas = vdw_handler.mixing_rule == "geometric"
+
+    pairs_12, pairs_13, pairs_14 = _get_bonded_pairs(interchange.topology.mdtop)
+
+    n_atoms = positions.shape[1]
+    n_frames = positions.shape[0]
+
+    vdw = np.zeros(n_frames)
+    electrostatics = np.zeros(n_frames)
+
+    # Excluded and 1-4 pairs, encoded as i * n_atoms + j with i < j
+    bonded_pairs = np.concatenate([pairs_12, pairs_13, pairs_14])
+    excluded = np.unique(bonded_pairs[:, 0] * n_atoms + bonded_pairs[:, 1])
+
+    max_pairs = max(1, _MAX_PAIR_DISTANCES // max(1, n_frames))
+
+    for chunk1, chunk2 in _iterate_pairs(n_atoms, excluded, max_pairs):
+        distances = _get_distances(positions, chunk1, chunk2, box)
+
+        lj = _get_lennard_jones_energies(
+            distances,
+            _mix_sigmas(sigmas[chunk1], sigmas[chunk2], geometric_sigmas),
+            np.sqrt(epsilons[chunk1] * epsilons[chunk2]),
+        )
+        if switching_distance is not None:
+            lj = lj * _get_switching_function(distances, switching_distance, vdw_cutoff)
+        if vdw_cutoff is not None:
+            lj = np.where(distances < vdw_cutoff, lj, 0.0)
+        vdw += lj.sum(axis=-1)
+
+        electrostatics += _get_coulomb_energies(
+            distances,
+            charges[chunk1] * charges[chunk2],
+            electrostatics_cutoff,
+            reaction_field=electrostatics_method == "reaction-field",
+        ).sum(axis=-1)
+
+    if len(pairs_14) > 0:
+        atom1, atom2 = pairs_14[:, 0], pairs_14[:, 1]
+
+        distances = _get_distances(positions, atom1, atom2, box)
+
+        lj_14 = _get_lennard_jones_energies(
+            distances,
+            _mix_sigmas(sigmas[atom1], sigmas[atom2], geometric_sigmas),
+            np.sqrt(epsilons[atom1] * epsilons[atom2]),
+        )
+        coulomb_14 = _get_coulomb_energies(
+            distances, charges[atom1] * charges[atom2], None
+        )
+
+        vdw += vdw_handler.scale_14 * lj_14.sum(axis=-1)
+        electrostatics += electrostatics_handler.scale_14 * coulomb_14.sum(axis=-1)
+
+    return vdw, electrostatics
+
+
+def _iterate_pairs(
+    n_atoms: int, excluded: np.ndarray, max_pairs: int
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Yield the pairs of atoms i < j, except excluded pairs, in blocks of consecutive i.
+
+    ``excluded`` holds the sorted codes i * n_atoms + j of the pairs to skip. Blocks span
+    at most ``max_pairs`` pairs, unless a single atom i has more partners, so that all
+    pairs are never stored at once.
+    """
+    # Atom i is paired with the n_atoms - 1 - i atoms after it
+    n_partners = np.arange(n_atoms - 1, -1, -1)
+    ends = np.cumsum(n_partners)
+
+    start = 0
+    while start < n_atoms - 1:
+        offset = ends[start] - n_partners[start]
+        stop = int(np.searchsorted(ends, offset + max_pairs, side="right"))
+        stop = min(max(stop, start + 1), n_atoms)
+
+        counts = n_partners[start:stop]
+        atom1 = np.repeat(np.arange(start, stop), counts)
+        row_offsets = np.repeat(np.cumsum(counts) - counts, counts)
+        atom2 = atom1 + 1 + np.arange(len(atom1)) - row_offsets
+
+        # Only the excluded pairs of atoms in this block need to be checked
+        first, last = np.searchsorted(excluded, [start * n_atoms, stop * n_atoms])
+        included = ~np.isin(atom1 * n_atoms + atom2, excluded[first:last])
+
+        yield atom1[included], atom2[included]
+
+        start = stop
+
+
+def _mix_sigmas(
+    sigma1: np.ndarray, sigma2: np.ndarray, geometric: bool = False
+) -> np.ndarray:
+    if geometric:
+        return np.sqrt(sigma1 * sigma2)
+    return 0.5 * (sigma1 + sigma2)
+
+
+def _get_lennard_jones_energies(
+    distances: np.ndarray, sigmas: np.ndarray, epsilons: np.ndarray
+) -> np.ndarray:
+    sigma_r_6 = (sigmas / distances) ** 6
+    return 4 * epsilons * (sigma_r_6 ** 2 - sigma_r_6)
+
+
+def _get_switching_function(
+    distances: np.ndarray, switching_distance: float, cutoff: float
+) -> np.ndarray:
+    """Return the switching function applied by OpenMM to interactions beyond the switching distance."""
+    x = np.clip(
+        (distances - switching_distance) / (cutoff - switching_distance), 0.0, 1.0
+    )
+    return 1 - 10 * x ** 3 + 15 * x ** 4 - 6 * x ** 5
+
+
+def _get_coulomb_energies(
+    distances: np.ndarray,
+    charge_products: np.ndarray,
+    cutoff: Optional[float],
+    reaction_field: bool = False,
+) -> np.ndarray:
+    if cutoff is None:
+        return _COULOMB_CONSTANT * charge_products / distances
+
+    if reaction_field:
+        k_rf = (_REACTION_FIELD_DIELECTRIC - 1) / (
+            (2 * _REACTION_FIELD_DIELECTRIC + 1) * cutoff ** 3
+        )
+        c_rf = 1 / cutoff + k_rf * cutoff ** 2
+        shifted_inverse_distances = 1 / distances + k_rf * distances ** 2 - c_rf
+        energies = _COULOMB_CONSTANT * charge_products * shifted_inverse_distances
+    else:
+        energies = _COULOMB_CONSTANT * charge_products / distances
+
+    return np.where(distances < cutoff, energies, 0.0)
+
+
+def _get_displacements(
+    positions: np.ndarray,
+    atom1: np.ndarray,
+    atom2: np.ndarray,
+    box: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Return the vectors from atom1 to atom2 in each frame, of shape (n_frames, n_pairs, 3).
+
+    If ``box`` is given, the minimum image convention is applied, assuming a box in the
+    reduced form used by OpenMM.
+    """
+    displacements = positions[:, atom2] - positions[:, atom1]
+
+    if box is not None:
+        for axis in [2, 1, 0]:
+            shifts = np.round(displacements[..., axis] / box[axis, axis])
+            displacements = displacements - shifts[..., np.newaxis] * box[axis]
+
+    return displacements
+
+
+def _get_distances(
+    positions: np.ndarray,
+    atom1: np.ndarray,
+    atom2: np.ndarray,
+    box: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    return np.linalg.norm(_get_displacements(positions, atom1, atom2, box), axis=-1)
+
+
+def _get_angles(positions: np.ndarray, atom_indices: np.ndarray) -> np.ndarray:
+    """Return the angles, in radians, between the atoms in each row of ``atom_indices``."""
+    vectors1 = _get_displacements(positions, atom_indices[:, 1], atom_indices[:, 0])
+    vectors2 = _get_displacements(positions, atom_indices[:, 1], atom_indices[:, 2])
+
+    cosines = np.sum(vectors1 * vectors2, axis=-1) / (
+        np.linalg.norm(vectors1, axis=-1) * np.linalg.norm(vectors2, axis=-1)
+    )
+
+    return np.arccos(np.clip(cosines, -1.0, 1.0))
+
+
+def _get_dihedrals(positions: np.ndarray, atom_indices: np.ndarray) -> np.ndarray:
+    """Return the dihedral angles, in radians, defined by each row of ``atom_indices``."""
+    bond1 = _get_displacements(positions, atom_indices[:, 0], atom_indices[:, 1])
+    bond2 = _get_displacements(positions, atom_indices[:, 1], atom_indices[:, 2])
+    bond3 = _get_displacements(positions, atom_indices[:, 2], atom_indices[:, 3])
+
+    normal1 = np.cross(bond1, bond2)
+    normal2 = np.cross(bond2, bond3)
+
+    return np.arctan2(
+        np.linalg.norm(bond2, axis=-1) * np.sum(bond1 * normal2, axis=-1),
+        np.sum(normal1 * normal2, axis=-1),
+    )
@@ -1,14 +1,15 @@
 """Storing and processing results of energy evaluations."""
 import warnings
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 from openff.units import unit
 from pydantic import validator
 
 from openff.interchange.exceptions import EnergyError, MissingEnergyError
 from openff.interchange.models import DefaultModel
-from openff.interchange.types import FloatQuantity
+from openff.interchange.types import ArrayQuantity, FloatQuantity
 
 kj_mol = unit.kilojoule / unit.mol
 
@@ -174,3 +175,62 @@ class EnergyReport(DefaultModel):
             f"vdW:           \t\t{self['vdW']}\n"
             f"Electrostatics:\t\t{self['Electrostatics']}\n"
         )
+
+
+class BatchEnergyReport(DefaultModel):
+    """
+    A lightweight class containing the energies of many frames, i.e. conformers, of a system.
+
+    Each energy component is stored as an array with one entry per frame. Indexing a
+    report with an integer returns the `EnergyReport` of a single frame.
+
+    .. warning :: This API is experimental and subject to change.
+    """
+
+    energies: Dict[str, ArrayQuantity] = dict()
+
+    @validator("energies")
+    def validate_energies(cls, v: Dict) -> Dict:
+        for key, val in v.items():
+            if not isinstance(val, unit.Quantity):
+                v[key] = ArrayQuantity.validate_type(val)
+        return v
+
+    @property
+    def n_frames(self) -> int:
+        """The number of frames in this report."""
+        for energies in self.energies.values():
+            return len(energies)
+        return 0
+
+    def __len__(self) -> int:
+        return self.n_frames
+
+    def __getitem__(
+        self, item: Union[str, int]
+    ) -> Optional[Union[ArrayQuantity, EnergyReport]]:
+        if isinstance(item, (int, np.integer)):
+            return EnergyReport(
+                energies={key: val[item] for key, val in self.energies.items()}
+            )
+        if type(item) != str:
+            raise LookupError(
+                "Only str and int arguments can be currently be used for lookups.\n"
+                f"Found item {item} of type {type(item)}"
+            )
+        if item in self.energies.keys():
+            return self.energies[item]
+        if item.lower() == "total":
+            return sum(self.energies.values())  # type: ignore[return-value]
+        else:
+            return None
+
+    def to_reports(self) -> List[EnergyReport]:
+        """Return the `EnergyReport` of each frame."""
+        return [self[index] for index in range(self.n_frames)]  # type: ignore[misc]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return a pandas DataFrame with the energies, in kJ/mol, of each frame."""
+        return pd.DataFrame(
+            {key: val.m_as(kj_mol) for key, val in self.energies.items()}
+        )
@@ -11,9 +11,18 @@ from openmm import app
 from openmm import unit as openmm_unit
 
 from openff.interchange.components.interchange import Interchange
+from openff.interchange.components.potentials import Potential
 from openff.interchange.drivers import get_openmm_energies
-from openff.interchange.drivers.openmm import _get_openmm_energies
+from openff.interchange.drivers.openmm import (
+    _get_openmm_energies,
+    get_openmm_energies_batch,
+)
+from openff.interchange.drivers.reference import (
+    get_reference_energies,
+    get_reference_energies_batch,
+)
 from openff.interchange.drivers.report import EnergyError, EnergyReport
+from openff.interchange.models import PotentialKey, TopologyKey
 from openff.interchange.testing.utils import (
     HAS_GROMACS,
     HAS_LAMMPS,
@@ -551,3 +560,229 @@ def test_interpolated_parameters(smi):
             pytest.fail(
                 f"Found {key} energy difference of {energy_diff} kJ/mol between GROMACS and OpenMM exports"
             )
+
+
+@pytest.mark.parametrize("smi", ["CCO", "C1CCC1", "c1ccccc1O"])
+def test_reference_energies(smi):
+    """Test that energies computed with NumPy match those of a toolkit-created system."""
+    parsley = ForceField("openff_unconstrained-1.0.0.offxml")
+
+    molecule = Molecule.from_smiles(smi)
+    molecule.generate_conformers(n_conformers=5)
+    topology = molecule.to_topology()
+
+    interchange = Interchange.from_smirnoff(parsley, topology)
+    # Non-periodic systems are created by the toolkit without cutoffs
+    interchange["vdW"].method = "no-cutoff"
+
+    positions = np.stack(
+        [
+            conformer.value_in_unit(openmm_unit.nanometer)
+            for conformer in molecule.conformers
+        ]
+    )
+
+    energies = get_reference_energies_batch(interchange, positions)
+
+    assert len(energies) == molecule.n_conformers
+
+    toolkit_system = parsley.create_openmm_system(topology)
+
+    for index, conformer in enumerate(molecule.conformers):
+        reference = _get_openmm_energies(
+            toolkit_system, box_vectors=None, positions=conformer
+        )
+
+        energies[index].compare(
+            reference,
+            custom_tolerances={
+                "vdW": 1e-2 * kj_mol,
+                "Electrostatics": 1e-2 * kj_mol,
+            },
+        )
+
+    interchange.positions = molecule.conformers[0]
+
+    assert get_reference_energies(interchange)["Total"].m_as(kj_mol) == pytest.approx(
+        energies["Total"][0].m_as(kj_mol)
+    )
+
+
+def test_reference_energies_cutoff_periodic():
+    """Test cut-off interactions between ions, which only interact through periodic images."""
+    parsley = ForceField("openff_unconstrained-1.0.0.offxml")
+
+    topology = Topology.from_molecules(
+        [Molecule.from_smiles("[Na+]"), Molecule.from_smiles("[Cl-]")]
+    )
+
+    interchange = Interchange.from_smirnoff(parsley, topology)
+    interchange.box = [2.5, 2.5, 2.5]
+    interchange["Electrostatics"].method = "cutoff"
+
+    charges = interchange["Electrostatics"].get_charge_array()
+    sigmas, epsilons = list(), list()
+    for index in range(2):
+        potential_key = interchange["vdW"].slot_map[TopologyKey(atom_indices=(index,))]
+        parameters = interchange["vdW"].potentials[potential_key].parameters
+        sigmas.append(parameters["sigma"].m_as(unit.nanometer))
+        epsilons.append(parameters["epsilon"].m_as(kj_mol))
+
+    sigma = 0.5 * (sigmas[0] + sigmas[1])
+    epsilon = np.sqrt(epsilons[0] * epsilons[1])
+
+    # The ions are 2.1 nm apart, but their closest periodic images are 0.4 nm apart,
+    # which is shorter than the switching distance
+    energies = get_reference_energies(
+        interchange, np.array([[0.1, 0.1, 0.1], [2.2, 0.1, 0.1]])
+    )
+
+    assert energies["Electrostatics"].m_as(kj_mol) == pytest.approx(
+        138.935456 * charges[0] * charges[1] / 0.4
+    )
+    assert energies["vdW"].m_as(kj_mol) == pytest.approx(
+        4 * epsilon * ((sigma / 0.4) ** 12 - (sigma / 0.4) ** 6)
+    )
+
+    # All images are beyond the cutoff
+    energies = get_reference_energies(
+        interchange, np.array([[0.1, 0.1, 0.1], [1.35, 1.35, 0.1]])
+    )
+
+    assert energies["Electrostatics"].m_as(kj_mol) == 0.0
+    assert energies["vdW"].m_as(kj_mol) == 0.0
+
+
+def test_reference_energies_reaction_field():
+    """Test reaction-field energies of a periodic system against OpenMM."""
+    parsley = ForceField("openff_unconstrained-1.0.0.offxml")
+
+    molecule = Molecule.from_smiles("CCO")
+    molecule.generate_conformers(n_conformers=1)
+    topology = Topology.from_molecules(2 * [molecule])
+    topology.box_vectors = 2.5 * np.eye(3) * openmm_unit.nanometer
+
+    conformer = molecule.conformers[0].value_in_unit(openmm_unit.nanometer)
+    conformer = conformer - conformer.mean(axis=0)
+
+    # The molecules are 1.7 nm apart, but only 0.8 nm from each other's periodic image
+    positions = np.vstack([conformer + 0.3, conformer + [2.0, 0.3, 0.3]])
+
+    interchange = Interchange.from_smirnoff(parsley, topology)
+    interchange.box = [2.5, 2.5, 2.5]
+    interchange["Electrostatics"].method = "reaction-field"
+
+    energies = get_reference_energies(interchange, positions)
+
+    # With a cutoff, OpenMM applies a reaction field with the same solvent dielectric
+    toolkit_system = parsley.create_openmm_system(topology)
+    for force in toolkit_system.getForces():
+        if isinstance(force, openmm.NonbondedForce):
+            force.setNonbondedMethod(openmm.NonbondedForce.CutoffPeriodic)
+            force.setUseDispersionCorrection(False)
+
+    reference = _get_openmm_energies(
+        toolkit_system,
+        box_vectors=interchange.box,
+        positions=positions * openmm_unit.nanometer,
+    )
+
+    energies.compare(
+        reference,
+        custom_tolerances={
+            "vdW": 1e-2 * kj_mol,
+            "Electrostatics": 1e-2 * kj_mol,
+        },
+    )
+
+
+def test_reference_energies_rb_torsions():
+    """Test Ryckaert-Bellemans torsion energies against dihedrals computed by MDTraj."""
+    import mdtraj as md
+
+    from openff.interchange.components.foyer import _RBTorsionHandler
+
+    parsley = ForceField("openff_unconstrained-1.0.0.offxml")
+
+    molecule = Molecule.from_smiles("CCCC")
+    molecule.generate_conformers(n_conformers=5)
+
+    interchange = Interchange.from_smirnoff(parsley, molecule.to_topology())
+    interchange["vdW"].method = "no-cutoff"
+    interchange.handlers.pop("ProperTorsions")
+    interchange.handlers.pop("ImproperTorsions", None)
+
+    # Values from the HC-CT-CT-HC torsion of OPLS-AA
+    coefficients = [0.6276, 1.8828, 0.0, -2.5104, 0.0, 0.0]
+
+    potential_key = PotentialKey(id="[*:1]~[*:2]~[*:3]~[*:4]")
+    rb_torsions = _RBTorsionHandler()
+    rb_torsions.potentials[potential_key] = Potential(
+        parameters={
+            f"C{power}": coefficient * kj_mol
+            for power, coefficient in enumerate(coefficients)
+        }
+    )
+    propers = [
+        tuple(atom.molecule_atom_index for atom in proper)
+        for proper in molecule.propers
+    ]
+    for proper in propers:
+        rb_torsions.slot_map[TopologyKey(atom_indices=proper)] = potential_key
+    interchange.handlers["RBTorsions"] = rb_torsions
+
+    positions = np.stack(
+        [
+            conformer.value_in_unit(openmm_unit.nanometer)
+            for conformer in molecule.conformers
+        ]
+    )
+
+    energies = get_reference_energies_batch(interchange, positions)
+
+    dihedrals = md.compute_dihedrals(
+        md.Trajectory(positions, interchange.topology.mdtop), propers
+    )
+    cos_psi = np.cos(dihedrals - np.pi)
+    expected = sum(
+        coefficient * np.sum(cos_psi ** power, axis=-1)
+        for power, coefficient in enumerate(coefficients)
+    )
+
+    np.testing.assert_allclose(energies["Torsion"].m_as(kj_mol), expected)
+
+
+@pytest.mark.parametrize("combine_nonbonded_forces", [True, False])
+def test_openmm_energies_batch(combine_nonbonded_forces):
+    """Test that energies of many frames match those computed one frame at a time."""
+    parsley = ForceField("openff_unconstrained-1.0.0.offxml")
+
+    molecule = Molecule.from_smiles("CCO")
+    molecule.generate_conformers(n_conformers=5)
+
+    interchange = Interchange.from_smirnoff(parsley, molecule.to_topology())
+    interchange.box = [4, 4, 4]
+
+    positions = np.stack(
+        [
+            conformer.value_in_unit(openmm_unit.nanometer)
+            for conformer in molecule.conformers
+        ]
+    )
+
+    energies = get_openmm_energies_batch(
+        interchange,
+        positions,
+        combine_nonbonded_forces=combine_nonbonded_forces,
+    )
+
+    assert len(energies) == molecule.n_conformers
+
+    for index, conformer in enumerate(molecule.conformers):
+        interchange.positions = conformer
+
+        energies[index].compare(
+            get_openmm_energies(
+                interchange, combine_nonbonded_forces=combine_nonbonded_forces
+            )
+        )
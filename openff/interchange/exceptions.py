@@ -120,6 +120,12 @@ class UnsupportedExportError(BaseException):
         return msg
 
 
+class UnsupportedImportError(BaseException):
+    """
+    Exception for attempting to read an unsupported or malformed file.
+    """
+
+
 class UnsupportedCombinationError(BaseException):
     """General exception for something going wrong in Interchange object combination."""
 
@@ -172,6 +178,12 @@ class UnitValidationError(ValueError):
     """
 
 
+class InterchangeValidationError(ValueError):
+    """
+    Exception for when ``Interchange.check_consistency`` finds invalid or inconsistent data.
+    """
+
+
 class NonbondedCompatibilityError(BaseException):
     """
     Exception for unsupported combination of nonbonded methods.
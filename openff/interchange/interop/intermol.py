@@ -196,12 +196,12 @@ def from_intermol_system(intermol_system: System) -> Interchange:
             def ensure_unique_key(
                 handler: Union[BaseProperTorsionHandler, BaseImproperTorsionHandler],
                 key: TopologyKey,
-            ) -> None:
-                if key in handler.slot_map:
-                    key.mult += 1  # type: ignore[operator]
-                    ensure_unique_key(handler, key)
+            ) -> TopologyKey:
+                while key in handler.slot_map:
+                    key = key.copy(update={"mult": key.mult + 1})  # type: ignore[operator]
+                return key
 
-            ensure_unique_key(handler, topology_key)
+            topology_key = ensure_unique_key(handler, topology_key)
 
             potential_key = PotentialKey(
                 id=(
@@ -370,10 +370,10 @@ def to_prmtop(interchange: "Interchange", file_path: Union[Path, str]):
         _write_text_blob(prmtop, text_blob)
 
         prmtop.write("%FLAG CHARGE\n" "%FORMAT(5E16.8)\n")
-        charges = [
-            charge.m_as(unit.e) * AMBER_COULOMBS_CONSTANT
-            for charge in interchange["Electrostatics"].charges.values()
-        ]
+        charges = interchange["Electrostatics"].get_charge_array(
+            interchange.topology.mdtop.n_atoms
+        )
+        charges *= AMBER_COULOMBS_CONSTANT
         text_blob = "".join([f"{val:16.8E}" for val in charges])
         _write_text_blob(prmtop, text_blob)
 
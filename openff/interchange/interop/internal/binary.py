@@ -0,0 +1,518 @@
+"""
+A binary, memory-mappable file format for Interchange objects.
+
+Files are uncompressed ZIP archives of ``.npy`` arrays, i.e. they can also be opened with
+``numpy.load``. The archive contains
+
+* ``metadata``, a JSON string (stored as a 0-d array) with the format version, the units
+  of positions and box vectors, and the class, scalar fields and parameter names and
+  units of each handler,
+* ``positions`` and ``box``, if present,
+* ``topology/*``, tables of atoms, residues, bonds and molecules, and
+* ``handlers/<name>/*``, the columns of ``PotentialArrays`` of each handler along with a
+  table of its potential keys and tables of any fields mapping virtual sites to values.
+
+Units are stored once per column of parameters. Array-valued parameters, i.e. the
+``charge_increments`` of virtual sites, are stored as ragged columns and interpolated
+(wrapped) potentials along with the potentials and coefficients they wrap. Because
+nothing is compressed, arrays can be memory-mapped directly from the archive and the slot
+map and potentials of each handler are only created when first accessed.
+"""
+import importlib
+import json
+import struct
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import mdtraj as md
+import numpy as np
+from openff.toolkit.topology import Molecule
+from openff.units import unit
+
+from openff.interchange.components.mdtraj import _OFFBioTop
+from openff.interchange.components.potentials import (
+    PotentialArrays,
+    PotentialHandler,
+    _LazyTrackedDict,
+)
+from openff.interchange.exceptions import UnsupportedImportError
+from openff.interchange.models import PotentialKey, VirtualSiteKey
+
+if TYPE_CHECKING:
+    from openff.interchange.components.interchange import Interchange
+
+_FORMAT_VERSION = 1
+
+# Handlers that store their potentials in a field other than `potentials`
+_POTENTIALS_ATTRIBUTES = {"Constraints": "constraints"}
+
+# Fields stored as arrays, not in the metadata
+_ARRAY_FIELDS = {"slot_map", "potentials", "constraints"}
+
+# Columns of PotentialArrays that are stored if they are not None
+_OPTIONAL_COLUMNS = (
+    "virtual_site_type",
+    "virtual_site_match",
+    "map_key",
+    "ragged_parameter_lengths",
+    "ragged_parameters",
+    "component_potential_index",
+    "component_coefficients",
+    "component_map_key",
+    "component_parameters",
+)
+
+# The size of the fixed part of a local file header in a ZIP archive
+_LOCAL_HEADER_SIZE = 30
+
+
+def to_file(interchange: "Interchange", file_path: Union[Path, str]) -> None:
+    """Write an Interchange object to a binary file."""
+    arrays: Dict[str, np.ndarray] = dict()
+    metadata: Dict = {"format_version": _FORMAT_VERSION, "handlers": dict()}
+
+    if interchange.positions is not None:
+        arrays["positions"] = np.asarray(interchange.positions.m)
+        metadata["positions_unit"] = str(interchange.positions.units)
+
+    if interchange.box is not None:
+        arrays["box"] = np.asarray(interchange.box.m)
+        metadata["box_unit"] = str(interchange.box.units)
+
+    if interchange.topology is not None:
+        arrays.update(_topology_to_arrays(interchange.topology))
+
+    for name, handler in interchange.handlers.items():
+        handler_arrays = handler.to_arrays()
+        prefix = f"handlers/{name}/"
+
+        arrays[prefix + "atom_indices"] = handler_arrays.atom_indices
+        arrays[prefix + "mult"] = handler_arrays.mult
+        arrays[prefix + "bond_order"] = handler_arrays.bond_order
+        arrays[prefix + "potential_index"] = handler_arrays.potential_index
+        arrays[prefix + "parameters"] = handler_arrays.parameters
+        for column in _OPTIONAL_COLUMNS:
+            values = getattr(handler_arrays, column)
+            if values is not None:
+                arrays[prefix + column] = values
+        for column, values in _potential_keys_to_arrays(
+            handler_arrays.potential_keys
+        ).items():
+            arrays[prefix + column] = values
+
+        fields, field_arrays = _get_handler_fields(handler)
+        for column, values in field_arrays.items():
+            arrays[prefix + column] = values
+
+        metadata["handlers"][name] = {
+            "class": f"{type(handler).__module__}:{type(handler).__qualname__}",
+            "fields": fields,
+            "parameter_names": [*handler_arrays.parameter_names],
+            "parameter_units": [str(units) for units in handler_arrays.parameter_units],
+            "ragged_parameter_names": [*handler_arrays.ragged_parameter_names],
+            "ragged_parameter_units": [
+                str(units) for units in handler_arrays.ragged_parameter_units
+            ],
+        }
+
+    arrays["metadata"] = np.array(json.dumps(metadata))
+
+    with zipfile.ZipFile(
+        file_path, mode="w", compression=zipfile.ZIP_STORED, allowZip64=True
+    ) as archive:
+        for key, value in arrays.items():
+            with archive.open(key + ".npy", mode="w", force_zip64=True) as member:
+                np.lib.format.write_array(member, value, allow_pickle=False)
+
+
+def from_file(
+    file_path: Union[Path, str],
+    handlers: Optional[Iterable[str]] = None,
+    mmap: bool = True,
+) -> "Interchange":
+    """
+    Read an Interchange object from a binary file written by ``to_file``.
+
+    Parameters
+    ----------
+    file_path
+        The path of the file to read.
+    handlers
+        The names of the handlers to load. By default, all handlers are loaded.
+    mmap
+        If True, arrays are memory-mapped from the file instead of being read into memory.
+
+    """
+    from openff.interchange.components.interchange import Interchange
+
+    arrays = _read_arrays(file_path, mmap=mmap)
+
+    if "metadata" not in arrays:
+        raise UnsupportedImportError(
+            f"File {file_path} is not an Interchange file (missing metadata)."
+        )
+
+    metadata = json.loads(str(arrays["metadata"][()]))
+
+    if metadata["format_version"] != _FORMAT_VERSION:
+        raise UnsupportedImportError(
+            f"File {file_path} uses version {metadata['format_version']} of the binary "
+            f"format, but only version {_FORMAT_VERSION} is supported."
+        )
+
+    interchange = Interchange()
+
+    if "topology/atom_name" in arrays:
+        interchange.topology = _topology_from_arrays(arrays)
+
+    if "positions" in arrays:
+        interchange.positions = unit.Quantity(
+            np.asarray(arrays["positions"]), metadata["positions_unit"]
+        )
+
+    if "box" in arrays:
+        interchange.box = unit.Quantity(np.asarray(arrays["box"]), metadata["box_unit"])
+
+    names = [*metadata["handlers"]] if handlers is None else [*handlers]
+
+    for name in names:
+        try:
+            handler_metadata = metadata["handlers"][name]
+        except KeyError:
+            raise UnsupportedImportError(
+                f"File {file_path} does not contain a handler named {name}. Found "
+                f"handlers {[*metadata['handlers']]}."
+            )
+        interchange.handlers[name] = _handler_from_arrays(
+            arrays, f"handlers/{name}/", handler_metadata
+        )
+
+    return interchange
+
+
+def _get_handler_fields(
+    handler: PotentialHandler,
+) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """
+    Get the fields of a handler other than its slot map and potentials.
+
+    Returns the JSON-serializable fields and the arrays storing fields that map virtual
+    sites to integers, i.e. ``virtual_site_key_topology_index_map``.
+    """
+    fields: Dict = dict()
+    field_arrays: Dict[str, np.ndarray] = dict()
+
+    for name in handler.__fields__:
+        if name in _ARRAY_FIELDS:
+            continue
+
+        value = getattr(handler, name)
+
+        if isinstance(value, unit.Quantity):
+            fields[name] = {
+                "val": np.asarray(value.m).tolist(),
+                "unit": str(value.units),
+            }
+        elif _is_virtual_site_map(value):
+            fields[name] = {"virtual_site_map": True}
+            for column, values in _virtual_site_map_to_arrays(value).items():
+                field_arrays[f"fields/{name}/{column}"] = values
+        elif isinstance(value, (dict, list, tuple, set)):
+            if value:
+                raise NotImplementedError(
+                    f"Field {name} of handler {handler.type} cannot be stored in the "
+                    "binary format."
+                )
+        else:
+            fields[name] = value
+
+    return fields, field_arrays
+
+
+def _handler_from_arrays(
+    arrays: Dict[str, np.ndarray], prefix: str, handler_metadata: Dict
+) -> PotentialHandler:
+    """Create a handler backed by (memory-mapped) arrays read from a file."""
+    module_name, class_name = handler_metadata["class"].split(":")
+    handler_class = getattr(importlib.import_module(module_name), class_name)
+
+    if not issubclass(handler_class, PotentialHandler):
+        raise UnsupportedImportError(
+            f"Class {handler_metadata['class']} is not a PotentialHandler."
+        )
+
+    fields = dict()
+    for name, value in handler_metadata["fields"].items():
+        if isinstance(value, dict) and value.get("virtual_site_map"):
+            fields[name] = _virtual_site_map_from_arrays(
+                arrays, f"{prefix}fields/{name}/"
+            )
+        elif isinstance(value, dict):
+            fields[name] = unit.Quantity(value["val"], value["unit"])
+        else:
+            fields[name] = value
+
+    handler_arrays = PotentialArrays(
+        atom_indices=arrays[prefix + "atom_indices"],
+        mult=arrays[prefix + "mult"],
+        bond_order=arrays[prefix + "bond_order"],
+        potential_index=arrays[prefix + "potential_index"],
+        potential_keys=lambda: _potential_keys_from_arrays(arrays, prefix),
+        parameter_names=handler_metadata["parameter_names"],
+        parameter_units=[unit(units) for units in handler_metadata["parameter_units"]],
+        parameters=arrays[prefix + "parameters"],
+        ragged_parameter_names=handler_metadata["ragged_parameter_names"],
+        ragged_parameter_units=[
+            unit(units) for units in handler_metadata["ragged_parameter_units"]
+        ],
+        **{
+            column: arrays[prefix + column]
+            for column in _OPTIONAL_COLUMNS
+            if prefix + column in arrays
+        },
+    )
+
+    potentials_attribute = _POTENTIALS_ATTRIBUTES.get(fields["type"], "potentials")
+
+    if potentials_attribute == "potentials":
+        return handler_class.from_arrays(handler_arrays, **fields)
+
+    handler = handler_class(**fields)
+    object.__setattr__(
+        handler, "slot_map", _LazyTrackedDict(handler_arrays.to_slot_map)
+    )
+    object.__setattr__(
+        handler, potentials_attribute, _LazyTrackedDict(handler_arrays.to_potentials)
+    )
+    return handler
+
+
+def _is_virtual_site_map(value: Any) -> bool:
+    if not isinstance(value, dict) or not value:
+        return False
+    return all(isinstance(key, VirtualSiteKey) for key in value)
+
+
+def _virtual_site_map_to_arrays(mapping: Dict[VirtualSiteKey, int]) -> Dict:
+    width = max((len(key.atom_indices) for key in mapping), default=0)
+    atom_indices = np.full((len(mapping), width), -1, dtype=np.int64)
+    for row, key in enumerate(mapping):
+        atom_indices[row, : len(key.atom_indices)] = key.atom_indices
+
+    return {
+        "atom_indices": atom_indices,
+        "type": np.array([key.type for key in mapping], dtype=str),
+        "match": np.array([key.match for key in mapping], dtype=str),
+        "value": np.array([*mapping.values()], dtype=np.int64),
+    }
+
+
+def _virtual_site_map_from_arrays(
+    arrays: Dict[str, np.ndarray], prefix: str
+) -> Dict[VirtualSiteKey, int]:
+    return {
+        VirtualSiteKey(
+            atom_indices=tuple(index for index in atom_indices if index >= 0),
+            type=type_,
+            match=match,
+        ): value
+        for atom_indices, type_, match, value in zip(
+            arrays[prefix + "atom_indices"].tolist(),
+            arrays[prefix + "type"].tolist(),
+            arrays[prefix + "match"].tolist(),
+            arrays[prefix + "value"].tolist(),
+        )
+    }
+
+
+def _potential_keys_to_arrays(potential_keys: List[PotentialKey]) -> Dict:
+    associated_handlers = [key.associated_handler for key in potential_keys]
+    return {
+        "potential_key_id": np.array([key.id for key in potential_keys], dtype=str),
+        "potential_key_mult": np.array(
+            [-1 if key.mult is None else key.mult for key in potential_keys],
+            dtype=np.int64,
+        ),
+        "potential_key_associated_handler": np.array(
+            ["" if handler is None else handler for handler in associated_handlers],
+            dtype=str,
+        ),
+        "potential_key_has_associated_handler": np.array(
+            [handler is not None for handler in associated_handlers], dtype=bool
+        ),
+        "potential_key_bond_order": np.array(
+            [
+                np.nan if key.bond_order is None else key.bond_order
+                for key in potential_keys
+            ],
+            dtype=np.float64,
+        ),
+    }
+
+
+def _potential_keys_from_arrays(
+    arrays: Dict[str, np.ndarray], prefix: str
+) -> List[PotentialKey]:
+    return [
+        PotentialKey(
+            id=id_,
+            mult=None if mult < 0 else mult,
+            associated_handler=associated_handler if has_associated_handler else None,
+            bond_order=None if np.isnan(bond_order) else bond_order,
+        )
+        for id_, mult, associated_handler, has_associated_handler, bond_order in zip(
+            arrays[prefix + "potential_key_id"].tolist(),
+            arrays[prefix + "potential_key_mult"].tolist(),
+            arrays[prefix + "potential_key_associated_handler"].tolist(),
+            arrays[prefix + "potential_key_has_associated_handler"].tolist(),
+            arrays[prefix + "potential_key_bond_order"].tolist(),
+        )
+    ]
+
+
+def _topology_to_arrays(topology: _OFFBioTop) -> Dict[str, np.ndarray]:
+    """Store the MDTraj topology and OpenFF molecules of a topology as tables."""
+    mdtop = topology.mdtop
+
+    reference_molecules: List[Molecule] = list()
+    reference_molecule_indices: Dict[int, int] = dict()
+    molecule_index = list()
+
+    for topology_molecule in topology.topology_molecules:
+        reference_molecule = topology_molecule.reference_molecule
+        if id(reference_molecule) not in reference_molecule_indices:
+            reference_molecule_indices[id(reference_molecule)] = len(
+                reference_molecules
+            )
+            reference_molecules.append(reference_molecule)
+        molecule_index.append(reference_molecule_indices[id(reference_molecule)])
+
+    return {
+        "topology/atom_name": np.array([atom.name for atom in mdtop.atoms], dtype=str),
+        "topology/atom_element": np.array(
+            [
+                -1 if atom.element is None else atom.element.atomic_number
+                for atom in mdtop.atoms
+            ],
+            dtype=np.int64,
+        ),
+        "topology/atom_residue": np.array(
+            [atom.residue.index for atom in mdtop.atoms], dtype=np.int64
+        ),
+        "topology/residue_name": np.array(
+            [residue.name for residue in mdtop.residues], dtype=str
+        ),
+        "topology/residue_seq": np.array(
+            [residue.resSeq for residue in mdtop.residues], dtype=np.int64
+        ),
+        "topology/residue_chain": np.array(
+            [residue.chain.index for residue in mdtop.residues], dtype=np.int64
+        ),
+        "topology/n_chains": np.array(mdtop.n_chains, dtype=np.int64),
+        "topology/bonds": np.array(
+            [(bond.atom1.index, bond.atom2.index) for bond in mdtop.bonds],
+            dtype=np.int64,
+        ).reshape(-1, 2),
+        "topology/molecule_smiles": np.array(
+            [
+                molecule.to_smiles(mapped=True, explicit_hydrogens=True)
+                for molecule in reference_molecules
+            ],
+            dtype=str,
+        ),
+        "topology/molecule_index": np.array(molecule_index, dtype=np.int64),
+    }
+
+
+def _topology_from_arrays(arrays: Dict[str, np.ndarray]) -> _OFFBioTop:
+    mdtop = md.Topology()
+
+    chains = [mdtop.add_chain() for _ in range(int(arrays["topology/n_chains"][()]))]
+    residues = [
+        mdtop.add_residue(name, chains[chain], resSeq=seq)
+        for name, seq, chain in zip(
+            arrays["topology/residue_name"].tolist(),
+            arrays["topology/residue_seq"].tolist(),
+            arrays["topology/residue_chain"].tolist(),
+        )
+    ]
+    atoms = [
+        mdtop.add_atom(
+            name,
+            None if element < 0 else md.element.Element.getByAtomicNumber(element),
+            residues[residue],
+        )
+        for name, element, residue in zip(
+            arrays["topology/atom_name"].tolist(),
+            arrays["topology/atom_element"].tolist(),
+            arrays["topology/atom_residue"].tolist(),
+        )
+    ]
+    for atom1, atom2 in arrays["topology/bonds"].tolist():
+        mdtop.add_bond(atoms[atom1], atoms[atom2])
+
+    reference_molecules = [
+        Molecule.from_mapped_smiles(smiles, allow_undefined_stereo=True)
+        for smiles in arrays["topology/molecule_smiles"].tolist()
+    ]
+
+    return _OFFBioTop.from_molecules(
+        mdtop,
+        [reference_molecules[index] for index in arrays["topology/molecule_index"]],
+    )
+
+
+def _read_arrays(file_path: Union[Path, str], mmap: bool) -> Dict[str, np.ndarray]:
+    """Read, or memory-map, all arrays stored in an uncompressed archive of .npy files."""
+    arrays: Dict[str, np.ndarray] = dict()
+
+    with zipfile.ZipFile(file_path) as archive, open(file_path, "rb") as file:
+        for info in archive.infolist():
+            if not info.filename.endswith(".npy"):
+                continue
+
+            key = info.filename[: -len(".npy")]
+
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                array = _memmap_member(file_path, file, info)
+                if array is not None:
+                    arrays[key] = array
+                    continue
+
+            with archive.open(info) as member:
+                arrays[key] = np.lib.format.read_array(member, allow_pickle=False)
+
+    return arrays
+
+
+def _memmap_member(
+    file_path: Union[Path, str], file, info: zipfile.ZipInfo
+) -> Optional[np.ndarray]:
+    """Memory-map the array stored in an uncompressed member, if it is not empty or 0-d."""
+    # The data of a stored member starts after its local header, whose variable length
+    # fields may differ from those in the central directory
+    file.seek(info.header_offset)
+    header = file.read(_LOCAL_HEADER_SIZE)
+    filename_length, extra_length = struct.unpack("<HH", header[26:30])
+    file.seek(info.header_offset + _LOCAL_HEADER_SIZE + filename_length + extra_length)
+
+    version = np.lib.format.read_magic(file)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+    else:
+        return None
+
+    if dtype.hasobject or len(shape) == 0 or 0 in shape:
+        return None
+
+    return np.memmap(
+        file_path,
+        dtype=dtype,
+        mode="r",
+        offset=file.tell(),
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
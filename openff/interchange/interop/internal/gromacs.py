@@ -1,7 +1,20 @@
 """Interfaces with GROMACS."""
 import math
+from collections import defaultdict
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Callable, Dict, Set, Tuple, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Callable,
+    DefaultDict,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import mdtraj as md
 import numpy as np
@@ -24,11 +37,12 @@ from openff.interchange.components.mdtraj import (
     _store_bond_partners,
 )
 from openff.interchange.components.potentials import Potential
-from openff.interchange.exceptions import UnsupportedExportError
+from openff.interchange.exceptions import MissingParametersError, UnsupportedExportError
 from openff.interchange.models import PotentialKey, TopologyKey, VirtualSiteKey
 
 if TYPE_CHECKING:
     from openff.interchange.components.interchange import Interchange
+    from openff.interchange.components.potentials import PotentialHandler
 
 
 def to_gro(openff_sys: "Interchange", file_path: Union[Path, str], decimal=8):
@@ -59,6 +73,14 @@ def to_gro(openff_sys: "Interchange", file_path: Union[Path, str], decimal=8):
     virtual_site_map = _build_virtual_site_map(openff_sys)
     n_particles += len(virtual_site_map)
 
+    if virtual_site_map:
+        virtual_site_positions = np.round(
+            openff_sys["VirtualSites"]
+            .get_positions(openff_sys.positions)
+            .m_as(unit.nanometer),
+            decimal,
+        )
+
     with open(path, "w") as gro:
         gro.write("Generated by OpenFF\n")
         gro.write(f"{n_particles}\n")
@@ -84,7 +106,7 @@ def to_gro(openff_sys: "Interchange", file_path: Union[Path, str], decimal=8):
                 )
             )
 
-        for virtual_site_key in virtual_site_map:
+        for row, virtual_site_key in enumerate(virtual_site_map):
             atom_name = "VS"
             residue_idx = 1
             residue_name = ""
@@ -96,9 +118,9 @@ def to_gro(openff_sys: "Interchange", file_path: Union[Path, str], decimal=8):
                     residue_name,
                     atom_name,
                     atom_index,
-                    0.0,
-                    0.0,
-                    0.0,
+                    virtual_site_positions[row, 0],
+                    virtual_site_positions[row, 1],
+                    virtual_site_positions[row, 2],
                 )
             )
 
@@ -230,17 +252,35 @@ def to_top(openff_sys: "Interchange", file_path: Union[Path, str]):
         _write_atomtypes(openff_sys, top_file, typemap, virtual_site_map)
         # TODO: Write [ nonbond_params ] section
 
-        # TODO: De-duplicate based on molecules
         # TODO: Handle special case of water
-        _write_moleculetype(top_file)
-        _write_atoms(top_file, openff_sys, typemap, virtual_site_map)
-        _write_valence(top_file, openff_sys)
-        _write_virtual_sites(
-            top_file,
-            openff_sys,
-            virtual_site_map,
-        )
-        _write_system(top_file, openff_sys)
+        _store_bond_partners(openff_sys.topology.mdtop)
+        molecule_types, molecules = _build_molecule_types(openff_sys, typemap)
+        slot_map_indices = _build_slot_map_indices(openff_sys)
+
+        for molecule_name, (start, stop) in molecule_types.items():
+            mdtop = _get_molecule_mdtop(openff_sys.topology.mdtop, start, stop)
+            _write_moleculetype(top_file, molecule_name)
+            _write_atoms(
+                top_file,
+                openff_sys,
+                typemap,
+                virtual_site_map,
+                mdtop=mdtop,
+                offset=start,
+            )
+            _write_valence(
+                top_file,
+                openff_sys,
+                mdtop=mdtop,
+                offset=start,
+                slot_map_indices=slot_map_indices,
+            )
+            _write_virtual_sites(
+                top_file,
+                openff_sys,
+                virtual_site_map,
+            )
+        _write_system(top_file, openff_sys, molecules)
 
 
 def _write_top_defaults(openff_sys: "Interchange", top_file: IO):
@@ -294,23 +334,45 @@ def _write_top_defaults(openff_sys: "Interchange", top_file: IO):
     )
 
 
-def _build_typemap(openff_sys: "Interchange") -> Dict:
+def _build_typemap(openff_sys: "Interchange") -> Dict[int, str]:
+    """
+    Construct a mapping between atom indices and atom type names.
+
+    Atoms of the same element with identical non-bonded parameters share an atom type.
+    """
     typemap = dict()
     elements: Dict[str, int] = dict()
+    atom_types: Dict[Tuple, str] = dict()
+    parameter_keys: Dict[Optional[PotentialKey], Tuple] = {None: tuple()}
+
+    if "vdW" in openff_sys.handlers:
+        vdw_handler = openff_sys.handlers["vdW"]
+    else:
+        vdw_handler = openff_sys.handlers.get("Buckingham-6")
 
     for atom in openff_sys.topology.mdtop.atoms:
         element_symbol = atom.element.symbol
-        # TODO: Use this key to condense, see parmed.openmm._process_nobonded
-        # parameters = _get_lj_parameters([*parameters.values()])
-        # key = tuple([*parameters.values()])
 
-        if element_symbol not in elements.keys():
-            elements[element_symbol] = 1
+        if vdw_handler is None:
+            pot_key = None
         else:
-            elements[element_symbol] += 1
+            pot_key = vdw_handler.slot_map.get(TopologyKey(atom_indices=(atom.index,)))
 
-        atom_type = f"{element_symbol}{elements[element_symbol]}"
-        typemap[atom.index] = atom_type
+        if pot_key not in parameter_keys:
+            parameter_keys[pot_key] = tuple(
+                (name, value.m, str(value.units))
+                for name, value in sorted(
+                    vdw_handler.potentials[pot_key].parameters.items()
+                )
+            )
+
+        type_key = (element_symbol, parameter_keys[pot_key])
+
+        if type_key not in atom_types:
+            elements[element_symbol] = elements.get(element_symbol, 0) + 1
+            atom_types[type_key] = f"{element_symbol}{elements[element_symbol]}"
+
+        typemap[atom.index] = atom_types[type_key]
 
     return typemap
 
@@ -334,6 +396,147 @@ def _build_virtual_site_map(interchange: "Interchange") -> Dict[VirtualSiteKey,
     return virtual_site_topology_index_map
 
 
+def _build_molecule_types(
+    openff_sys: "Interchange",
+    typemap: Dict[int, str],
+) -> Tuple[Dict[str, Tuple[int, int]], List[Tuple[str, int]]]:
+    """
+    Find the unique molecule types in a topology.
+
+    Molecules are identical if they have the same atom types, charges, residues, and
+    valence terms, with the same potentials assigned to each term. Returns a mapping
+    between the name of each molecule type and the range of atom indices of its first
+    instance, and the sequence of (molecule type name, count) runs that makes up the
+    topology. If any molecule does not span a contiguous range of atom indices, or the
+    system includes virtual sites, all atoms are written as a single molecule type.
+    """
+    mdtop = openff_sys.topology.mdtop
+    single_molecule_type = ({"MOL": (0, mdtop.n_atoms)}, [("MOL", 1)])
+
+    if "VirtualSites" in openff_sys.handlers or mdtop.n_atoms == 0:
+        return single_molecule_type
+
+    ranges = sorted(
+        (min(atom.index for atom in molecule), max(atom.index for atom in molecule))
+        for molecule in mdtop.find_molecules()
+    )
+
+    if sum(last - first + 1 for first, last in ranges) != mdtop.n_atoms:
+        return single_molecule_type
+
+    molecule_indices = np.empty(mdtop.n_atoms, dtype=int)
+    for molecule_index, (first, last) in enumerate(ranges):
+        molecule_indices[first : last + 1] = molecule_index
+
+    if "Electrostatics" in openff_sys.handlers:
+        charges = openff_sys.handlers["Electrostatics"].get_charge_array(mdtop.n_atoms)
+    else:
+        charges = None
+
+    atom_signatures: List[List[Tuple]] = [list() for _ in ranges]
+    term_signatures: List[Set[Tuple]] = [set() for _ in ranges]
+
+    for atom in mdtop.atoms:
+        molecule_index = molecule_indices[atom.index]
+        first_atom = mdtop.atom(ranges[molecule_index][0])
+
+        atom_signatures[molecule_index].append(
+            (
+                typemap[atom.index],
+                None if charges is None else charges[atom.index],
+                atom.residue.name,
+                atom.residue.index - first_atom.residue.index,
+            )
+        )
+
+    for handler_name, handler in openff_sys.handlers.items():
+        # Charges are compared per atom, whatever the keys they are assigned from
+        if handler_name == "Electrostatics":
+            continue
+
+        for top_key, pot_key in handler.slot_map.items():
+            molecule_index = molecule_indices[top_key.atom_indices[0]]
+            first = ranges[molecule_index][0]
+            term_signatures[molecule_index].add(
+                (
+                    handler_name,
+                    tuple(index - first for index in top_key.atom_indices),
+                    top_key.mult,
+                    pot_key,
+                )
+            )
+
+    signatures: Dict[Hashable, int] = dict()
+    molecule_type_indices = list()
+
+    for molecule_index in range(len(ranges)):
+        signature = (
+            tuple(atom_signatures[molecule_index]),
+            frozenset(term_signatures[molecule_index]),
+        )
+        if signature not in signatures:
+            signatures[signature] = molecule_index
+        molecule_type_indices.append(signatures[signature])
+
+    if len(signatures) == 1:
+        names = {0: "MOL"}
+    else:
+        names = {
+            molecule_index: f"MOL{count}"
+            for count, molecule_index in enumerate(signatures.values())
+        }
+
+    molecule_types = {
+        names[molecule_index]: (
+            ranges[molecule_index][0],
+            ranges[molecule_index][1] + 1,
+        )
+        for molecule_index in signatures.values()
+    }
+
+    molecules: List[Tuple[str, int]] = list()
+    for molecule_index in molecule_type_indices:
+        name = names[molecule_index]
+        if molecules and molecules[-1][0] == name:
+            molecules[-1] = (name, molecules[-1][1] + 1)
+        else:
+            molecules.append((name, 1))
+
+    return molecule_types, molecules
+
+
+def _get_molecule_mdtop(mdtop: md.Topology, start: int, stop: int) -> md.Topology:
+    """
+    Copy the atoms with indices in [start, stop), and the bonds between them, to a new topology.
+
+    Bond partners must already be stored on the atoms of ``mdtop``.
+    """
+    if start == 0 and stop == mdtop.n_atoms:
+        return mdtop
+
+    molecule_mdtop = md.Topology()
+    chain = molecule_mdtop.add_chain()
+    residues: Dict[int, md.core.topology.Residue] = dict()
+
+    for index in range(start, stop):
+        atom = mdtop.atom(index)
+        if atom.residue.index not in residues:
+            residues[atom.residue.index] = molecule_mdtop.add_residue(
+                atom.residue.name, chain, resSeq=atom.residue.resSeq
+            )
+        molecule_mdtop.add_atom(atom.name, atom.element, residues[atom.residue.index])
+
+    for index in range(start, stop):
+        for partner in mdtop.atom(index)._bond_partners:
+            if index < partner.index < stop:
+                molecule_mdtop.add_bond(
+                    molecule_mdtop.atom(index - start),
+                    molecule_mdtop.atom(partner.index - start),
+                )
+
+    return molecule_mdtop
+
+
 def _write_atomtypes(
     openff_sys: "Interchange",
     top_file: IO,
@@ -365,7 +568,13 @@ def _write_atomtypes_lj(
     top_file.write("[ atomtypes ]\n")
     top_file.write(";type, bondingtype, mass, charge, ptype, sigma, epsilon\n")
 
+    written_types: Set[str] = set()
+
     for atom_idx, atom_type in typemap.items():
+        if atom_type in written_types:
+            continue
+        written_types.add(atom_type)
+
         atom = openff_sys.topology.mdtop.atom(atom_idx)
         mass = atom.element.mass
         atomic_number = atom.element.atomic_number
@@ -421,7 +630,13 @@ def _write_atomtypes_buck(openff_sys: "Interchange", top_file: IO, typemap: Dict
         ";type, bondingtype, atomic_number, mass, charge, ptype, sigma, epsilon\n"
     )
 
+    written_types: Set[str] = set()
+
     for atom_idx, atom_type in typemap.items():
+        if atom_type in written_types:
+            continue
+        written_types.add(atom_type)
+
         atom = openff_sys.topology.atom(atom_idx)
         parameters = _get_buck_parameters(openff_sys, atom_idx)
         a = parameters["A"].to(unit.Unit("kilojoule / mol")).magnitude
@@ -444,11 +659,11 @@ def _write_atomtypes_buck(openff_sys: "Interchange", top_file: IO, typemap: Dict
         top_file.write("\n")
 
 
-def _write_moleculetype(top_file: IO):
+def _write_moleculetype(top_file: IO, molecule_name: str = "MOL"):
     """Write the [ moleculetype ] section."""
     top_file.write("[ moleculetype ]\n")
     top_file.write("; Name\tnrexcl\n")
-    top_file.write("MOL\t3\n\n")
+    top_file.write(f"{molecule_name}\t3\n\n")
 
 
 def _write_atoms(
@@ -456,25 +671,31 @@ def _write_atoms(
     openff_sys: "Interchange",
     typemap: Dict,
     virtual_site_map: Dict,
+    mdtop: Optional[md.Topology] = None,
+    offset: int = 0,
 ):
-    """Write the [ atoms ] and [ pairs ] sections for a molecule."""
+    """
+    Write the [ atoms ] and [ pairs ] sections for a molecule.
+
+    The molecule is described by ``mdtop``, defaulting to the whole topology, whose atom
+    indices are offset by ``offset`` from those in the topology of ``openff_sys``.
+    """
+    if mdtop is None:
+        mdtop = openff_sys.topology.mdtop
+
     top_file.write("[ atoms ]\n")
     top_file.write(";num, type, resnum, resname, atomname, cgnr, q, m\n")
 
-    charges = openff_sys.handlers["Electrostatics"].charges
+    charge_handler = openff_sys.handlers["Electrostatics"]
+    charges = charge_handler.get_charge_array(openff_sys.topology.mdtop.n_atoms)
 
-    for atom in openff_sys.topology.mdtop.atoms:
+    for atom in mdtop.atoms:
         atom_idx = atom.index
         mass = atom.element.mass
-        atom_type = typemap[atom.index]
+        atom_type = typemap[atom_idx + offset]
         res_idx = atom.residue.index
         res_name = str(atom.residue)
-        top_key = TopologyKey(atom_indices=(atom_idx,))
-        charge = charges[top_key].m_as(unit.e)
-        # TODO: Figure out why charge increments were applied as an array
-        # to the anchor atom involved in a BondChargeVirtualSite?
-        if type(charge) == np.ndarray:
-            charge = charge[0]
+        charge = charges[atom_idx + offset]
 
         top_file.write(
             "{:6d} {:18s} {:6d} {:8s} {:8s} {:6d} "
@@ -490,16 +711,15 @@ def _write_atoms(
             )
         )
 
+    if virtual_site_map:
+        virtual_site_charges = charge_handler.charges_with_virtual_sites
+
     for virtual_site_key, index in virtual_site_map.items():
         atom_idx = index
         atom_type = "VS"
         res_idx = 1
         res_name = "1"
-        charge
-        charge_handler = openff_sys.handlers["Electrostatics"]
-        charge = charge_handler.charges_with_virtual_sites[virtual_site_key].m_as(
-            unit.e
-        )
+        charge = virtual_site_charges[virtual_site_key].m_as(unit.e)
         mass = 0.0
 
         top_file.write(
@@ -519,7 +739,7 @@ def _write_atoms(
     top_file.write("[ pairs ]\n")
     top_file.write("; ai\taj\tfunct\n")
 
-    _store_bond_partners(openff_sys.topology.mdtop)
+    _store_bond_partners(mdtop)
 
     try:
         mixing_rule = openff_sys["vdW"].mixing_rule.lower()
@@ -529,14 +749,14 @@ def _write_atoms(
         scale_lj = openff_sys["Buckingham-6"].scale_14
 
     # Use a set to de-duplicate
-    pairs: Set[Tuple] = {*_iterate_pairs(openff_sys.topology.mdtop)}
+    pairs: Set[Tuple] = {*_iterate_pairs(mdtop)}
     for pair in pairs:
         indices = [a.index for a in pair]
         indices = sorted(indices)
-        parameters1 = _get_lj_parameters(openff_sys, indices[0])
+        parameters1 = _get_lj_parameters(openff_sys, indices[0] + offset)
         sigma1 = parameters1["sigma"].to(unit.nanometer).magnitude
         epsilon1 = parameters1["epsilon"].to(unit.Unit("kilojoule / mole")).magnitude
-        parameters2 = _get_lj_parameters(openff_sys, indices[1])
+        parameters2 = _get_lj_parameters(openff_sys, indices[1] + offset)
         sigma2 = parameters2["sigma"].to(unit.nanometer).magnitude
         epsilon2 = parameters2["epsilon"].to(unit.Unit("kilojoule / mole")).magnitude
         epsilon_mix = (epsilon1 * epsilon2) ** 0.5
@@ -758,14 +978,69 @@ def _write_virtual_sites(
 def _write_valence(
     top_file: IO,
     openff_sys: "Interchange",
+    mdtop: Optional[md.Topology] = None,
+    offset: int = 0,
+    slot_map_indices: Optional[Dict[str, DefaultDict]] = None,
 ):
-    """Write the [ bonds ], [ angles ], and [ dihedrals ] sections."""
-    _write_bonds(top_file, openff_sys)
-    _write_angles(top_file, openff_sys)
-    _write_dihedrals(top_file, openff_sys)
+    """
+    Write the [ bonds ], [ angles ], and [ dihedrals ] sections.
+
+    The molecule is described by ``mdtop``, defaulting to the whole topology, whose atom
+    indices are offset by ``offset`` from those in the topology of ``openff_sys``.
+    """
+    if mdtop is None:
+        mdtop = openff_sys.topology.mdtop
+
+    if slot_map_indices is None:
+        slot_map_indices = _build_slot_map_indices(openff_sys)
 
+    _write_bonds(top_file, openff_sys, mdtop, offset, slot_map_indices)
+    _write_angles(top_file, openff_sys, mdtop, offset, slot_map_indices)
+    _write_dihedrals(top_file, openff_sys, mdtop, offset, slot_map_indices)
 
-def _write_bonds(top_file: IO, openff_sys: "Interchange"):
+
+def _build_slot_map_index(
+    handler: "PotentialHandler",
+) -> DefaultDict[Tuple[int, ...], List[Tuple[TopologyKey, PotentialKey]]]:
+    """
+    Index the slot map of a handler by the sorted atom indices of each topology key.
+
+    Each value lists the (topology key, potential key) pairs involving exactly those atoms,
+    in the order in which they appear in the slot map, so that looking up the terms of one
+    bond, angle, or torsion does not require a scan of the whole slot map.
+    """
+    index: DefaultDict[
+        Tuple[int, ...], List[Tuple[TopologyKey, PotentialKey]]
+    ] = defaultdict(list)
+
+    for top_key, pot_key in handler.slot_map.items():
+        index[tuple(sorted(top_key.atom_indices))].append((top_key, pot_key))
+
+    return index
+
+
+def _build_slot_map_indices(openff_sys: "Interchange") -> Dict[str, DefaultDict]:
+    """Index the slot maps of the valence handlers written to GROMACS topology files."""
+    return {
+        handler_name: _build_slot_map_index(openff_sys.handlers[handler_name])
+        for handler_name in [
+            "Bonds",
+            "Angles",
+            "ProperTorsions",
+            "RBTorsions",
+            "ImproperTorsions",
+        ]
+        if handler_name in openff_sys.handlers
+    }
+
+
+def _write_bonds(
+    top_file: IO,
+    openff_sys: "Interchange",
+    mdtop: md.Topology,
+    offset: int,
+    slot_map_indices: Dict[str, DefaultDict],
+):
     if "Bonds" not in openff_sys.handlers.keys():
         return
 
@@ -773,71 +1048,85 @@ def _write_bonds(top_file: IO, openff_sys: "Interchange"):
     top_file.write("; ai\taj\tfunc\tr\tk\n")
 
     bond_handler = openff_sys.handlers["Bonds"]
+    bond_index = slot_map_indices["Bonds"]
 
-    for bond in openff_sys.topology.mdtop.bonds:
+    if bond_index:
+        bond_arrays = bond_handler.to_arrays()
+        rows = bond_arrays.potential_key_index
+        ks = bond_arrays.parameter("k", "kilojoule / mole / nanometer ** 2")
+        lengths = bond_arrays.parameter("length", unit.nanometer)
 
-        indices = tuple(sorted((bond.atom1.index, bond.atom2.index)))
-        found_match = False
-        for top_key in bond_handler.slot_map:
-            if top_key.atom_indices == indices:
-                pot_key = bond_handler.slot_map[top_key]
-                found_match = True
-                break
-            elif top_key.atom_indices == indices[::-1]:
-                pot_key = bond_handler.slot_map[top_key]
-                found_match = True
-                break
-            else:
-                found_match = False
+    for bond in mdtop.bonds:
 
-        if not found_match:
-            print(f"Failed to find parameters for bond with indices {indices}")
-            continue
+        indices = tuple(sorted((bond.atom1.index, bond.atom2.index)))
+        topology_indices = tuple(index + offset for index in indices)
 
-        params = bond_handler.potentials[pot_key].parameters
+        if topology_indices not in bond_index:
+            raise MissingParametersError(
+                f"Failed to find parameters for bond with indices {topology_indices}"
+            )
 
-        k = params["k"].m_as(unit.Unit("kilojoule / mole / nanometer ** 2"))
-        length = params["length"].to(unit.nanometer).magnitude
+        # Either ordering of the atoms in the topology key matches this bond
+        _, pot_key = bond_index[topology_indices][0]
+        row = rows[pot_key]
 
         top_file.write(
             "{:7d} {:7d} {:4s} {:.16g} {:.16g}\n".format(
                 indices[0] + 1,  # atom i
                 indices[1] + 1,  # atom j
                 str(1),  # bond type (functional form)
-                length,
-                k,
+                lengths[row],
+                ks[row],
             )
         )
 
-        del pot_key
-
     top_file.write("\n\n")
 
 
-def _write_angles(top_file: IO, openff_sys: "Interchange"):
+def _write_angles(
+    top_file: IO,
+    openff_sys: "Interchange",
+    mdtop: md.Topology,
+    offset: int,
+    slot_map_indices: Dict[str, DefaultDict],
+):
     if "Angles" not in openff_sys.handlers.keys():
         return
 
-    _store_bond_partners(openff_sys.topology.mdtop)
+    _store_bond_partners(mdtop)
 
     top_file.write("[ angles ]\n")
     top_file.write("; ai\taj\tak\tfunc\tr\tk\n")
 
     angle_handler = openff_sys.handlers["Angles"]
+    angle_index = slot_map_indices["Angles"]
 
-    for angle in _iterate_angles(openff_sys.topology.mdtop):
+    if angle_index:
+        angle_arrays = angle_handler.to_arrays()
+        rows = angle_arrays.potential_key_index
+        ks = angle_arrays.parameter("k", "kilojoule / mole / radian ** 2")
+        thetas = angle_arrays.parameter("angle", unit.degree)
+
+    for angle in _iterate_angles(mdtop):
         indices = (
             angle[0].index,
             angle[1].index,
             angle[2].index,
         )
-        for top_key in angle_handler.slot_map:
-            if top_key.atom_indices == indices:
-                pot_key = angle_handler.slot_map[top_key]
+        topology_indices = tuple(index + offset for index in indices)
+
+        matches = [
+            pot_key
+            for top_key, pot_key in angle_index.get(tuple(sorted(topology_indices)), [])
+            if top_key.atom_indices == topology_indices
+        ]
+
+        if not matches:
+            raise MissingParametersError(
+                f"Failed to find parameters for angle with indices {topology_indices}"
+            )
 
-        params = angle_handler.potentials[pot_key].parameters
-        k = params["k"].m_as(unit.Unit("kilojoule / mole / radian ** 2"))
-        theta = params["angle"].to(unit.degree).magnitude
+        row = rows[matches[-1]]
 
         top_file.write(
             "{:7d} {:7d} {:7d} {:4s} {:.16g} {:.16g}\n".format(
@@ -845,21 +1134,27 @@ def _write_angles(top_file: IO, openff_sys: "Interchange"):
                 indices[1] + 1,  # atom j
                 indices[2] + 1,  # atom k
                 str(1),  # angle type (functional form)
-                theta,
-                k,
+                thetas[row],
+                ks[row],
             )
         )
 
     top_file.write("\n\n")
 
 
-def _write_dihedrals(top_file: IO, openff_sys: "Interchange"):
+def _write_dihedrals(
+    top_file: IO,
+    openff_sys: "Interchange",
+    mdtop: md.Topology,
+    offset: int,
+    slot_map_indices: Dict[str, DefaultDict],
+):
     if "ProperTorsions" not in openff_sys.handlers:
         if "RBTorsions" not in openff_sys.handlers:
             if "ImproperTorsions" not in openff_sys.handlers:
                 return
 
-    _store_bond_partners(openff_sys.topology.mdtop)
+    _store_bond_partners(mdtop)
 
     top_file.write("[ dihedrals ]\n")
     top_file.write(";    i      j      k      l   func\n")
@@ -868,100 +1163,129 @@ def _write_dihedrals(top_file: IO, openff_sys: "Interchange"):
     proper_torsion_handler = openff_sys.handlers.get("ProperTorsions", [])
     improper_torsion_handler = openff_sys.handlers.get("ImproperTorsions", [])
 
+    def _get_pot_keys(index, indices):
+        """Get the potential keys, in slot map order, of the terms acting on these atoms in this order."""
+        topology_indices = tuple(i + offset for i in indices)
+        return [
+            pot_key
+            for top_key, pot_key in index.get(tuple(sorted(topology_indices)), [])
+            if top_key.atom_indices == topology_indices
+        ]
+
+    # Parameters are only looked up for terms found in an index, so empty handlers are skipped
+    proper_index = slot_map_indices.get("ProperTorsions", {})
+    rb_index = slot_map_indices.get("RBTorsions", {})
+    improper_index = slot_map_indices.get("ImproperTorsions", {})
+
+    if proper_index:
+        proper_arrays = proper_torsion_handler.to_arrays()
+        proper_rows = proper_arrays.potential_key_index
+        proper_ks = proper_arrays.parameter("k", "kilojoule / mol")
+        proper_periodicities = proper_arrays.parameter("periodicity")
+        proper_phases = proper_arrays.parameter("phase", unit.degree)
+        if "idivf" in proper_arrays.parameter_names:
+            proper_idivfs = proper_arrays.parameter("idivf")
+            # Potentials that do not define idivf are not divided
+            proper_idivfs[np.isnan(proper_idivfs)] = 1.0
+        else:
+            proper_idivfs = np.ones(proper_arrays.n_potentials)
+
+    if rb_index:
+        rb_arrays = rb_torsion_handler.to_arrays()
+        rb_rows = rb_arrays.potential_key_index
+        rb_coefficients = np.stack(
+            [rb_arrays.parameter(f"C{i}", "kilojoule / mol") for i in range(6)],
+            axis=1,
+        )
+
     # TODO: Ensure number of torsions written matches what is expected
-    for proper in _iterate_propers(openff_sys.topology.mdtop):
-        if proper_torsion_handler:
-            for top_key in proper_torsion_handler.slot_map:
-                indices = tuple(a.index for a in proper)
-                if top_key.atom_indices == indices:
-                    pot_key = proper_torsion_handler.slot_map[top_key]
-                    params = proper_torsion_handler.potentials[pot_key].parameters
-
-                    k = params["k"].to(unit.Unit("kilojoule / mol")).magnitude
-                    periodicity = int(params["periodicity"])
-                    phase = params["phase"].to(unit.degree).magnitude
-                    idivf = int(params["idivf"]) if "idivf" in params else 1
-                    top_file.write(
-                        "{:7d} {:7d} {:7d} {:7d} {:6d} {:16g} {:16g} {:7d}\n".format(
-                            indices[0] + 1,
-                            indices[1] + 1,
-                            indices[2] + 1,
-                            indices[3] + 1,
-                            1,
-                            phase,
-                            k / idivf,
-                            periodicity,
-                        )
+    for proper in _iterate_propers(mdtop):
+        indices = tuple(a.index for a in proper)
+        if proper_index:
+            for pot_key in _get_pot_keys(proper_index, indices):
+                row = proper_rows[pot_key]
+                idivf = int(proper_idivfs[row])
+                top_file.write(
+                    "{:7d} {:7d} {:7d} {:7d} {:6d} {:16g} {:16g} {:7d}\n".format(
+                        indices[0] + 1,
+                        indices[1] + 1,
+                        indices[2] + 1,
+                        indices[3] + 1,
+                        1,
+                        proper_phases[row],
+                        proper_ks[row] / idivf,
+                        int(proper_periodicities[row]),
                     )
+                )
         # This should be `if` if a single quartet can be subject to both proper and RB torsions
-        if rb_torsion_handler:
-            for top_key in rb_torsion_handler.slot_map:
-                indices = tuple(a.index for a in proper)
-                if top_key.atom_indices == indices:
-                    pot_key = rb_torsion_handler.slot_map[top_key]
-                    params = rb_torsion_handler.potentials[pot_key].parameters
-
-                    c0 = params["C0"].to(unit.Unit("kilojoule / mol")).magnitude
-                    c1 = params["C1"].to(unit.Unit("kilojoule / mol")).magnitude
-                    c2 = params["C2"].to(unit.Unit("kilojoule / mol")).magnitude
-                    c3 = params["C3"].to(unit.Unit("kilojoule / mol")).magnitude
-                    c4 = params["C4"].to(unit.Unit("kilojoule / mol")).magnitude
-                    c5 = params["C5"].to(unit.Unit("kilojoule / mol")).magnitude
-
-                    top_file.write(
-                        "{:7d} {:7d} {:7d} {:7d} {:6d} "
-                        "{:16g} {:16g} {:16g} {:16g} {:16g} {:16g} \n".format(
-                            indices[0] + 1,
-                            indices[1] + 1,
-                            indices[2] + 1,
-                            indices[3] + 1,
-                            3,
-                            c0,
-                            c1,
-                            c2,
-                            c3,
-                            c4,
-                            c5,
-                        )
+        if rb_index:
+            for pot_key in _get_pot_keys(rb_index, indices):
+                c0, c1, c2, c3, c4, c5 = rb_coefficients[rb_rows[pot_key]]
+
+                top_file.write(
+                    "{:7d} {:7d} {:7d} {:7d} {:6d} "
+                    "{:16g} {:16g} {:16g} {:16g} {:16g} {:16g} \n".format(
+                        indices[0] + 1,
+                        indices[1] + 1,
+                        indices[2] + 1,
+                        indices[3] + 1,
+                        3,
+                        c0,
+                        c1,
+                        c2,
+                        c3,
+                        c4,
+                        c5,
                     )
+                )
+
+    if improper_index:
+        improper_arrays = improper_torsion_handler.to_arrays()
+        improper_rows = improper_arrays.potential_key_index
+        improper_ks = improper_arrays.parameter("k", "kilojoule / mol")
+        improper_periodicities = improper_arrays.parameter("periodicity")
+        improper_phases = improper_arrays.parameter("phase", unit.degree)
+        improper_idivfs = improper_arrays.parameter("idivf")
 
     # TODO: Ensure number of torsions written matches what is expected
-    for improper in _iterate_impropers(openff_sys.topology.mdtop):
-        if improper_torsion_handler:
-            for top_key in improper_torsion_handler.slot_map:
-                indices = tuple(a.index for a in improper)
-                if indices == top_key.atom_indices:
-                    key = improper_torsion_handler.slot_map[top_key]
-                    params = improper_torsion_handler.potentials[key].parameters
-
-                    k = params["k"].to(unit.Unit("kilojoule / mol")).magnitude
-                    periodicity = int(params["periodicity"])
-                    phase = params["phase"].to(unit.degree).magnitude
-                    idivf = int(params["idivf"])
-                    top_file.write(
-                        "{:7d} {:7d} {:7d} {:7d} {:6d} {:.16g} {:.16g} {:.16g}\n".format(
-                            indices[0] + 1,
-                            indices[1] + 1,
-                            indices[2] + 1,
-                            indices[3] + 1,
-                            4,
-                            phase,
-                            k / idivf,
-                            periodicity,
-                        )
+    for improper in _iterate_impropers(mdtop):
+        if improper_index:
+            indices = tuple(a.index for a in improper)
+            for pot_key in _get_pot_keys(improper_index, indices):
+                row = improper_rows[pot_key]
+                idivf = int(improper_idivfs[row])
+                top_file.write(
+                    "{:7d} {:7d} {:7d} {:7d} {:6d} {:.16g} {:.16g} {:.16g}\n".format(
+                        indices[0] + 1,
+                        indices[1] + 1,
+                        indices[2] + 1,
+                        indices[3] + 1,
+                        4,
+                        improper_phases[row],
+                        improper_ks[row] / idivf,
+                        int(improper_periodicities[row]),
                     )
+                )
 
 
-def _write_system(top_file: IO, openff_sys: "Interchange"):
-    """Write the [ system ] section."""
+def _write_system(
+    top_file: IO,
+    openff_sys: "Interchange",
+    molecules: Optional[List[Tuple[str, int]]] = None,
+):
+    """Write the [ system ] and [ molecules ] sections."""
+    if molecules is None:
+        molecules = [("MOL", 1)]
+
     top_file.write("[ system ]\n")
     top_file.write("; name \n")
     top_file.write("System name\n\n")
 
     top_file.write("[ molecules ]\n")
     top_file.write("; Compound\tnmols\n")
-    # TODO: Write molecules separately
-    top_file.write("MOL\t1")
+    top_file.write(
+        "\n".join(f"{molecule_name}\t{count}" for molecule_name, count in molecules)
+    )
 
     top_file.write("\n")
 
@@ -1106,9 +1430,11 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
 
         interchange["vdW"].slot_map.update({topology_key: potential_key})
         # The vdw .potentials was constructed while parsing [ atomtypes ]
-        interchange["Electrostatics"].slot_map.update({topology_key: potential_key})
+        # Atoms sharing an atom type may have different charges, so key charges by atom
+        charge_key = PotentialKey(id=f"{atom_type}-{atom_number}")
+        interchange["Electrostatics"].slot_map.update({topology_key: charge_key})
         interchange["Electrostatics"].potentials.update(
-            {potential_key: Potential(parameters={"charge": charge})}
+            {charge_key: Potential(parameters={"charge": charge})}
         )
 
     def process_pair(interchange: Interchange, line: str):
@@ -1198,18 +1524,20 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
         def ensure_unique_key(
             handler: Union[BaseProperTorsionHandler, BaseImproperTorsionHandler],
             key: TopologyKey,
-        ):
-            if key in handler.slot_map:
-                key.mult += 1  # type: ignore[operator]
-                ensure_unique_key(handler, key)
+        ) -> TopologyKey:
+            while key in handler.slot_map:
+                key = key.copy(update={"mult": key.mult + 1})  # type: ignore[operator]
+            return key
 
         potential_key = PotentialKey(
             id="-".join(str(i) for i in topology_key.atom_indices),
         )
 
         if func == "1":
-            ensure_unique_key(interchange["ProperTorsions"], topology_key)
-            potential_key.mult = topology_key.mult
+            topology_key = ensure_unique_key(
+                interchange["ProperTorsions"], topology_key
+            )
+            potential_key = potential_key.copy(update={"mult": topology_key.mult})
 
             potential = Potential(
                 parameters={
@@ -1224,8 +1552,10 @@ def from_top(top_file: Union[Path, str], gro_file: Union[Path, str]):
             interchange["ProperTorsions"].potentials.update({potential_key: potential})
 
         elif func == "4":
-            ensure_unique_key(interchange["ImproperTorsions"], topology_key)
-            potential_key.mult = topology_key.mult
+            topology_key = ensure_unique_key(
+                interchange["ImproperTorsions"], topology_key
+            )
+            potential_key = potential_key.copy(update={"mult": topology_key.mult})
 
             potential = Potential(
                 parameters={
@@ -131,13 +131,15 @@ def _write_pair_coeffs(lmp_file: IO, openff_sys: Interchange, atom_type_map: Dic
     """Write the Pair Coeffs section of a LAMMPS data file."""
     lmp_file.write("Pair Coeffs\n\n")
 
-    vdw_handler = openff_sys["vdW"]
+    vdw_arrays = openff_sys["vdW"].to_arrays()
+    rows = vdw_arrays.potential_key_index
 
-    for atom_type_idx, smirks in atom_type_map.items():
-        params = vdw_handler.potentials[smirks].parameters
+    sigmas = vdw_arrays.parameter("sigma", unit.angstrom)
+    epsilons = vdw_arrays.parameter("epsilon", "kilocalorie / mole")
 
-        sigma = params["sigma"].to(unit.angstrom).magnitude
-        epsilon = params["epsilon"].to(unit.Unit("kilocalorie / mole")).magnitude
+    for atom_type_idx, smirks in atom_type_map.items():
+        sigma = sigmas[rows[smirks]]
+        epsilon = epsilons[rows[smirks]]
 
         lmp_file.write(f"{atom_type_idx + 1:d}\t{epsilon:.8g}\t{sigma:.8g}\n")
 
@@ -151,12 +153,16 @@ def _write_bond_coeffs(lmp_file: IO, openff_sys: Interchange):
     bond_handler = openff_sys.handlers["Bonds"]
     bond_type_map = dict(enumerate(bond_handler.potentials))
 
-    for bond_type_idx, smirks in bond_type_map.items():
-        params = bond_handler.potentials[smirks].parameters
+    bond_arrays = bond_handler.to_arrays()
+    rows = bond_arrays.potential_key_index
 
-        k = params["k"].to(unit.Unit("kilocalorie / mole / angstrom ** 2")).magnitude
-        k = k * 0.5  # Account for LAMMPS wrapping 1/2 into k
-        length = params["length"].to(unit.angstrom).magnitude
+    # Account for LAMMPS wrapping 1/2 into k
+    ks = bond_arrays.parameter("k", "kilocalorie / mole / angstrom ** 2") * 0.5
+    lengths = bond_arrays.parameter("length", unit.angstrom)
+
+    for bond_type_idx, smirks in bond_type_map.items():
+        k = ks[rows[smirks]]
+        length = lengths[rows[smirks]]
 
         lmp_file.write(f"{bond_type_idx+1:d} harmonic\t{k:.16g}\t{length:.16g}\n")
 
@@ -170,12 +176,16 @@ def _write_angle_coeffs(lmp_file: IO, openff_sys: Interchange):
     angle_handler = openff_sys.handlers["Angles"]
     angle_type_map = dict(enumerate(angle_handler.potentials))
 
-    for angle_type_idx, smirks in angle_type_map.items():
-        params = angle_handler.potentials[smirks].parameters
+    angle_arrays = angle_handler.to_arrays()
+    rows = angle_arrays.potential_key_index
+
+    # Account for LAMMPS wrapping 1/2 into k
+    ks = angle_arrays.parameter("k", "kilocalorie / mole / radian ** 2") * 0.5
+    thetas = angle_arrays.parameter("angle", unit.degree)
 
-        k = params["k"].to(unit.Unit("kilocalorie / mole / radian ** 2")).magnitude
-        k = k * 0.5  # Account for LAMMPS wrapping 1/2 into k
-        theta = params["angle"].to(unit.degree).magnitude
+    for angle_type_idx, smirks in angle_type_map.items():
+        k = ks[rows[smirks]]
+        theta = thetas[rows[smirks]]
 
         lmp_file.write(f"{angle_type_idx+1:d} harmonic\t{k:.16g}\t{theta:.16g}\n")
 
@@ -189,14 +199,18 @@ def _write_proper_coeffs(lmp_file: IO, openff_sys: Interchange):
     proper_handler = openff_sys.handlers["ProperTorsions"]
     proper_type_map = dict(enumerate(proper_handler.potentials))
 
-    for proper_type_idx, smirks in proper_type_map.items():
-        params = proper_handler.potentials[smirks].parameters
+    proper_arrays = proper_handler.to_arrays()
+    rows = proper_arrays.potential_key_index
 
-        k = params["k"].to(unit.Unit("kilocalorie / mole")).magnitude
-        n = int(params["periodicity"])
-        phase = params["phase"].to(unit.degree).magnitude
-        idivf = int(params["idivf"])
-        k = k / idivf
+    ks = proper_arrays.parameter("k", "kilocalorie / mole")
+    ks = ks / np.round(proper_arrays.parameter("idivf", unit.dimensionless))
+    periodicities = np.round(proper_arrays.parameter("periodicity")).astype(int)
+    phases = proper_arrays.parameter("phase", unit.degree)
+
+    for proper_type_idx, smirks in proper_type_map.items():
+        k = ks[rows[smirks]]
+        n = int(periodicities[rows[smirks]])
+        phase = phases[rows[smirks]]
 
         lmp_file.write(
             f"{proper_type_idx+1:d} fourier 1\t{k:.16g}\t{n:d}\t{phase:.16g}\n"
@@ -212,14 +226,18 @@ def _write_improper_coeffs(lmp_file: IO, openff_sys: Interchange):
     improper_handler = openff_sys.handlers["ImproperTorsions"]
     improper_type_map = dict(enumerate(improper_handler.potentials))
 
-    for improper_type_idx, smirks in improper_type_map.items():
-        params = improper_handler.potentials[smirks].parameters
+    improper_arrays = improper_handler.to_arrays()
+    rows = improper_arrays.potential_key_index
+
+    ks = improper_arrays.parameter("k", "kilocalorie / mole")
+    ks = ks / np.round(improper_arrays.parameter("idivf", unit.dimensionless))
+    periodicities = np.round(improper_arrays.parameter("periodicity")).astype(int)
+    phases = improper_arrays.parameter("phase", unit.degree)
 
-        k = params["k"].to(unit.Unit("kilocalorie / mole")).magnitude
-        n = int(params["periodicity"])
-        phase = params["phase"].to(unit.degree).magnitude
-        idivf = int(params["idivf"])
-        k = k / idivf
+    for improper_type_idx, smirks in improper_type_map.items():
+        k = ks[rows[smirks]]
+        n = int(periodicities[rows[smirks]])
+        phase = phases[rows[smirks]]
 
         # See https://lammps.sandia.gov/doc/improper_cvff.html
         # E_periodic = k * (1 + cos(n * theta - phase))
@@ -264,7 +282,7 @@ def _write_atoms(lmp_file: IO, openff_sys: Interchange, atom_type_map: Dict):
     electrostatics_handler = openff_sys.handlers["Electrostatics"]
     vdw_hander = openff_sys.handlers["vdW"]
 
-    charges = electrostatics_handler.charges
+    charges = electrostatics_handler.get_charge_array(openff_sys.topology.mdtop.n_atoms)
 
     for atom in openff_sys.topology.mdtop.atoms:
 
@@ -274,7 +292,7 @@ def _write_atoms(lmp_file: IO, openff_sys: Interchange, atom_type_map: Dict):
         pot_key = vdw_hander.slot_map[top_key]
         atom_type = atom_type_map_inv[pot_key]
 
-        charge = charges[top_key].m_as(unit.e)
+        charge = charges[atom.index]
         pos = openff_sys.positions[atom.index].to(unit.angstrom).magnitude
         lmp_file.write(
             "{:d}\t{:d}\t{:d}\t{:.8g}\t{:.8g}\t{:.8g}\t{:.8g}\n".format(
@@ -1,6 +1,16 @@
 """Interfaces with OpenMM."""
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import openmm
@@ -9,15 +19,14 @@ from openff.units import unit as off_unit
 from openff.units.openmm import from_openmm as from_openmm_unit
 from openmm import unit
 
+from openff.interchange.components.mdtraj import _get_bonded_pairs
 from openff.interchange.components.potentials import Potential
 from openff.interchange.exceptions import (
     UnimplementedCutoffMethodError,
     UnsupportedCutoffMethodError,
     UnsupportedExportError,
 )
-from openff.interchange.interop.parmed import _lj_params_from_potential
-from openff.interchange.models import PotentialKey, TopologyKey, VirtualSiteKey
-from openff.interchange.utils import pint_to_openmm
+from openff.interchange.models import PotentialKey, TopologyKey
 
 if TYPE_CHECKING:
     from openff.interchange.components.interchange import Interchange
@@ -32,7 +41,259 @@ kj_nm = kj_mol / unit.nanometer ** 2
 kj_rad = kj_mol / unit.radian ** 2
 
 
-def to_openmm(openff_sys, combine_nonbonded_forces: bool = False) -> openmm.System:
+def _get_bond_parameters(potential: Potential) -> Tuple:
+    parameters = potential.parameters
+    return (
+        parameters["length"].m_as(off_unit.nanometer),
+        parameters["k"].m_as(
+            off_unit.kilojoule / off_unit.nanometer ** 2 / off_unit.mol
+        ),
+    )
+
+
+def _get_angle_parameters(potential: Potential) -> Tuple:
+    parameters = potential.parameters
+    return (
+        parameters["angle"].m_as(off_unit.radian),
+        parameters["k"].m_as(off_unit.kilojoule / off_unit.rad / off_unit.mol),
+    )
+
+
+def _get_proper_torsion_parameters(potential: Potential) -> Tuple:
+    parameters = potential.parameters
+    idivf = parameters["idivf"].m_as(off_unit.dimensionless)
+    if idivf == 0:
+        raise RuntimeError("Found an idivf of 0.")
+    return (
+        int(round(parameters["periodicity"].m_as(off_unit.dimensionless))),
+        parameters["phase"].m_as(off_unit.radian),
+        parameters["k"].m_as(off_unit.kilojoule / off_unit.mol) / idivf,
+    )
+
+
+def _get_improper_torsion_parameters(potential: Potential) -> Tuple:
+    parameters = potential.parameters
+    idivf = int(parameters["idivf"])
+    return (
+        int(parameters["periodicity"]),
+        parameters["phase"].m_as(off_unit.radian),
+        parameters["k"].m_as(off_unit.kilojoule / off_unit.mol) / idivf,
+    )
+
+
+def _get_rb_torsion_parameters(potential: Potential) -> Tuple:
+    parameters = potential.parameters
+    return tuple(
+        parameters[f"C{i}"].m_as(off_unit.kilojoule / off_unit.mol) for i in range(6)
+    )
+
+
+# The name of the setter of each force and a function returning the arguments it takes,
+# after the term index and atom indices, for each valence handler
+_VALENCE_PARAMETER_SETTERS: Dict[str, Tuple[str, Callable[[Potential], Tuple]]] = {
+    "Bonds": ("setBondParameters", _get_bond_parameters),
+    "Angles": ("setAngleParameters", _get_angle_parameters),
+    "ProperTorsions": ("setTorsionParameters", _get_proper_torsion_parameters),
+    "ImproperTorsions": ("setTorsionParameters", _get_improper_torsion_parameters),
+    "RBTorsions": ("setTorsionParameters", _get_rb_torsion_parameters),
+}
+
+
+class OpenMMParameterMap:
+    """
+    A record of the OpenMM force terms that each potential in an Interchange was exported to.
+
+    Pass an instance to ``Interchange.to_openmm`` to populate it. After parameters of the
+    Interchange are modified, i.e. with ``PotentialHandler.set_force_field_parameters``,
+    ``update_parameters`` pushes the new parameters of only the changed potentials into the
+    exported system, and optionally a context created from it, without rebuilding either.
+
+    Supported handlers are "Bonds", "Angles", "ProperTorsions", "ImproperTorsions",
+    "RBTorsions", and "vdW". Changing vdW parameters also updates the 1-4 interactions of
+    the affected atoms.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Examples
+    --------
+    >>> parameter_map = OpenMMParameterMap()  # doctest: +SKIP
+    >>> system = interchange.to_openmm(parameter_map=parameter_map)  # doctest: +SKIP
+    >>> interchange["Bonds"].set_force_field_parameters(new_p)  # doctest: +SKIP
+    >>> parameter_map.update_parameters(interchange, system, "Bonds", context=context)  # doctest: +SKIP
+
+    """
+
+    def __init__(self) -> None:
+        # handler name -> potential key -> (force index, term index, atom indices)
+        self.terms: Dict[
+            str, Dict[PotentialKey, List[Tuple[int, int, Tuple[int, ...]]]]
+        ] = dict()
+
+        # Per-atom non-bonded parameters (e, nm, kJ/mol) as exported, kept up to date
+        # so that 1-4 interactions can be re-mixed without reading them back from OpenMM
+        self.charges: Optional[np.ndarray] = None
+        self.sigmas: Optional[np.ndarray] = None
+        self.epsilons: Optional[np.ndarray] = None
+        self.vdw_force_index: Optional[int] = None
+
+        # The 1-4 pairs, and the force and index of the first term their LJ
+        # interactions are stored in (the exceptions of a NonbondedForce or the bonds
+        # of a CustomBondForce)
+        self.pairs_14: np.ndarray = np.empty((0, 2), dtype=np.int64)
+        self.vdw_14_force_index: Optional[int] = None
+        self.first_14_index: int = 0
+
+    def __repr__(self) -> str:
+        n_terms = {
+            handler_name: sum(len(terms) for terms in potentials.values())
+            for handler_name, potentials in self.terms.items()
+        }
+        return f"OpenMMParameterMap(n_terms={n_terms})"
+
+    def _add_term(
+        self,
+        handler_name: str,
+        potential_key: PotentialKey,
+        force_index: int,
+        term_index: int,
+        atom_indices: Tuple[int, ...],
+    ) -> None:
+        self.terms.setdefault(handler_name, dict()).setdefault(
+            potential_key, list()
+        ).append((force_index, term_index, atom_indices))
+
+    def update_parameters(
+        self,
+        interchange: "Interchange",
+        system: openmm.System,
+        handler_name: str,
+        potential_keys: Optional[Iterable[PotentialKey]] = None,
+        context: Optional[openmm.Context] = None,
+    ) -> None:
+        """
+        Push the current parameters of some potentials of a handler into an exported system.
+
+        Parameters
+        ----------
+        interchange : openff.interchange.Interchange
+            The Interchange that ``system`` was exported from, with modified parameters.
+        system : openmm.System
+            The system exported with this map.
+        handler_name : str
+            The name of the handler whose potentials changed.
+        potential_keys : iterable of PotentialKey, optional
+            The keys of the potentials that changed. By default, all potentials of the
+            handler are updated.
+        context : openmm.Context, optional
+            A context created from ``system``, whose parameters are also updated.
+
+        """
+        if handler_name not in _VALENCE_PARAMETER_SETTERS and handler_name != "vdW":
+            raise NotImplementedError(
+                f"Updating the parameters of handler {handler_name} in an exported "
+                "OpenMM System is not supported."
+            )
+
+        handler = interchange[handler_name]
+        terms = self.terms.get(handler_name, dict())
+
+        if potential_keys is None:
+            potential_keys = [*terms]
+
+        if handler_name == "vdW":
+            modified_forces = self._update_vdw(interchange, system, potential_keys)
+        else:
+            setter, get_parameters = _VALENCE_PARAMETER_SETTERS[handler_name]
+            modified_forces = set()
+
+            for potential_key in potential_keys:
+                parameters = get_parameters(handler.potentials[potential_key])
+
+                for force_index, term_index, atom_indices in terms.get(
+                    potential_key, []
+                ):
+                    getattr(system.getForce(force_index), setter)(
+                        term_index, *atom_indices, *parameters
+                    )
+                    modified_forces.add(force_index)
+
+        if context is not None:
+            for force_index in sorted(modified_forces):
+                system.getForce(force_index).updateParametersInContext(context)
+
+    def _update_vdw(
+        self,
+        interchange: "Interchange",
+        system: openmm.System,
+        potential_keys: Iterable[PotentialKey],
+    ) -> Set[int]:
+        """Update the LJ parameters of atoms, and their 1-4 interactions."""
+        vdw_handler = interchange["vdW"]
+        terms = self.terms.get("vdW", dict())
+
+        vdw_force = system.getForce(self.vdw_force_index)
+        combined = isinstance(vdw_force, openmm.NonbondedForce)
+
+        modified_atoms = list()
+
+        for potential_key in potential_keys:
+            parameters = vdw_handler.potentials[potential_key].parameters
+            sigma = parameters["sigma"].m_as(off_unit.nanometer)
+            epsilon = parameters["epsilon"].m_as(off_unit.kilojoule / off_unit.mol)
+
+            for _, atom_index, _ in terms.get(potential_key, []):
+                self.sigmas[atom_index] = sigma  # type: ignore[index]
+                self.epsilons[atom_index] = epsilon  # type: ignore[index]
+                if combined:
+                    vdw_force.setParticleParameters(
+                        atom_index,
+                        self.charges[atom_index],  # type: ignore[index]
+                        sigma,
+                        epsilon,
+                    )
+                else:
+                    vdw_force.setParticleParameters(atom_index, [sigma, epsilon])
+                modified_atoms.append(atom_index)
+
+        if not modified_atoms:
+            return set()
+
+        modified_forces = {self.vdw_force_index}
+
+        rows = np.flatnonzero(np.isin(self.pairs_14, modified_atoms).any(axis=1))
+
+        if len(rows) > 0:
+            vdw_14_force = system.getForce(self.vdw_14_force_index)
+            scale_14 = vdw_handler.scale_14
+            scale_14_coul = interchange["Electrostatics"].scale_14
+
+            for row in rows.tolist():
+                p1, p2 = self.pairs_14[row].tolist()
+                sig_14 = (self.sigmas[p1] + self.sigmas[p2]) * 0.5  # type: ignore[index]
+                eps_14 = (
+                    self.epsilons[p1] * self.epsilons[p2]  # type: ignore[index]
+                ) ** 0.5 * scale_14
+
+                if combined:
+                    qq = self.charges[p1] * self.charges[p2] * scale_14_coul  # type: ignore[index]
+                    vdw_14_force.setExceptionParameters(
+                        self.first_14_index + row, p1, p2, qq, sig_14, eps_14
+                    )
+                else:
+                    vdw_14_force.setBondParameters(
+                        self.first_14_index + row, p1, p2, [sig_14, eps_14]
+                    )
+
+            modified_forces.add(self.vdw_14_force_index)
+
+        return modified_forces  # type: ignore[return-value]
+
+
+def to_openmm(
+    openff_sys,
+    combine_nonbonded_forces: bool = False,
+    parameter_map: Optional["OpenMMParameterMap"] = None,
+) -> openmm.System:
     """
     Convert an Interchange to a ParmEd Structure.
 
@@ -43,6 +304,9 @@ def to_openmm(openff_sys, combine_nonbonded_forces: bool = False) -> openmm.Syst
     combine_nonbonded_forces : bool, default=False
         If True, an attempt will be made to combine all non-bonded interactions into a single openmm.NonbondedForce.
         If False, non-bonded interactions will be split across multiple forces.
+    parameter_map : OpenMMParameterMap, optional
+        If provided, this (empty) map is populated with the force terms each potential is exported to,
+        which can be used to later update the parameters of the returned system in place.
 
     Returns
     -------
@@ -64,12 +328,15 @@ def to_openmm(openff_sys, combine_nonbonded_forces: bool = False) -> openmm.Syst
         openmm_sys.addParticle(atom.element.mass)
 
     _process_nonbonded_forces(
-        openff_sys, openmm_sys, combine_nonbonded_forces=combine_nonbonded_forces
+        openff_sys,
+        openmm_sys,
+        combine_nonbonded_forces=combine_nonbonded_forces,
+        parameter_map=parameter_map,
     )
-    _process_torsion_forces(openff_sys, openmm_sys)
-    _process_improper_torsion_forces(openff_sys, openmm_sys)
-    _process_angle_forces(openff_sys, openmm_sys)
-    _process_bond_forces(openff_sys, openmm_sys)
+    _process_torsion_forces(openff_sys, openmm_sys, parameter_map)
+    _process_improper_torsion_forces(openff_sys, openmm_sys, parameter_map)
+    _process_angle_forces(openff_sys, openmm_sys, parameter_map)
+    _process_bond_forces(openff_sys, openmm_sys, parameter_map)
     _process_constraints(openff_sys, openmm_sys)
     _process_virtual_sites(openff_sys, openmm_sys)
 
@@ -94,149 +361,195 @@ def _process_constraints(openff_sys, openmm_sys):
         openmm_sys.addConstraint(indices[0], indices[1], distance_omm)
 
 
-def _process_bond_forces(openff_sys, openmm_sys):
+def _process_bond_forces(openff_sys, openmm_sys, parameter_map=None):
     """
     Process the Bonds section of an Interchange object.
     """
     harmonic_bond_force = openmm.HarmonicBondForce()
-    openmm_sys.addForce(harmonic_bond_force)
+    force_index = openmm_sys.addForce(harmonic_bond_force)
 
     try:
         bond_handler = openff_sys.handlers["Bonds"]
     except KeyError:
         return
 
-    try:
-        constraint_handler = openff_sys.handlers["Constraints"]
-        has_constraint_handler = True
-    except KeyError:
-        has_constraint_handler = False
-
-    for top_key, pot_key in bond_handler.slot_map.items():
-        if has_constraint_handler:
-            # If this bond show up in the constraints ...
-            if top_key in constraint_handler.slot_map:
-                # ... don't add it as an interacting bond
-                continue
-        indices = top_key.atom_indices
-        params = bond_handler.potentials[pot_key].parameters
-        k = params["k"].m_as(
-            off_unit.kilojoule / off_unit.nanometer ** 2 / off_unit.mol
+    bond_arrays = bond_handler.to_arrays()
+
+    if bond_arrays.n_terms == 0:
+        return
+
+    # Units are converted once per potential, not once per bond
+    lengths = bond_arrays.term_parameter("length", off_unit.nanometer)
+    ks = bond_arrays.term_parameter(
+        "k", off_unit.kilojoule / off_unit.nanometer ** 2 / off_unit.mol
+    )
+    indices = bond_arrays.atom_indices
+    rows = np.arange(bond_arrays.n_terms)
+
+    if "Constraints" in openff_sys.handlers:
+        constrained = openff_sys.handlers["Constraints"].slot_map
+        # Bonds that show up in the constraints are not added as interacting bonds
+        interacting = np.fromiter(
+            (top_key not in constrained for top_key in bond_handler.slot_map),
+            dtype=bool,
+            count=bond_arrays.n_terms,
+        )
+        indices, lengths, ks, rows = (
+            indices[interacting],
+            lengths[interacting],
+            ks[interacting],
+            rows[interacting],
         )
-        length = params["length"].m_as(off_unit.nanometer)
 
-        harmonic_bond_force.addBond(
-            particle1=indices[0],
-            particle2=indices[1],
+    for (atom1, atom2), length, k, row in zip(
+        indices.tolist(), lengths.tolist(), ks.tolist(), rows.tolist()
+    ):
+        term_index = harmonic_bond_force.addBond(
+            particle1=atom1,
+            particle2=atom2,
             length=length,
             k=k,
         )
 
+        if parameter_map is not None:
+            parameter_map._add_term(
+                "Bonds",
+                bond_arrays.potential_keys[bond_arrays.potential_index[row]],
+                force_index,
+                term_index,
+                (atom1, atom2),
+            )
+
 
-def _process_angle_forces(openff_sys, openmm_sys):
+def _process_angle_forces(openff_sys, openmm_sys, parameter_map=None):
     """
     Process the Angles section of an Interchange object.
     """
     harmonic_angle_force = openmm.HarmonicAngleForce()
-    openmm_sys.addForce(harmonic_angle_force)
+    force_index = openmm_sys.addForce(harmonic_angle_force)
 
     try:
         angle_handler = openff_sys.handlers["Angles"]
     except KeyError:
         return
 
-    for top_key, pot_key in angle_handler.slot_map.items():
-        indices = top_key.atom_indices
-        params = angle_handler.potentials[pot_key].parameters
-        k = params["k"].m_as(off_unit.kilojoule / off_unit.rad / off_unit.mol)
-        angle = params["angle"].m_as(off_unit.radian)
-
-        harmonic_angle_force.addAngle(
-            particle1=indices[0],
-            particle2=indices[1],
-            particle3=indices[2],
+    angle_arrays = angle_handler.to_arrays()
+
+    if angle_arrays.n_terms == 0:
+        return
+
+    ks = angle_arrays.term_parameter(
+        "k", off_unit.kilojoule / off_unit.rad / off_unit.mol
+    )
+    angles = angle_arrays.term_parameter("angle", off_unit.radian)
+
+    for row, ((atom1, atom2, atom3), angle, k) in enumerate(
+        zip(angle_arrays.atom_indices.tolist(), angles.tolist(), ks.tolist())
+    ):
+        term_index = harmonic_angle_force.addAngle(
+            particle1=atom1,
+            particle2=atom2,
+            particle3=atom3,
             angle=angle,
             k=k,
         )
 
+        if parameter_map is not None:
+            parameter_map._add_term(
+                "Angles",
+                angle_arrays.potential_keys[angle_arrays.potential_index[row]],
+                force_index,
+                term_index,
+                (atom1, atom2, atom3),
+            )
+
 
-def _process_torsion_forces(openff_sys, openmm_sys):
+def _process_torsion_forces(openff_sys, openmm_sys, parameter_map=None):
     if "ProperTorsions" in openff_sys.handlers:
-        _process_proper_torsion_forces(openff_sys, openmm_sys)
+        _process_proper_torsion_forces(openff_sys, openmm_sys, parameter_map)
     if "RBTorsions" in openff_sys.handlers:
-        _process_rb_torsion_forces(openff_sys, openmm_sys)
+        _process_rb_torsion_forces(openff_sys, openmm_sys, parameter_map)
 
 
-def _process_proper_torsion_forces(openff_sys, openmm_sys):
+def _process_proper_torsion_forces(openff_sys, openmm_sys, parameter_map=None):
     """
     Process the Propers section of an Interchange object.
     """
     torsion_force = openmm.PeriodicTorsionForce()
-    openmm_sys.addForce(torsion_force)
+    force_index = openmm_sys.addForce(torsion_force)
 
     proper_torsion_handler = openff_sys.handlers["ProperTorsions"]
+    proper_arrays = proper_torsion_handler.to_arrays()
 
-    for top_key, pot_key in proper_torsion_handler.slot_map.items():
-        indices = top_key.atom_indices
-        params = proper_torsion_handler.potentials[pot_key].parameters
-
-        k = params["k"].m_as(off_unit.kilojoule / off_unit.mol)
-        periodicity = int(params["periodicity"])
-        phase = params["phase"].m_as(off_unit.radian)
-        # Work around a pint gotcha:
-        # >>> import pint
-        # >>> u = pint.UnitRegistry()
-        # >>> val
-        # <Quantity(1.0, 'dimensionless')>
-        # >>> val.m
-        # 0.9999999999
-        # >>> int(val)
-        # 0
-        # >>> int(round(val, 0))
-        # 1
-        # >>> round(val.m_as(u.dimensionless), 0)
-        # 1.0
-        # >>> round(val, 0).m
-        # 1.0
-        idivf = params["idivf"].m_as(off_unit.dimensionless)
-        if idivf == 0:
-            raise RuntimeError("Found an idivf of 0.")
-        torsion_force.addTorsion(
-            indices[0],
-            indices[1],
-            indices[2],
-            indices[3],
+    if proper_arrays.n_terms == 0:
+        return
+
+    ks = proper_arrays.term_parameter("k", off_unit.kilojoule / off_unit.mol)
+    # Round, rather than truncate, to avoid a pint gotcha in which a dimensionless
+    # quantity of 1.0 has a magnitude of 0.9999999999
+    periodicities = np.rint(proper_arrays.term_parameter("periodicity")).astype(int)
+    phases = proper_arrays.term_parameter("phase", off_unit.radian)
+    idivfs = proper_arrays.term_parameter("idivf", off_unit.dimensionless)
+    if np.any(idivfs == 0):
+        raise RuntimeError("Found an idivf of 0.")
+
+    for row, ((atom1, atom2, atom3, atom4), periodicity, phase, k) in enumerate(
+        zip(
+            proper_arrays.atom_indices.tolist(),
+            periodicities.tolist(),
+            phases.tolist(),
+            (ks / idivfs).tolist(),
+        )
+    ):
+        term_index = torsion_force.addTorsion(
+            atom1,
+            atom2,
+            atom3,
+            atom4,
             periodicity,
             phase,
-            k / idivf,
+            k,
         )
 
+        if parameter_map is not None:
+            parameter_map._add_term(
+                "ProperTorsions",
+                proper_arrays.potential_keys[proper_arrays.potential_index[row]],
+                force_index,
+                term_index,
+                (atom1, atom2, atom3, atom4),
+            )
 
-def _process_rb_torsion_forces(openff_sys, openmm_sys):
+
+def _process_rb_torsion_forces(openff_sys, openmm_sys, parameter_map=None):
     """
     Process Ryckaert-Bellemans torsions.
     """
     rb_force = openmm.RBTorsionForce()
-    openmm_sys.addForce(rb_force)
+    force_index = openmm_sys.addForce(rb_force)
 
     rb_torsion_handler = openff_sys.handlers["RBTorsions"]
+    rb_arrays = rb_torsion_handler.to_arrays()
 
-    for top_key, pot_key in rb_torsion_handler.slot_map.items():
-        indices = top_key.atom_indices
-        params = rb_torsion_handler.potentials[pot_key].parameters
-
-        c0 = params["C0"].m_as(off_unit.kilojoule / off_unit.mol)
-        c1 = params["C1"].m_as(off_unit.kilojoule / off_unit.mol)
-        c2 = params["C2"].m_as(off_unit.kilojoule / off_unit.mol)
-        c3 = params["C3"].m_as(off_unit.kilojoule / off_unit.mol)
-        c4 = params["C4"].m_as(off_unit.kilojoule / off_unit.mol)
-        c5 = params["C5"].m_as(off_unit.kilojoule / off_unit.mol)
-
-        rb_force.addTorsion(
-            indices[0],
-            indices[1],
-            indices[2],
-            indices[3],
+    if rb_arrays.n_terms == 0:
+        return
+
+    coefficients = np.stack(
+        [
+            rb_arrays.term_parameter(f"C{i}", off_unit.kilojoule / off_unit.mol)
+            for i in range(6)
+        ],
+        axis=1,
+    )
+
+    for row, ((atom1, atom2, atom3, atom4), (c0, c1, c2, c3, c4, c5)) in enumerate(
+        zip(rb_arrays.atom_indices.tolist(), coefficients.tolist())
+    ):
+        term_index = rb_force.addTorsion(
+            atom1,
+            atom2,
+            atom3,
+            atom4,
             c0,
             c1,
             c2,
@@ -245,44 +558,73 @@ def _process_rb_torsion_forces(openff_sys, openmm_sys):
             c5,
         )
 
+        if parameter_map is not None:
+            parameter_map._add_term(
+                "RBTorsions",
+                rb_arrays.potential_keys[rb_arrays.potential_index[row]],
+                force_index,
+                term_index,
+                (atom1, atom2, atom3, atom4),
+            )
 
-def _process_improper_torsion_forces(openff_sys, openmm_sys):
+
+def _process_improper_torsion_forces(openff_sys, openmm_sys, parameter_map=None):
     """
     Process the Impropers section of an Interchange object.
     """
     if "ImproperTorsions" not in openff_sys.handlers.keys():
         return
 
-    for force in openmm_sys.getForces():
-        if type(force) == openmm.PeriodicTorsionForce:
+    for force_index, force in enumerate(openmm_sys.getForces()):
+        if type(force) is openmm.PeriodicTorsionForce:
             torsion_force = force
             break
     else:
         torsion_force = openmm.PeriodicTorsionForce()
+        force_index = openmm_sys.addForce(torsion_force)
 
     improper_torsion_handler = openff_sys.handlers["ImproperTorsions"]
+    improper_arrays = improper_torsion_handler.to_arrays()
 
-    for top_key, pot_key in improper_torsion_handler.slot_map.items():
-        indices = top_key.atom_indices
-        params = improper_torsion_handler.potentials[pot_key].parameters
-
-        k = params["k"].m_as(off_unit.kilojoule / off_unit.mol)
-        periodicity = int(params["periodicity"])
-        phase = params["phase"].m_as(off_unit.radian)
-        idivf = int(params["idivf"])
-
-        torsion_force.addTorsion(
-            indices[0],
-            indices[1],
-            indices[2],
-            indices[3],
+    if improper_arrays.n_terms == 0:
+        return
+
+    ks = improper_arrays.term_parameter("k", off_unit.kilojoule / off_unit.mol)
+    periodicities = improper_arrays.term_parameter("periodicity").astype(int)
+    phases = improper_arrays.term_parameter("phase", off_unit.radian)
+    idivfs = improper_arrays.term_parameter("idivf").astype(int)
+
+    for row, ((atom1, atom2, atom3, atom4), periodicity, phase, k) in enumerate(
+        zip(
+            improper_arrays.atom_indices.tolist(),
+            periodicities.tolist(),
+            phases.tolist(),
+            (ks / idivfs).tolist(),
+        )
+    ):
+        term_index = torsion_force.addTorsion(
+            atom1,
+            atom2,
+            atom3,
+            atom4,
             periodicity,
             phase,
-            k / idivf,
+            k,
         )
 
+        if parameter_map is not None:
+            parameter_map._add_term(
+                "ImproperTorsions",
+                improper_arrays.potential_keys[improper_arrays.potential_index[row]],
+                force_index,
+                term_index,
+                (atom1, atom2, atom3, atom4),
+            )
+
 
-def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=False):
+def _process_nonbonded_forces(
+    openff_sys, openmm_sys, combine_nonbonded_forces=False, parameter_map=None
+):
     """
     Process the non-bonded handlers in an Interchange into corresponding openmm objects.
 
@@ -319,12 +661,16 @@ def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=F
                     "sigma=(sigma1+sigma2)/2; epsilon=sqrt(epsilon1*epsilon2); "
                 )
 
+        charges, sigmas, epsilons = _get_nonbonded_particle_parameters(openff_sys)
+
         if combine_nonbonded_forces:
             non_bonded_force = openmm.NonbondedForce()
-            openmm_sys.addForce(non_bonded_force)
+            non_bonded_force_index = openmm_sys.addForce(non_bonded_force)
 
-            for _ in openff_sys.topology.mdtop.atoms:
-                non_bonded_force.addParticle(0.0, 1.0, 0.0)
+            for charge, sigma, epsilon in zip(
+                charges.tolist(), sigmas.tolist(), epsilons.tolist()
+            ):
+                non_bonded_force.addParticle(charge, sigma, epsilon)
 
             if vdw_method == "cutoff" and electrostatics_method == "pme":
                 if openff_sys.box is not None:
@@ -359,13 +705,13 @@ def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=F
             vdw_force = openmm.CustomNonbondedForce(
                 vdw_expression + "; " + mixing_rule_expression
             )
-            openmm_sys.addForce(vdw_force)
+            vdw_force_index = openmm_sys.addForce(vdw_force)
             vdw_force.addPerParticleParameter("sigma")
             vdw_force.addPerParticleParameter("epsilon")
 
             # TODO: Add virtual particles
-            for _ in openff_sys.topology.mdtop.atoms:
-                vdw_force.addParticle([1.0, 0.0])
+            for sigma, epsilon in zip(sigmas.tolist(), epsilons.tolist()):
+                vdw_force.addParticle([sigma, epsilon])
 
             if vdw_method == "cutoff":
                 if openff_sys.box is None:
@@ -409,8 +755,8 @@ def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=F
             electrostatics_force = openmm.NonbondedForce()
             openmm_sys.addForce(electrostatics_force)
 
-            for _ in openff_sys.topology.mdtop.atoms:
-                electrostatics_force.addParticle(0.0, 1.0, 0.0)
+            for charge in charges.tolist():
+                electrostatics_force.addParticle(charge, 0.0, 0.0)
 
             if electrostatics_method == "reaction-field":
                 if openff_sys.box is None:
@@ -435,38 +781,6 @@ def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=F
                     f"Electrostatics method {electrostatics_method} not supported"
                 )
 
-        try:
-            partial_charges = electrostatics_handler.charges_with_virtual_sites
-        except AttributeError:
-            partial_charges = electrostatics_handler.charges
-
-        for top_key, pot_key in vdw_handler.slot_map.items():
-            # TODO: Actually process virtual site vdW parameters here
-            if type(top_key) != TopologyKey:
-                continue
-            atom_idx = top_key.atom_indices[0]
-
-            partial_charge = partial_charges[top_key]
-            # partial_charge = partial_charge.m_as(off_unit.elementary_charge)
-            vdw_potential = vdw_handler.potentials[pot_key]
-            # these are floats, implicitly angstrom and kcal/mol
-            sigma, epsilon = _lj_params_from_potential(vdw_potential)
-            sigma = sigma.m_as(off_unit.nanometer)
-            epsilon = epsilon.m_as(off_unit.kilojoule / off_unit.mol)
-
-            if combine_nonbonded_forces:
-                non_bonded_force.setParticleParameters(
-                    atom_idx,
-                    partial_charge.m_as(off_unit.e),
-                    sigma,
-                    epsilon,
-                )
-            else:
-                vdw_force.setParticleParameters(atom_idx, [sigma, epsilon])
-                electrostatics_force.setParticleParameters(
-                    atom_idx, partial_charge.m_as(off_unit.e), 0.0, 0.0
-                )
-
     elif "Buckingham-6" in openff_sys.handlers:
         buck_handler = openff_sys.handlers["Buckingham-6"]
 
@@ -478,8 +792,24 @@ def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=F
         non_bonded_force.addPerParticleParameter("C")
         openmm_sys.addForce(non_bonded_force)
 
-        for _ in openff_sys.topology.mdtop.atoms:
-            non_bonded_force.addParticle([0.0, 0.0, 0.0])
+        buck_parameters = np.zeros((openff_sys.topology.mdtop.n_atoms, 3))
+
+        buck_arrays = buck_handler.to_arrays()
+        if buck_arrays.n_terms > 0:
+            # TODO: Add electrostatics
+            buck_parameters[buck_arrays.atom_indices[:, 0]] = np.stack(
+                [
+                    buck_arrays.term_parameter("A", off_unit.kilojoule / off_unit.mol),
+                    buck_arrays.term_parameter("B", off_unit.nanometer ** -1),
+                    buck_arrays.term_parameter(
+                        "C", off_unit.kilojoule / off_unit.mol * off_unit.nanometer ** 6
+                    ),
+                ],
+                axis=1,
+            )
+
+        for a, b, c in buck_parameters.tolist():
+            non_bonded_force.addParticle([a, b, c])
 
         if openff_sys.box is None:
             non_bonded_force.setNonbondedMethod(openmm.NonbondedForce.NoCutoff)
@@ -487,16 +817,6 @@ def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=F
             non_bonded_force.setNonbondedMethod(openmm.NonbondedForce.CutoffPeriodic)
             non_bonded_force.setCutoffDistance(buck_handler.cutoff * unit.angstrom)
 
-        for top_key, pot_key in buck_handler.slot_map.items():
-            atom_idx = top_key.atom_indices[0]
-
-            # TODO: Add electrostatics
-            params = buck_handler.potentials[pot_key].parameters
-            a = pint_to_openmm(params["A"])
-            b = pint_to_openmm(params["B"])
-            c = pint_to_openmm(params["C"])
-            non_bonded_force.setParticleParameters(atom_idx, [a, b, c])
-
         return
 
     if not combine_nonbonded_forces:
@@ -513,51 +833,109 @@ def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=F
         coul_14_force.addPerBondParameter("qq")
         coul_14_force.setUsesPeriodicBoundaryConditions(True)
 
-        openmm_sys.addForce(vdw_14_force)
+        vdw_14_force_index = openmm_sys.addForce(vdw_14_force)
         openmm_sys.addForce(coul_14_force)
 
-    # Need to create 1-4 exceptions, just to have a baseline for splitting out/modifying
-    # It might be simpler to iterate over 1-4 pairs directly
-    bonds = [(b.atom1.index, b.atom2.index) for b in openff_sys.topology.mdtop.bonds]
+    pairs_12, pairs_13, pairs_14 = _get_bonded_pairs(openff_sys.topology.mdtop)
+    excluded_pairs = np.concatenate([pairs_12, pairs_13]).tolist()
+
+    atom1, atom2 = pairs_14[:, 0], pairs_14[:, 1]
+
+    sig_14 = (sigmas[atom1] + sigmas[atom2]) * 0.5
+    eps_14 = np.sqrt(epsilons[atom1] * epsilons[atom2]) * vdw_handler.scale_14
+    qq = charges[atom1] * charges[atom2] * electrostatics_handler.scale_14
 
     if combine_nonbonded_forces:
-        non_bonded_force.createExceptionsFromBonds(
-            bonds=bonds,
-            coulomb14Scale=electrostatics_handler.scale_14,
-            lj14Scale=vdw_handler.scale_14,
-        )
-    else:
-        electrostatics_force.createExceptionsFromBonds(
-            bonds=bonds,
-            coulomb14Scale=electrostatics_handler.scale_14,
-            lj14Scale=vdw_handler.scale_14,
-        )
+        # The same exceptions as NonbondedForce.createExceptionsFromBonds creates,
+        # with the 1-4 exceptions last
+        for p1, p2 in excluded_pairs:
+            non_bonded_force.addException(p1, p2, 0.0, 1.0, 0.0)
 
-        for i in range(electrostatics_force.getNumExceptions()):
-            (p1, p2, q, sig, eps) = electrostatics_force.getExceptionParameters(i)
+        first_14_index = len(excluded_pairs)
 
-            # If the interactions are both zero, assume this is a 1-2 or 1-3 interaction
-            if q._value == 0 and eps._value == 0:
-                pass
-            else:
-                # Assume this is a 1-4 interaction
-                # Look up the vdW parameters for each particle
-                sig1, eps1 = vdw_force.getParticleParameters(p1)
-                sig2, eps2 = vdw_force.getParticleParameters(p2)
-                q1, _, _ = electrostatics_force.getParticleParameters(p1)
-                q2, _, _ = electrostatics_force.getParticleParameters(p2)
-
-                # manually compute and set the 1-4 interactions
-                sig_14 = (sig1 + sig2) * 0.5
-                eps_14 = (eps1 * eps2) ** 0.5 * vdw_handler.scale_14
-                qq = q1 * q2 * electrostatics_handler.scale_14
-
-                vdw_14_force.addBond(p1, p2, [sig_14, eps_14])
-                coul_14_force.addBond(p1, p2, [qq])
+        for (p1, p2), q, sig, eps in zip(
+            pairs_14.tolist(), qq.tolist(), sig_14.tolist(), eps_14.tolist()
+        ):
+            non_bonded_force.addException(p1, p2, q, sig, eps)
+    else:
+        # All 1-2, 1-3, and 1-4 interactions are excluded from the non-bonded forces and
+        # the (scaled) 1-4 interactions are computed by the CustomBondForces
+        for p1, p2 in excluded_pairs + pairs_14.tolist():
             vdw_force.addExclusion(p1, p2)
-            # electrostatics_force.addExclusion(p1, p2)
-            electrostatics_force.setExceptionParameters(i, p1, p2, 0.0, 0.0, 0.0)
-            # vdw_force.setExceptionParameters(i, p1, p2, 0.0, 0.0, 0.0)
+            electrostatics_force.addException(p1, p2, 0.0, 0.0, 0.0)
+
+        first_14_index = 0
+
+        for (p1, p2), sig, eps, q in zip(
+            pairs_14.tolist(), sig_14.tolist(), eps_14.tolist(), qq.tolist()
+        ):
+            vdw_14_force.addBond(p1, p2, [sig, eps])
+            coul_14_force.addBond(p1, p2, [q])
+
+    if parameter_map is not None:
+        parameter_map.charges = charges
+        parameter_map.sigmas = sigmas
+        parameter_map.epsilons = epsilons
+        parameter_map.pairs_14 = pairs_14
+        parameter_map.first_14_index = first_14_index
+
+        if combine_nonbonded_forces:
+            parameter_map.vdw_force_index = non_bonded_force_index
+            parameter_map.vdw_14_force_index = non_bonded_force_index
+        else:
+            parameter_map.vdw_force_index = vdw_force_index
+            parameter_map.vdw_14_force_index = vdw_14_force_index
+
+        vdw_arrays = vdw_handler.to_arrays()
+        for row in range(vdw_arrays.n_terms):
+            if vdw_arrays.virtual_site_type is not None:
+                if vdw_arrays.virtual_site_type[row]:
+                    continue
+            atom_index = int(vdw_arrays.atom_indices[row, 0])
+            parameter_map._add_term(
+                "vdW",
+                vdw_arrays.potential_keys[vdw_arrays.potential_index[row]],
+                parameter_map.vdw_force_index,
+                atom_index,
+                (atom_index,),
+            )
+
+
+def _get_nonbonded_particle_parameters(
+    openff_sys: "Interchange",
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the charge (e), sigma (nm), and epsilon (kJ/mol) of each atom in an Interchange.
+
+    Units are converted once per unique vdW potential. Atoms without vdW parameters get
+    a sigma of 1.0 and an epsilon of 0.0, and atoms without charges a charge of 0.0.
+    """
+    n_atoms = openff_sys.topology.mdtop.n_atoms
+
+    charges = openff_sys.handlers["Electrostatics"].get_charge_array(n_atoms)
+    sigmas = np.ones(n_atoms)
+    epsilons = np.zeros(n_atoms)
+
+    vdw_arrays = openff_sys.handlers["vdW"].to_arrays()
+
+    if vdw_arrays.n_terms > 0:
+        # TODO: Actually process virtual site vdW parameters here
+        if vdw_arrays.virtual_site_type is None:
+            atom_rows = np.arange(vdw_arrays.n_terms)
+        else:
+            atom_rows = np.flatnonzero(vdw_arrays.virtual_site_type == "")
+
+        atom_indices = vdw_arrays.atom_indices[atom_rows, 0]
+        potential_index = vdw_arrays.potential_index[atom_rows]
+
+        sigmas[atom_indices] = vdw_arrays.parameter("sigma", off_unit.nanometer)[
+            potential_index
+        ]
+        epsilons[atom_indices] = vdw_arrays.parameter(
+            "epsilon", off_unit.kilojoule / off_unit.mol
+        )[potential_index]
+
+    return charges, sigmas, epsilons
 
 
 def _process_virtual_sites(openff_sys, openmm_sys):
@@ -574,7 +952,20 @@ def _process_virtual_sites(openff_sys, openmm_sys):
         f for f in openmm_sys.getForces() if type(f) == openmm.NonbondedForce
     ][0]
 
-    for virtual_site_key in virtual_site_handler.slot_map:
+    virtual_site_charges = coul_handler.get_virtual_site_charges()
+
+    (
+        parent_indices,
+        origin_weights,
+        x_weights,
+        y_weights,
+        local_positions,
+    ) = virtual_site_handler.get_local_frames()
+
+    # vdW parameters are converted once per potential, not once per virtual site
+    vdw_parameters: Dict = dict()
+
+    for row, virtual_site_key in enumerate(virtual_site_handler.slot_map):
         vdw_key = vdw_handler.slot_map.get(virtual_site_key)
         coul_key = coul_handler.slot_map.get(virtual_site_key)
         if vdw_key is None and coul_key is None:
@@ -586,24 +977,30 @@ def _process_virtual_sites(openff_sys, openmm_sys):
         if coul_key is None:
             charge = 0.0
         else:
-            charge = coul_handler.charges_with_virtual_sites[virtual_site_key].m_as(
-                off_unit.elementary_charge,
-            )
+            charge = virtual_site_charges[virtual_site_key]
         if vdw_key is None:
             sigma = 1.0
             epsilon = 0.0
         else:
-            vdw_parameters = vdw_handler.potentials[vdw_key].parameters
-            sigma = vdw_parameters["sigma"].m_as(
-                off_unit.nanometer,
-            )
-            epsilon = vdw_parameters["epsilon"].m_as(
-                off_unit.Unit(str(kj_mol)),
-            )
+            if vdw_key not in vdw_parameters:
+                parameters = vdw_handler.potentials[vdw_key].parameters
+                vdw_parameters[vdw_key] = (
+                    parameters["sigma"].m_as(off_unit.nanometer),
+                    parameters["epsilon"].m_as(off_unit.Unit(str(kj_mol))),
+                )
+            sigma, epsilon = vdw_parameters[vdw_key]
 
         virtual_site_index = openmm_sys.addParticle(mass=0.0)
 
-        openmm_virtual_site = _create_virtual_site(virtual_site_key, openff_sys)
+        n_parents = len(virtual_site_key.atom_indices)
+
+        openmm_virtual_site = openmm.LocalCoordinatesSite(
+            parent_indices[row, :n_parents].tolist(),
+            origin_weights[row, :n_parents].tolist(),
+            x_weights[row, :n_parents].tolist(),
+            y_weights[row, :n_parents].tolist(),
+            openmm.Vec3(*local_positions[row]),
+        )
 
         openmm_sys.setVirtualSite(virtual_site_index, openmm_virtual_site)
 
@@ -615,57 +1012,6 @@ def _process_virtual_sites(openff_sys, openmm_sys):
             )
 
 
-def _create_virtual_site(
-    virtual_site_key: "VirtualSiteKey",
-    interchange: "Interchange",
-) -> "openmm.LocalCoordinatesSites":
-
-    parent_atoms = virtual_site_key.atom_indices
-    origin_weight, x_direction, y_direction = interchange[
-        "VirtualSites"
-    ]._get_local_frame_weights(virtual_site_key)
-    displacement = interchange["VirtualSites"]._get_local_frame_position(
-        virtual_site_key
-    )
-
-    x, y, z = ((v / v.units).m for v in displacement)
-    # x, y, z = displacement / displacement.units
-
-    parent_atom_positions = []
-    for parent_atom in parent_atoms:
-        parent_atom_positions.append(interchange.positions[parent_atom])
-
-    _origin_weight = np.atleast_2d(origin_weight)
-    parent_atom_positions = np.atleast_2d(parent_atom_positions)
-
-    origin = np.dot(_origin_weight, parent_atom_positions).sum(axis=0)
-
-    x_axis, y_axis = np.dot(
-        np.vstack((x_direction, y_direction)), parent_atom_positions
-    )
-
-    z_axis = np.cross(x_axis, y_axis)
-    y_axis = np.cross(z_axis, x_axis)
-
-    def _normalize(axis):
-        l = np.linalg.norm(axis)  # noqa
-        if l > 0.0:
-            axis /= l
-        return axis
-
-    x_axis, y_axis, z_axis = map(_normalize, (x_axis, y_axis, z_axis))
-
-    position = origin + x * x_axis + y * y_axis + z * z_axis
-
-    return openmm.LocalCoordinatesSite(
-        parent_atoms,
-        origin_weight,
-        x_direction,
-        y_direction,
-        position,
-    )
-
-
 def from_openmm(topology=None, system=None, positions=None, box_vectors=None):
     """Create an Interchange object from OpenMM data."""
     from openff.interchange.components.interchange import Interchange
@@ -725,7 +1071,7 @@ def _convert_nonbonded_force(force):
         charge, sigma, epsilon = force.getParticleParameters(idx)
         top_key = TopologyKey(atom_indices=(idx,))
         pot_key = PotentialKey(id=f"{idx}")
-        pot = Potential(
+        pot = Potential._from_trusted(
             parameters={
                 "sigma": from_openmm_unit(sigma),
                 "epsilon": from_openmm_unit(epsilon),
@@ -736,7 +1082,11 @@ def _convert_nonbonded_force(force):
 
         electrostatics.slot_map.update({top_key: pot_key})
         electrostatics.potentials.update(
-            {pot_key: Potential(parameters={"charge": from_openmm_unit(charge)})}
+            {
+                pot_key: Potential._from_trusted(
+                    parameters={"charge": from_openmm_unit(charge)}
+                )
+            }
         )
 
     if force.getNonbondedMethod() == openmm.NonbondedForce.PME:
@@ -771,7 +1121,7 @@ def _convert_harmonic_bond_force(force):
         atom1, atom2, length, k = force.getBondParameters(idx)
         top_key = TopologyKey(atom_indices=(atom1, atom2))
         pot_key = PotentialKey(id=f"{atom1}-{atom2}")
-        pot = Potential(
+        pot = Potential._from_trusted(
             parameters={"length": from_openmm_unit(length), "k": from_openmm_unit(k)}
         )
 
@@ -792,7 +1142,7 @@ def _convert_harmonic_angle_force(force):
         atom1, atom2, atom3, angle, k = force.getAngleParameters(idx)
         top_key = TopologyKey(atom_indices=(atom1, atom2, atom3))
         pot_key = PotentialKey(id=f"{atom1}-{atom2}-{atom3}")
-        pot = Potential(
+        pot = Potential._from_trusted(
             parameters={"angle": from_openmm_unit(angle), "k": from_openmm_unit(k)}
         )
 
@@ -813,13 +1163,13 @@ def _convert_periodic_torsion_force(force):
 
     for idx in range(n_parametrized_torsions):
         atom1, atom2, atom3, atom4, per, phase, k = force.getTorsionParameters(idx)
-        # TODO: Process layered torsions
         top_key = TopologyKey(atom_indices=(atom1, atom2, atom3, atom4), mult=0)
+        # Each term of a layered torsion is stored under the next multiplicity
         while top_key in proper_torsion_handler.slot_map:
-            top_key.mult: int = top_key.mult + 1
+            top_key = top_key.copy(update={"mult": top_key.mult + 1})
 
         pot_key = PotentialKey(id=f"{atom1}-{atom2}-{atom3}-{atom4}", mult=top_key.mult)
-        pot = Potential(
+        pot = Potential._from_trusted(
             parameters={
                 "periodicity": int(per) * unit.dimensionless,
                 "phase": from_openmm_unit(phase),
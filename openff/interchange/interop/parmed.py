@@ -218,13 +218,11 @@ def _to_parmed(off_system: "Interchange") -> "pmd.Structure":
         pmd_atom.name = pmd_atom.type
 
     if has_electrostatics:
-        charges = electrostatics_handler.charges
+        charges = electrostatics_handler.get_charge_array(len(structure.atoms))
 
     for pmd_idx, pmd_atom in enumerate(structure.atoms):
         if has_electrostatics:
-            top_key = TopologyKey(atom_indices=(pmd_idx,))
-            partial_charge = charges[top_key]
-            unitless_ = partial_charge.to(unit.elementary_charge).magnitude
+            unitless_ = charges[pmd_idx]
             pmd_atom.charge = float(unitless_)
             pmd_atom.atom_type.charge = float(unitless_)
         else:
@@ -311,14 +309,14 @@ def _from_parmed(cls, structure) -> "Interchange":
         charge = atom.charge * unit.elementary_charge
         top_key = TopologyKey(atom_indices=(atom_idx,))
         pot_key = PotentialKey(id=str(atom_idx))
-        pot = Potential(parameters={"sigma": sigma, "epsilon": epsilon})
+        pot = Potential._from_trusted(parameters={"sigma": sigma, "epsilon": epsilon})
 
         vdw_handler.slot_map.update({top_key: pot_key})
         vdw_handler.potentials.update({pot_key: pot})
 
         coul_handler.slot_map.update({top_key: pot_key})
         coul_handler.potentials.update(
-            {pot_key: Potential(parameters={"charge": charge})}
+            {pot_key: Potential._from_trusted(parameters={"charge": charge})}
         )
 
     bond_handler = SMIRNOFFBondHandler()
@@ -330,7 +328,7 @@ def _from_parmed(cls, structure) -> "Interchange":
         length = bond.type.req * unit.angstrom
         top_key = TopologyKey(atom_indices=(atom1.idx, atom2.idx))
         pot_key = PotentialKey(id=f"{atom1.idx}-{atom2.idx}")
-        pot = Potential(parameters={"k": k * 2, "length": length})
+        pot = Potential._from_trusted(parameters={"k": k * 2, "length": length})
 
         bond_handler.slot_map.update({top_key: pot_key})
         bond_handler.potentials.update({pot_key: pot})
@@ -349,7 +347,7 @@ def _from_parmed(cls, structure) -> "Interchange":
         theta = angle.type.theteq * unit.degree
         top_key = TopologyKey(atom_indices=(atom1.idx, atom2.idx, atom3.idx))
         pot_key = PotentialKey(id=f"{atom1.idx}-{atom2.idx}-{atom3.idx}")
-        pot = Potential(parameters={"k": k * 2, "angle": theta})
+        pot = Potential._from_trusted(parameters={"k": k * 2, "angle": theta})
 
         angle_handler.slot_map.update({top_key: pot_key})
         angle_handler.potentials.update({pot_key: pot})
@@ -435,7 +433,9 @@ def _process_single_dihedral(
             id=f"{atom1.idx}-{atom3.idx}-{atom2.idx}-{atom4.idx}",
             mult=mult,
         )
-        pot = Potential(parameters={"k": k, "periodicity": periodicity, "phase": phase})
+        pot = Potential._from_trusted(
+            parameters={"k": k, "periodicity": periodicity, "phase": phase}
+        )
 
         if pot_key in handler.potentials:
             raise Exception("fudging dihedral indices")
@@ -451,11 +451,13 @@ def _process_single_dihedral(
             id=f"{atom1.idx}-{atom2.idx}-{atom3.idx}-{atom4.idx}",
             mult=1,
         )
-        pot = Potential(parameters={"k": k, "periodicity": periodicity, "phase": phase})
+        pot = Potential._from_trusted(
+            parameters={"k": k, "periodicity": periodicity, "phase": phase}
+        )
 
         while pot_key in handler.potentials:
-            pot_key.mult += 1  # type: ignore[operator]
-            top_key.mult += 1  # type: ignore[operator]
+            pot_key = pot_key.copy(update={"mult": pot_key.mult + 1})  # type: ignore[operator]
+            top_key = top_key.copy(update={"mult": top_key.mult + 1})  # type: ignore[operator]
 
         handler.slot_map.update({top_key: pot_key})
         handler.potentials.update({pot_key: pot})
@@ -17,7 +17,11 @@ from openff.interchange.components.nonbonded import BuckinghamvdWHandler
 from openff.interchange.components.potentials import Potential
 from openff.interchange.components.smirnoff import SMIRNOFFVirtualSiteHandler
 from openff.interchange.drivers import get_gromacs_energies, get_openmm_energies
-from openff.interchange.exceptions import GMXMdrunError, UnsupportedExportError
+from openff.interchange.exceptions import (
+    GMXMdrunError,
+    MissingParametersError,
+    UnsupportedExportError,
+)
 from openff.interchange.interop.internal.gromacs import from_gro
 from openff.interchange.models import PotentialKey, TopologyKey
 from openff.interchange.testing import _BaseTest
@@ -232,6 +236,125 @@ class TestGROMACS(_BaseTest):
             get_gromacs_energies(out, mdp="cutoff_buck")
 
 
+class TestGROMACSTopFile(_BaseTest):
+    @staticmethod
+    def _get_section_lines(file_path, section):
+        """Get the non-comment lines of a section of a GROMACS topology file."""
+        lines = list()
+        in_section = False
+
+        with open(file_path) as file_in:
+            for line in file_in:
+                line = line.strip()
+                if line.startswith("["):
+                    in_section = line == f"[ {section} ]"
+                elif in_section and line and not line.startswith(";"):
+                    lines.append(line)
+
+        return lines
+
+    def test_valence_sections(self, parsley):
+        """Test that each valence term of each molecule type is written exactly once."""
+        molecules = [Molecule.from_smiles(smi) for smi in ["CCO", "c1ccccc1", "CCO"]]
+        topology = _OFFBioTop(
+            mdtop=md.Topology.from_openmm(
+                Topology.from_molecules(molecules).to_openmm()
+            )
+        )
+
+        out = Interchange.from_smirnoff(force_field=parsley, topology=topology)
+        out.to_top("out.top")
+
+        # The second ethanol is written as another copy of the first molecule type
+        n_unique_atoms = molecules[0].n_atoms + molecules[1].n_atoms
+
+        def n_terms(handler_name):
+            return sum(
+                max(top_key.atom_indices) < n_unique_atoms
+                for top_key in out[handler_name].slot_map
+            )
+
+        assert self._get_section_lines("out.top", "moleculetype") == [
+            "MOL0\t3",
+            "MOL1\t3",
+        ]
+        assert self._get_section_lines("out.top", "molecules") == [
+            "MOL0\t1",
+            "MOL1\t1",
+            "MOL0\t1",
+        ]
+        assert len(self._get_section_lines("out.top", "bonds")) == n_terms("Bonds")
+        assert len(self._get_section_lines("out.top", "angles")) == n_terms("Angles")
+        assert len(self._get_section_lines("out.top", "dihedrals")) == n_terms(
+            "ProperTorsions"
+        ) + n_terms("ImproperTorsions")
+
+    def test_missing_bond_parameters(self, parsley):
+        topology = _OFFBioTop(
+            mdtop=md.Topology.from_openmm(
+                Molecule.from_smiles("CCO").to_topology().to_openmm()
+            )
+        )
+
+        out = Interchange.from_smirnoff(force_field=parsley, topology=topology)
+        out["Bonds"].slot_map.pop(next(iter(out["Bonds"].slot_map)))
+
+        with pytest.raises(MissingParametersError, match="bond with indices"):
+            out.to_top("out.top")
+
+    def test_missing_angle_parameters(self, parsley):
+        topology = _OFFBioTop(
+            mdtop=md.Topology.from_openmm(
+                Molecule.from_smiles("CCO").to_topology().to_openmm()
+            )
+        )
+
+        out = Interchange.from_smirnoff(force_field=parsley, topology=topology)
+        out["Angles"].slot_map.pop(next(iter(out["Angles"].slot_map)))
+
+        with pytest.raises(MissingParametersError, match="angle with indices"):
+            out.to_top("out.top")
+
+    def test_molecule_types(self, parsley):
+        """Test that identical molecules are written once and counted in [ molecules ]."""
+        ethanol = Molecule.from_smiles("CCO")
+        water = Molecule.from_smiles("O")
+        molecules = [ethanol, ethanol, water, water, water, ethanol]
+        topology = _OFFBioTop(
+            mdtop=md.Topology.from_openmm(
+                Topology.from_molecules(molecules).to_openmm()
+            )
+        )
+
+        out = Interchange.from_smirnoff(force_field=parsley, topology=topology)
+        out.to_top("out.top")
+
+        assert self._get_section_lines("out.top", "moleculetype") == [
+            "MOL0\t3",
+            "MOL1\t3",
+        ]
+        assert self._get_section_lines("out.top", "molecules") == [
+            "MOL0\t2",
+            "MOL1\t3",
+            "MOL0\t1",
+        ]
+        assert len(self._get_section_lines("out.top", "atoms")) == (
+            ethanol.n_atoms + water.n_atoms
+        )
+        assert len(self._get_section_lines("out.top", "bonds")) == (
+            ethanol.n_bonds + water.n_bonds
+        )
+
+        # Atoms of the same element with the same LJ parameters share an atom type
+        lj_parameters = {
+            (atom.element.symbol, out["vdW"].slot_map[TopologyKey(atom_indices=(i,))])
+            for i, atom in enumerate(out.topology.mdtop.atoms)
+        }
+        assert len(self._get_section_lines("out.top", "atomtypes")) == len(
+            lj_parameters
+        )
+
+
 @needs_gmx
 class TestGROMACSVirtualSites(_BaseTest):
     @pytest.fixture()
@@ -11,6 +11,7 @@ from openmm import unit as openmm_unit
 
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.components.mdtraj import _OFFBioTop
+from openff.interchange.components.potentials import Potential
 from openff.interchange.components.smirnoff import SMIRNOFFVirtualSiteHandler
 from openff.interchange.drivers.openmm import _get_openmm_energies, get_openmm_energies
 from openff.interchange.exceptions import (
@@ -18,7 +19,7 @@ from openff.interchange.exceptions import (
     UnsupportedCutoffMethodError,
     UnsupportedExportError,
 )
-from openff.interchange.interop.openmm import from_openmm
+from openff.interchange.interop.openmm import OpenMMParameterMap, from_openmm
 from openff.interchange.testing import _BaseTest
 from openff.interchange.utils import get_test_file_path
 
@@ -192,6 +193,33 @@ def test_from_openmm_single_mols(mol, n_mols):
     toolkit_energy.compare(native_energy)
 
 
+def test_from_openmm_layered_torsions():
+    """Test that each term of a layered torsion is imported under its own key."""
+    parsley = ForceField("openff_unconstrained-1.0.0.offxml")
+    molecule = Molecule.from_smiles("OC=O")
+
+    system = parsley.create_openmm_system(molecule.to_topology())
+    force = [
+        force
+        for force in system.getForces()
+        if isinstance(force, openmm.PeriodicTorsionForce)
+    ][0]
+
+    torsions = from_openmm(system=system)["ProperTorsions"]
+
+    assert len(torsions.slot_map) == force.getNumTorsions()
+    assert len(torsions.potentials) == force.getNumTorsions()
+    assert max(top_key.mult for top_key in torsions.slot_map) > 0
+
+    for index in range(force.getNumTorsions()):
+        *atom_indices, periodicity, _, _ = force.getTorsionParameters(index)
+        assert periodicity in {
+            torsions.potentials[pot_key].parameters["periodicity"].m
+            for top_key, pot_key in torsions.slot_map.items()
+            if top_key.atom_indices == tuple(atom_indices)
+        }
+
+
 @pytest.mark.xfail(reason="Broken because of splitting non-bonded forces")
 @pytest.mark.slow()
 @pytest.mark.parametrize("mol_smi", ["C", "CC", "CCO"])
@@ -251,6 +279,55 @@ def test_combine_nonbonded_forces():
     ).m < 0.001
 
 
+@pytest.mark.slow()
+@pytest.mark.parametrize(
+    "force_field", ["openff-1.0.0.offxml", "openff_unconstrained-1.0.0.offxml"]
+)
+def test_to_openmm_matches_toolkit(force_field):
+    """Test that parameters in exported systems match those assigned by the toolkit."""
+    force_field = ForceField(force_field)
+
+    molecules = [Molecule.from_smiles(smiles) for smiles in ["CCO", "O", "c1ccccc1"]]
+    topology = Topology.from_molecules(molecules + molecules)
+
+    out = Interchange.from_smirnoff(force_field=force_field, topology=topology)
+
+    compare_system_parameters(
+        out.to_openmm(combine_nonbonded_forces=True),
+        force_field.create_openmm_system(topology),
+    )
+
+
+def test_to_openmm_after_in_place_edit():
+    """Test that a second export picks up potentials modified in place."""
+    out = Interchange.from_smirnoff(
+        force_field=ForceField("openff_unconstrained-1.0.0.offxml"),
+        topology=Molecule.from_smiles("CCO").to_topology(),
+    )
+
+    top_key, potential_key = [*out["Bonds"].slot_map.items()][0]
+
+    def get_bond_k(system):
+        force = [
+            force
+            for force in system.getForces()
+            if isinstance(force, openmm.HarmonicBondForce)
+        ][0]
+        for index in range(force.getNumBonds()):
+            *atom_indices, _, k = force.getBondParameters(index)
+            if tuple(atom_indices) == top_key.atom_indices:
+                return k.value_in_unit(
+                    openmm_unit.kilojoule_per_mole / openmm_unit.nanometer ** 2
+                )
+
+    original = get_bond_k(out.to_openmm())
+
+    parameters = out["Bonds"].potentials[potential_key].parameters
+    parameters["k"] = 2 * parameters["k"]
+
+    assert get_bond_k(out.to_openmm()) == pytest.approx(2 * original)
+
+
 @pytest.mark.slow()
 class TestOpenMMVirtualSites(_BaseTest):
     @pytest.fixture()
@@ -370,6 +447,73 @@ class TestOpenMMVirtualSites(_BaseTest):
         )
 
 
+class TestOpenMMParameterMap(_BaseTest):
+    @staticmethod
+    def _get_energy(system, positions):
+        context = openmm.Context(
+            system,
+            openmm.VerletIntegrator(1.0 * openmm_unit.femtoseconds),
+            openmm.Platform.getPlatformByName("Reference"),
+        )
+        context.setPositions(positions)
+        return context, context.getState(getEnergy=True).getPotentialEnergy()
+
+    @pytest.mark.parametrize("combine_nonbonded_forces", [True, False])
+    def test_update_parameters(self, parsley_unconstrained, combine_nonbonded_forces):
+        # Acetic acid has terms from every supported handler, including an improper
+        molecule = Molecule.from_smiles("CC(=O)O")
+        molecule.generate_conformers(n_conformers=1)
+
+        out = Interchange.from_smirnoff(parsley_unconstrained, molecule.to_topology())
+
+        parameter_map = OpenMMParameterMap()
+        system = out.to_openmm(
+            combine_nonbonded_forces=combine_nonbonded_forces,
+            parameter_map=parameter_map,
+        )
+        context, _ = self._get_energy(system, molecule.conformers[0])
+
+        for handler_name, parameter_name in [
+            ("Bonds", "k"),
+            ("Angles", "angle"),
+            ("ProperTorsions", "k"),
+            ("ImproperTorsions", "k"),
+            ("vdW", "epsilon"),
+        ]:
+            handler = out[handler_name]
+            potential_key = [*handler.slot_map.values()][0]
+            parameters = handler.potentials[potential_key].parameters
+            handler.potentials[potential_key] = Potential(
+                parameters={
+                    **parameters,
+                    parameter_name: 1.1 * parameters[parameter_name],
+                }
+            )
+
+            parameter_map.update_parameters(
+                out, system, handler_name, [potential_key], context=context
+            )
+
+        updated = context.getState(getEnergy=True).getPotentialEnergy()
+        _, rebuilt = self._get_energy(
+            out.to_openmm(combine_nonbonded_forces=combine_nonbonded_forces),
+            molecule.conformers[0],
+        )
+
+        assert abs(updated - rebuilt) < 1e-6 * openmm_unit.kilojoule_per_mole
+
+    def test_unsupported_handler(self, parsley_unconstrained):
+        out = Interchange.from_smirnoff(
+            parsley_unconstrained, Molecule.from_smiles("CCO").to_topology()
+        )
+
+        parameter_map = OpenMMParameterMap()
+        system = out.to_openmm(parameter_map=parameter_map)
+
+        with pytest.raises(NotImplementedError, match="Electrostatics"):
+            parameter_map.update_parameters(out, system, "Electrostatics")
+
+
 class TestOpenMMToPDB(_BaseTest):
     def test_to_pdb(self):
         molecule = Molecule.from_smiles("O")
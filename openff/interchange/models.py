@@ -1,12 +1,144 @@
 """Custom Pydantic models."""
-from typing import Optional, Tuple
+import json
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from openff.units import unit
-from pydantic import BaseModel, Field
-from typing_extensions import Literal
+from pydantic import BaseModel
 
 from openff.interchange.types import custom_quantity_encoder, json_loader
 
+K = TypeVar("K", bound="_BaseKey")
+
+
+class _BaseKey:
+    """
+    Base class for lightweight, immutable keys used in slot maps and dicts of potentials.
+
+    Keys are looked up and hashed very often, so rather than being Pydantic models they
+    are slotted objects whose hash is computed once. They mimic the parts of the Pydantic
+    API used on them (``dict``, ``json``, ``copy``, ``parse_obj``) and can be used as (or
+    in) fields of Pydantic models, which accept instances or dicts of their fields.
+    """
+
+    __slots__ = ("_values", "_hash")
+
+    _fields: Tuple[str, ...] = tuple()
+
+    def _set_values(self, values: Tuple) -> None:
+        for field, value in zip(self._fields, values):
+            object.__setattr__(self, field, value)
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_hash", hash(values))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise TypeError(
+            f'"{type(self).__name__}" is immutable and does not support item assignment'
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise TypeError(f'"{type(self).__name__}" is immutable')
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._hash == other._hash and self._values == other._values
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        return iter(zip(self._fields, self._values))
+
+    def __repr_args__(self) -> str:
+        return ", ".join(f"{field}={value!r}" for field, value in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__repr_args__()})"
+
+    def __str__(self) -> str:
+        return " ".join(f"{field}={value!r}" for field, value in self)
+
+    def __reduce__(self) -> Tuple[Callable, Tuple]:
+        return _rebuild_key, (type(self), self.dict())
+
+    def __copy__(self: K) -> K:
+        return self
+
+    def __deepcopy__(self: K, memo: Dict) -> K:
+        return self
+
+    def dict(self) -> Dict[str, Any]:
+        """Return a dict of the fields of this key."""
+        return dict(self)
+
+    def json(self) -> str:
+        """Return a JSON representation of the fields of this key."""
+        return json.dumps(self.dict())
+
+    def copy(self: K, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> K:
+        """Return a key with the same fields as this key, except those in ``update``."""
+        if not update:
+            return self
+        return type(self)(**{**self.dict(), **update})
+
+    @classmethod
+    def parse_obj(cls: Type[K], obj: Any) -> K:
+        """Create a key from a dict of its fields."""
+        return cls(**obj)
+
+    @classmethod
+    def parse_raw(cls: Type[K], data: str) -> K:
+        """Create a key from a JSON representation of its fields."""
+        return cls.parse_obj(json.loads(data))
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable]:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls: Type[K], value: Any) -> K:
+        """Validate a value as a field of a Pydantic model."""
+        if type(value) is cls:
+            return value
+        if isinstance(value, dict):
+            return cls(**value)
+        raise TypeError(
+            f"Could not validate data of type {type(value)} as {cls.__name__}"
+        )
+
+
+def _rebuild_key(cls: Type[K], fields: Dict[str, Any]) -> K:
+    return cls(**fields)
+
+
+def _to_indices(atom_indices: Iterable[int]) -> Tuple[int, ...]:
+    return tuple(map(int, atom_indices))
+
+
+def _to_optional_int(value: Optional[int]) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _to_optional_float(value: Optional[float]) -> Optional[float]:
+    return None if value is None else float(value)
+
 
 class DefaultModel(BaseModel):
     """A custom Pydantic model used by other components."""
@@ -16,13 +148,14 @@ class DefaultModel(BaseModel):
 
         json_encoders = {
             unit.Quantity: custom_quantity_encoder,
+            _BaseKey: _BaseKey.dict,
         }
         json_loads = json_loader
         validate_assignment = True
         arbitrary_types_allowed = True
 
 
-class TopologyKey(DefaultModel):
+class TopologyKey(_BaseKey):
     """
     A unique identifier of a segment of a chemical topology.
 
@@ -62,38 +195,71 @@ class TopologyKey(DefaultModel):
 
     """
 
-    atom_indices: Tuple[int, ...] = Field(
-        tuple(), description="The indices of the atoms occupied by this interaction"
-    )
-    mult: Optional[int] = Field(
-        None, description="The index of this duplicate interaction"
-    )
-    bond_order: Optional[float] = Field(
-        None,
-        description="If this key represents as topology component subject to interpolation "
-        "between multiple parameters(s), the bond order determining the coefficients of the wrapped potentials.",
-    )
+    __slots__ = ("atom_indices", "mult", "bond_order")
 
-    def __hash__(self) -> int:
-        return hash((self.atom_indices, self.mult, self.bond_order))
+    _fields = ("atom_indices", "mult", "bond_order")
+
+    atom_indices: Tuple[int, ...]
+    """The indices of the atoms occupied by this interaction."""
 
+    mult: Optional[int]
+    """The index of this duplicate interaction."""
 
-class VirtualSiteKey(DefaultModel):
+    bond_order: Optional[float]
+    """
+    If this key represents as topology component subject to interpolation between
+    multiple parameters(s), the bond order determining the coefficients of the wrapped
+    potentials.
+    """
+
+    def __init__(
+        self,
+        atom_indices: Iterable[int] = tuple(),
+        mult: Optional[int] = None,
+        bond_order: Optional[float] = None,
+        **extra: Any,
+    ) -> None:
+        # Like the default configuration of Pydantic models, extra fields are ignored
+        self._set_values(
+            (
+                _to_indices(atom_indices),
+                _to_optional_int(mult),
+                _to_optional_float(bond_order),
+            )
+        )
+
+
+class VirtualSiteKey(_BaseKey):
     """A unique identifier of a virtual site in the scope of a chemical topology."""
 
-    atom_indices: Tuple[int, ...] = Field(
-        tuple(), description="The indices of the atoms that anchor this virtual site"
-    )
-    type: str = Field(description="The type of this virtual site")
-    match: Literal["once", "all_permutations"] = Field(
-        description="The `match` attribute of the associated virtual site type"
-    )
+    __slots__ = ("atom_indices", "type", "match")
 
-    def __hash__(self) -> int:
-        return hash((self.atom_indices, self.type, self.match))
+    _fields = ("atom_indices", "type", "match")
+
+    atom_indices: Tuple[int, ...]
+    """The indices of the atoms that anchor this virtual site."""
 
+    type: str
+    """The type of this virtual site."""
 
-class PotentialKey(DefaultModel):
+    match: str
+    """The `match` attribute of the associated virtual site type."""
+
+    def __init__(
+        self,
+        type: str,
+        match: str,
+        atom_indices: Iterable[int] = tuple(),
+        **extra: Any,
+    ) -> None:
+        if match not in ("once", "all_permutations"):
+            raise ValueError(
+                f"VirtualSiteKey match must be 'once' or 'all_permutations', found {match}"
+            )
+        self._set_values((_to_indices(atom_indices), str(type), match))
+
+
+class PotentialKey(_BaseKey):
     """
     A unique identifier of an instance of physical parameters as applied to a segment of a chemical topology.
 
@@ -128,23 +294,71 @@ class PotentialKey(DefaultModel):
 
     """
 
-    id: str = Field(
-        ...,
-        description="A unique identifier of this potential, i.e. a SMARTS pattern or an atom type",
-    )
-    mult: Optional[int] = Field(
-        None, description="The index of this duplicate interaction"
-    )
-    associated_handler: Optional[str] = Field(
-        None,
-        description="The type of handler this potential key is associated with, "
-        "i.e. 'Bonds', 'vdW', or 'LibraryCharges",
-    )
-    bond_order: Optional[float] = Field(
-        None,
-        description="If this is a key to a WrappedPotential interpolating multiple parameter(s), "
-        "the bond order determining the coefficients of the wrapped potentials.",
-    )
+    __slots__ = ("id", "mult", "associated_handler", "bond_order", "__weakref__")
 
-    def __hash__(self) -> int:
-        return hash((self.id, self.mult, self.associated_handler, self.bond_order))
+    _fields = ("id", "mult", "associated_handler", "bond_order")
+
+    # Keys with identical fields are shared, i.e. by all terms to which a parameter
+    # applies. Entries are weak references that are removed once a key is not used.
+    _interned: Dict[Tuple, "weakref.ref[PotentialKey]"] = dict()
+
+    id: str
+    """A unique identifier of this potential, i.e. a SMARTS pattern or an atom type."""
+
+    mult: Optional[int]
+    """The index of this duplicate interaction."""
+
+    associated_handler: Optional[str]
+    """
+    The type of handler this potential key is associated with, i.e. 'Bonds', 'vdW', or
+    'LibraryCharges'.
+    """
+
+    bond_order: Optional[float]
+    """
+    If this is a key to a WrappedPotential interpolating multiple parameter(s), the bond
+    order determining the coefficients of the wrapped potentials.
+    """
+
+    def __new__(
+        cls,
+        id: str,
+        mult: Optional[int] = None,
+        associated_handler: Optional[str] = None,
+        bond_order: Optional[float] = None,
+        **extra: Any,
+    ) -> "PotentialKey":
+        """Return the interned key with these fields, creating it if needed."""
+        # Look up the arguments as given first, which avoids converting them in the
+        # common case of a key that already exists
+        reference = cls._interned.get((id, mult, associated_handler, bond_order))
+        if reference is not None:
+            key = reference()
+            if key is not None:
+                return key
+
+        values = (
+            str(id),
+            _to_optional_int(mult),
+            None if associated_handler is None else str(associated_handler),
+            _to_optional_float(bond_order),
+        )
+
+        key = object.__new__(cls)
+        key._set_values(values)
+        cls._interned[values] = weakref.ref(
+            key, _make_uninterner(cls._interned, values)
+        )
+
+        return key
+
+
+def _make_uninterner(
+    interned: Dict[Tuple, "weakref.ref[PotentialKey]"], values: Tuple
+) -> Callable[["weakref.ref[PotentialKey]"], None]:
+    def uninterner(reference: "weakref.ref[PotentialKey]") -> None:
+        # A new key with the same values may have been interned in the meantime
+        if interned.get(values) is reference:
+            del interned[values]
+
+    return uninterner
@@ -1,4 +1,5 @@
 """Custom models for dealing with unit-bearing quantities in a Pydantic-compatible manner."""
+import functools
 import json
 from typing import TYPE_CHECKING, Any, Dict
 
@@ -68,6 +69,12 @@ class FloatQuantity(float, metaclass=_FloatQuantityMeta):
             raise UnitValidationError(f"Could not validate data of type {type(val)}")
 
 
+@functools.lru_cache(maxsize=None)
+def _unit_from_omm_unit(unit_: openmm_unit.Unit) -> unit.Unit:
+    """Convert a SimTK/OpenMM unit to a Pint unit, which only needs to be parsed once."""
+    return unit.Unit(str(unit_))
+
+
 def _from_omm_quantity(val: openmm_unit.Quantity):
     """
     Convert float or array quantities tagged with SimTK/OpenMM units to a Pint-compatible quantity.
@@ -76,12 +83,12 @@ def _from_omm_quantity(val: openmm_unit.Quantity):
     val_ = val.value_in_unit(unit_)
     if type(val_) in {float, int}:
         unit_ = val.unit
-        return val_ * unit.Unit(str(unit_))
+        return val_ * _unit_from_omm_unit(unit_)
     elif type(val_) in {tuple, list, np.ndarray}:
         array = np.asarray(val_)
-        return array * unit.Unit(str(unit_))
+        return array * _unit_from_omm_unit(unit_)
     elif isinstance(val_, (float, int)) and type(val_).__module__ == "numpy":
-        return val_ * unit.Unit(str(unit_))
+        return val_ * _unit_from_omm_unit(unit_)
     else:
         raise UnitValidationError(
             "Found a openmm.unit.Unit wrapped around something other than a float-like "
@@ -210,3 +217,15 @@ else:
                 raise UnitValidationError(
                     f"Could not validate data of type {type(val)}"
                 )
+
+
+def _from_trusted_quantity(value: Any) -> unit.Quantity:
+    """Convert a parameter created by an importer, which is expected to have units."""
+    if isinstance(value, unit.Quantity):
+        return value
+    if isinstance(value, openmm_unit.Quantity):
+        return _from_omm_quantity(value)
+    # Not expected from importers; fall back to full validation
+    if isinstance(value, list):
+        return ArrayQuantity.validate_type(value)
+    return FloatQuantity.validate_type(value)
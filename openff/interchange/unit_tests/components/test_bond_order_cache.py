@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from openff.toolkit.topology import Molecule
+
+from openff.interchange.components import bond_order_cache
+from openff.interchange.components.bond_order_cache import (
+    SQLiteFractionalBondOrderCache,
+    _sorted_bonds,
+    assign_fractional_bond_orders,
+    get_fractional_bond_order_cache_key,
+)
+from openff.interchange.components.charge_cache import SQLitePartialChargeCache
+from openff.interchange.testing import _BaseTest
+
+
+class TestSQLiteFractionalBondOrderCache(_BaseTest):
+    def test_get_set(self):
+        cache = SQLiteFractionalBondOrderCache("cache.sqlite")
+
+        assert cache.get("foo") is None
+
+        cache.set("foo", np.array([1.0, 1.5, 2.0]))
+
+        np.testing.assert_equal(cache.get("foo"), [1.0, 1.5, 2.0])
+        assert len(cache) == 1
+
+        # Partial charges stored in the same file are kept separately
+        assert SQLitePartialChargeCache("cache.sqlite").get("foo") is None
+
+    def test_cache_key(self):
+        ethanol = Molecule.from_smiles("CCO")
+        methanol = Molecule.from_smiles("CO")
+
+        key = get_fractional_bond_order_cache_key(ethanol, "am1-wiberg")
+
+        assert key == get_fractional_bond_order_cache_key(ethanol, "AM1-Wiberg")
+        assert key != get_fractional_bond_order_cache_key(ethanol, "pm3-wiberg")
+        assert key != get_fractional_bond_order_cache_key(methanol, "am1-wiberg")
+
+    def test_assign_from_cache(self, monkeypatch):
+        molecule = Molecule.from_smiles("CCO")
+        bond_orders = np.linspace(1.0, 2.0, molecule.n_bonds)
+
+        cache = SQLiteFractionalBondOrderCache("cache.sqlite")
+        cache.set(
+            get_fractional_bond_order_cache_key(molecule, "am1-wiberg"), bond_orders
+        )
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("Cached bond orders should not be recomputed")
+
+        monkeypatch.setattr(bond_order_cache, "_FRACTIONAL_BOND_ORDERS", dict())
+        monkeypatch.setattr(bond_order_cache, "_compute_fractional_bond_orders", _fail)
+
+        assign_fractional_bond_orders([molecule], "AM1-Wiberg", bond_order_cache=cache)
+
+        np.testing.assert_allclose(
+            [bond.fractional_bond_order for bond in _sorted_bonds(molecule)],
+            bond_orders,
+        )
+
+    @pytest.mark.slow()
+    def test_assign_stores_in_cache(self, monkeypatch):
+        monkeypatch.setattr(bond_order_cache, "_FRACTIONAL_BOND_ORDERS", dict())
+
+        molecules = [Molecule.from_smiles(smiles) for smiles in ["CCO", "CCN"]]
+
+        cache = SQLiteFractionalBondOrderCache("cache.sqlite")
+
+        assign_fractional_bond_orders(
+            molecules, "am1-wiberg", bond_order_cache=cache, n_workers=2
+        )
+
+        assert len(cache) == 2
+
+        for molecule in molecules:
+            np.testing.assert_allclose(
+                [bond.fractional_bond_order for bond in _sorted_bonds(molecule)],
+                cache.get(get_fractional_bond_order_cache_key(molecule, "am1-wiberg")),
+            )
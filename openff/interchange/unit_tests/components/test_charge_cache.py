@@ -0,0 +1,96 @@
+import sqlite3
+
+import numpy as np
+from openff.units import unit
+
+from openff.interchange.components.charge_cache import (
+    SQLitePartialChargeCache,
+    get_partial_charge_cache_key,
+)
+from openff.interchange.components.interchange import Interchange
+from openff.interchange.testing import _BaseTest
+from openff.interchange.testing.utils import _top_from_smiles
+
+
+class TestSQLitePartialChargeCache(_BaseTest):
+    def test_get_set(self):
+        cache = SQLitePartialChargeCache("charges.sqlite")
+
+        assert cache.get("foo") is None
+
+        cache.set("foo", np.array([-0.5, 0.25, 0.25]))
+
+        np.testing.assert_equal(cache.get("foo"), [-0.5, 0.25, 0.25])
+        assert len(cache) == 1
+
+        # A second cache object reads the same file, as another process would
+        np.testing.assert_equal(
+            SQLitePartialChargeCache("charges.sqlite").get("foo"), [-0.5, 0.25, 0.25]
+        )
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_eviction(self):
+        cache = SQLitePartialChargeCache("charges.sqlite", max_entries=2)
+
+        cache.set("a", np.zeros(1))
+        cache.set("b", np.zeros(2))
+
+        # Reading "a" makes "b" the least recently used entry
+        cache.get("a")
+        cache.set("c", np.zeros(3))
+
+        assert len(cache) == 2
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_rename_charges_column(self):
+        with sqlite3.connect("charges.sqlite") as connection:
+            connection.execute(
+                "CREATE TABLE partial_charges "
+                "(key TEXT PRIMARY KEY, charges BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            connection.execute(
+                "INSERT INTO partial_charges VALUES (?, ?, ?)",
+                ("foo", np.ones(2, dtype="<f8").tobytes(), 0.0),
+            )
+        connection.close()
+
+        np.testing.assert_equal(
+            SQLitePartialChargeCache("charges.sqlite").get("foo"), [1.0, 1.0]
+        )
+
+    def test_cache_key(self):
+        ethanol = [*_top_from_smiles("CCO").reference_molecules][0]
+        methanol = [*_top_from_smiles("CO").reference_molecules][0]
+
+        key = get_partial_charge_cache_key(ethanol, "am1bcc")
+
+        assert key == get_partial_charge_cache_key(ethanol, "am1bcc")
+        assert key != get_partial_charge_cache_key(ethanol, "am1-mulliken")
+        assert key != get_partial_charge_cache_key(methanol, "am1bcc")
+
+    def test_from_smirnoff_uses_cache(self, parsley):
+        topology = _top_from_smiles("CCO", n_molecules=2)
+        reference_molecule = [*topology.reference_molecules][0]
+
+        cache = SQLitePartialChargeCache("charges.sqlite")
+        cache.set(
+            get_partial_charge_cache_key(reference_molecule, "am1bcc"),
+            np.linspace(-0.4, 0.4, reference_molecule.n_atoms),
+        )
+
+        out = Interchange.from_smirnoff(
+            parsley, topology, charge_cache="charges.sqlite"
+        )
+
+        charges = [*out["Electrostatics"].charges.values()]
+
+        assert len(charges) == 2 * reference_molecule.n_atoms
+        np.testing.assert_allclose(
+            [charge.m_as(unit.elementary_charge) for charge in charges],
+            2 * [*np.linspace(-0.4, 0.4, reference_molecule.n_atoms)],
+        )
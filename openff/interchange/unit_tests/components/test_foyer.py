@@ -11,7 +11,7 @@ from openff.units import unit
 from openff.utilities.testing import has_package, skip_if_missing
 from openmm import unit as omm_unit
 
-from openff.interchange.components.foyer import _RBTorsionHandler
+from openff.interchange.components.foyer import FoyerVDWHandler, _RBTorsionHandler
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.components.mdtraj import _OFFBioTop, _store_bond_partners
 from openff.interchange.components.potentials import Potential
@@ -109,6 +109,81 @@ class TestFoyer(_BaseTest):
         assert oplsaa_interchange_ethanol["vdW"].scale_14 == 0.5
         assert oplsaa_interchange_ethanol["Electrostatics"].scale_14 == 0.5
 
+    def test_atom_types_per_unique_molecule(self, oplsaa):
+        from foyer.atomtyper import find_atomtypes
+        from foyer.topology_graph import TopologyGraph
+
+        molecules = [
+            Molecule.from_smiles(smiles) for smiles in ["CCO", "O", "O", "CCO"]
+        ]
+        top = _OFFBioTop.from_molecules(
+            mdtop=md.Topology.from_openmm(
+                Topology.from_molecules(molecules).to_openmm()
+            ),
+            molecules=molecules,
+        )
+
+        vdw = FoyerVDWHandler()
+        vdw.store_matches(oplsaa, topology=top)
+
+        # Typing each unique molecule once gives the same types as typing every atom
+        type_map = find_atomtypes(
+            TopologyGraph.from_openff_topology(openff_topology=top), forcefield=oplsaa
+        )
+
+        assert {
+            top_key.atom_indices[0]: pot_key.id
+            for top_key, pot_key in vdw.slot_map.items()
+        } == {index: val["atomtype"] for index, val in type_map.items()}
+
+    def test_from_foyer_n_workers(self, oplsaa):
+        molecules = [
+            Molecule.from_smiles(smiles) for smiles in ["CCO", "O", "CC", "O", "CCO"]
+        ]
+
+        def _get_slot_maps(n_workers):
+            top = _OFFBioTop.from_molecules(
+                mdtop=md.Topology.from_openmm(
+                    Topology.from_molecules(molecules).to_openmm()
+                ),
+                molecules=molecules,
+            )
+            _store_bond_partners(top.mdtop)
+            interchange = Interchange.from_foyer(
+                topology=top, force_field=oplsaa, n_workers=n_workers
+            )
+            return {
+                name: dict(handler.slot_map)
+                for name, handler in interchange.handlers.items()
+            }
+
+        assert _get_slot_maps(n_workers=2) == _get_slot_maps(n_workers=1)
+
+    def test_parameter_lookups_per_unique_type(self, oplsaa, monkeypatch):
+        def _count_lookups(n_molecules):
+            molecules = [Molecule.from_smiles("CCO")] * n_molecules
+            top = _OFFBioTop.from_molecules(
+                mdtop=md.Topology.from_openmm(
+                    Topology.from_molecules(molecules).to_openmm()
+                ),
+                molecules=molecules,
+            )
+
+            lookups = list()
+            get_parameters = oplsaa.get_parameters
+
+            def _get_parameters(*args, **kwargs):
+                lookups.append(args)
+                return get_parameters(*args, **kwargs)
+
+            with monkeypatch.context() as m:
+                m.setattr(oplsaa, "get_parameters", _get_parameters)
+                Interchange.from_foyer(topology=top, force_field=oplsaa)
+
+            return len(lookups)
+
+        assert _count_lookups(1) == _count_lookups(5)
+
     @needs_gmx
     @pytest.mark.slow()
     @pytest.mark.skip(
@@ -3,22 +3,28 @@ from copy import deepcopy
 import mdtraj as md
 import numpy as np
 import pytest
+from openff.toolkit.tests.utils import get_data_file_path
 from openff.toolkit.topology import Molecule, Topology
 from openff.toolkit.typing.engines.smirnoff import ForceField, ParameterHandler
 from openff.units import unit
 from openff.utilities.testing import skip_if_missing
+from openmm import unit as openmm_unit
 from pydantic import ValidationError
 
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.components.mdtraj import _OFFBioTop, _store_bond_partners
+from openff.interchange.components.potentials import WrappedPotential
+from openff.interchange.components.smirnoff import SMIRNOFFVirtualSiteHandler
 from openff.interchange.drivers import get_openmm_energies
 from openff.interchange.exceptions import (
+    InterchangeValidationError,
     InvalidTopologyError,
     MissingParameterHandlerError,
     MissingParametersError,
     MissingPositionsError,
     SMIRNOFFHandlersNotImplementedError,
 )
+from openff.interchange.models import PotentialKey, TopologyKey
 from openff.interchange.testing import _BaseTest
 from openff.interchange.testing.utils import _top_from_smiles, needs_gmx, needs_lmp
 from openff.interchange.utils import get_test_file_path
@@ -205,6 +211,283 @@ class TestInterchange(_BaseTest):
         assert type(out.topology) != Topology
         assert isinstance(out.topology, Topology)
 
+    @pytest.mark.parametrize("use_executor", [True, False])
+    def test_from_parsley_parallel(self, parsley, use_executor, caplog):
+        """Test that creating handlers concurrently gives the same result as serially."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        top = _top_from_smiles("CCO", n_molecules=2)
+
+        serial = Interchange.from_smirnoff(parsley, top)
+
+        with caplog.at_level(
+            "INFO", logger="openff.interchange.components.interchange"
+        ):
+            if use_executor:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    parallel = Interchange.from_smirnoff(
+                        parsley, top, executor=executor
+                    )
+            else:
+                parallel = Interchange.from_smirnoff(parsley, top, n_workers=2)
+
+        assert [*parallel.handlers] == [*serial.handlers]
+
+        for handler_name, handler in serial.handlers.items():
+            assert parallel[handler_name].slot_map == handler.slot_map
+            assert parallel[handler_name].potentials == handler.potentials
+
+            assert f"Created {handler_name} handler in" in caplog.text
+
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_from_smirnoff_batch(self, parsley, n_workers):
+        topologies = [
+            _top_from_smiles("CCO"),
+            "not a topology",
+            _top_from_smiles("O", n_molecules=3),
+        ]
+
+        results = [
+            *Interchange.from_smirnoff_batch(parsley, topologies, n_workers=n_workers)
+        ]
+
+        assert len(results) == 3
+        assert isinstance(results[1], InvalidTopologyError)
+
+        for result, topology in zip(
+            [results[0], results[2]], [topologies[0], topologies[2]]
+        ):
+            expected = Interchange.from_smirnoff(parsley, topology)
+
+            assert [*result.handlers] == [*expected.handlers]
+            assert result["vdW"].slot_map == expected["vdW"].slot_map
+            assert result.topology.mdtop.n_atoms == topology.mdtop.n_atoms
+
+    def test_check_consistency(self, parsley):
+        out = Interchange.from_smirnoff(parsley, _top_from_smiles("CCO"))
+        out.positions = np.zeros((out.topology.mdtop.n_atoms, 3)) * unit.nanometer
+
+        out.check_consistency()
+
+        out["Bonds"].slot_map[TopologyKey(atom_indices=(0, 100))] = PotentialKey(
+            id="foo"
+        )
+        out["vdW"].slot_map.pop(TopologyKey(atom_indices=(3,)))
+
+        with pytest.raises(InterchangeValidationError) as error:
+            out.check_consistency()
+
+        assert "Handler Bonds has invalid potentials" in str(error.value)
+        assert "Atoms [3] have no vdW parameters" in str(error.value)
+
+        out["Bonds"].slot_map[TopologyKey(atom_indices=(0, 100))] = [
+            *out["Bonds"].potentials
+        ][0]
+
+        with pytest.raises(InterchangeValidationError, match="outside of the topology"):
+            out.check_consistency()
+
+    def test_update_topology(self, parsley):
+        ethanol = Molecule.from_smiles("CCO")
+        methanol = Molecule.from_smiles("CO")
+
+        original = Interchange.from_smirnoff(
+            parsley, Topology.from_molecules([ethanol, ethanol])
+        )
+
+        # Replace the first ethanol with methanol
+        updated = original.update_topology(
+            parsley,
+            remove_atoms=range(ethanol.n_atoms),
+            add_molecules=[methanol],
+            insert_at=0,
+        )
+        expected = Interchange.from_smirnoff(
+            parsley, Topology.from_molecules([methanol, ethanol])
+        )
+
+        assert updated.topology.mdtop.n_atoms == expected.topology.mdtop.n_atoms
+        assert [*updated.handlers] == [*original.handlers]
+
+        for handler_name, handler in expected.handlers.items():
+            assert dict(updated[handler_name].slot_map) == dict(handler.slot_map)
+            assert set(updated[handler_name].potentials) == set(handler.potentials)
+
+        np.testing.assert_allclose(
+            updated["Electrostatics"].get_charge_array(),
+            expected["Electrostatics"].get_charge_array(),
+            atol=1e-3,
+        )
+
+        with pytest.raises(InvalidTopologyError, match="whole molecules"):
+            original.update_topology(parsley, remove_atoms=[0])
+
+    def test_update_force_field(self, parsley, monkeypatch):
+        from openff.interchange.components import smirnoff
+
+        molecule = Molecule.from_smiles("CCO")
+        topology = _OFFBioTop.from_molecules(
+            mdtop=md.Topology.from_openmm(molecule.to_topology().to_openmm()),
+            molecules=[molecule],
+        )
+
+        original = Interchange.from_smirnoff(parsley, topology)
+
+        parsley["Bonds"].parameters["[#6X4:1]-[#6X4:2]"].k *= 2
+        parsley["vdW"].parameters["[#1:1]-[#6X4]"].epsilon *= 2
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("Parameters should not be matched again")
+
+        with monkeypatch.context() as m:
+            m.setattr(smirnoff, "_find_matches", _fail)
+            refreshed = original.update_force_field(parsley)
+
+        assert refreshed["Bonds"].potentials != original["Bonds"].potentials
+
+        # A new parameter is matched to the topology
+        parsley["Angles"].add_parameter(
+            {
+                "smirks": "[#1:1]-[#6X4:2]-[#8:3]",
+                "k": 100 * openmm_unit.kilocalorie_per_mole / openmm_unit.radian ** 2,
+                "angle": 110 * openmm_unit.degree,
+            }
+        )
+        updated = refreshed.update_force_field(parsley)
+
+        expected = Interchange.from_smirnoff(parsley, topology)
+
+        for handler_name in ["Bonds", "Constraints", "Angles", "vdW"]:
+            assert dict(updated[handler_name].slot_map) == dict(
+                expected[handler_name].slot_map
+            )
+        for handler_name in ["Bonds", "Angles", "vdW"]:
+            assert updated[handler_name].potentials == expected[handler_name].potentials
+        assert updated["Constraints"].constraints == expected["Constraints"].constraints
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_to_from_file(self, parsley, mmap):
+        molecule = Molecule.from_smiles("CCO")
+        molecule.generate_conformers(n_conformers=1)
+        topology = _OFFBioTop.from_molecules(
+            mdtop=md.Topology.from_openmm(molecule.to_topology().to_openmm()),
+            molecules=[molecule],
+        )
+
+        original = Interchange.from_smirnoff(parsley, topology)
+        original.positions = molecule.conformers[0]
+        original.box = [4, 4, 4]
+
+        original.to_file("out.interchange")
+
+        roundtrip = Interchange.from_file("out.interchange", mmap=mmap)
+
+        assert [*roundtrip.handlers] == [*original.handlers]
+
+        for handler_name, handler in original.handlers.items():
+            assert type(roundtrip[handler_name]) is type(handler)
+            assert roundtrip[handler_name].slot_map == handler.slot_map
+
+        assert roundtrip["vdW"].potentials == original["vdW"].potentials
+        assert roundtrip["vdW"].cutoff == original["vdW"].cutoff
+        assert (
+            roundtrip["Constraints"].constraints == original["Constraints"].constraints
+        )
+
+        assert roundtrip.topology.mdtop.n_atoms == original.topology.mdtop.n_atoms
+        assert roundtrip.topology.n_topology_molecules == 1
+        np.testing.assert_allclose(roundtrip.positions, original.positions)
+        np.testing.assert_allclose(roundtrip.box, original.box)
+
+        only_bonds = Interchange.from_file("out.interchange", handlers=["Bonds"])
+
+        assert [*only_bonds.handlers] == ["Bonds"]
+
+    def test_to_from_file_virtual_sites(self):
+        from openff.toolkit.tests.test_forcefield import create_water
+
+        topology = Topology.from_molecules(3 * [create_water()])
+        tip4p = ForceField("openff-1.0.0.offxml", get_test_file_path("tip4p.offxml"))
+
+        original = Interchange.from_smirnoff(tip4p, topology)
+        original.box = [4, 4, 4]
+        original.handlers["VirtualSites"] = SMIRNOFFVirtualSiteHandler._from_toolkit(
+            parameter_handler=tip4p["VirtualSites"], topology=topology
+        )
+        original["Electrostatics"]._from_toolkit_virtual_sites(
+            parameter_handler=tip4p["VirtualSites"], topology=topology
+        )
+
+        original.to_file("out.interchange")
+
+        roundtrip = Interchange.from_file("out.interchange")
+
+        for handler_name in ["Electrostatics", "VirtualSites"]:
+            assert roundtrip[handler_name].slot_map == original[handler_name].slot_map
+        assert (
+            roundtrip["VirtualSites"].potentials == original["VirtualSites"].potentials
+        )
+        index_map = original["VirtualSites"].virtual_site_key_topology_index_map
+        assert (
+            roundtrip["VirtualSites"].virtual_site_key_topology_index_map == index_map
+        )
+
+        for potential_key, potential in original["Electrostatics"].potentials.items():
+            roundtrip_potential = roundtrip["Electrostatics"].potentials[potential_key]
+            assert [*roundtrip_potential.parameters] == [*potential.parameters]
+            for name, value in potential.parameters.items():
+                np.testing.assert_allclose(
+                    roundtrip_potential.parameters[name].m_as(value.units), value.m
+                )
+
+        charges = original["Electrostatics"].get_virtual_site_charges()
+        assert roundtrip["Electrostatics"].get_virtual_site_charges() == charges
+
+    def test_to_from_file_interpolated_bonds(self):
+        from openff.toolkit.tests.test_forcefield import create_ethanol
+
+        force_field = ForceField(
+            get_data_file_path("test_forcefields/test_forcefield.offxml"),
+            """<?xml version='1.0' encoding='ASCII'?>
+            <SMIRNOFF version="0.3" aromaticity_model="OEAroModel_MDL">
+              <Bonds version="0.3" fractional_bondorder_method="AM1-Wiberg"
+                fractional_bondorder_interpolation="linear">
+                <Bond smirks="[#6:1]~[#8:2]" id="bbo1"
+                    k_bondorder1="100.0 * kilocalories_per_mole/angstrom**2"
+                    k_bondorder2="1000.0 * kilocalories_per_mole/angstrom**2"
+                    length_bondorder1="1.5 * angstrom"
+                    length_bondorder2="1.0 * angstrom"/>
+              </Bonds>
+            </SMIRNOFF>
+            """,
+        )
+
+        original = Interchange.from_smirnoff(
+            force_field, create_ethanol().to_topology()
+        )
+
+        original.to_file("out.interchange")
+
+        roundtrip = Interchange.from_file("out.interchange")
+
+        assert roundtrip["Bonds"].slot_map == original["Bonds"].slot_map
+
+        wrapped = {
+            potential_key: potential
+            for potential_key, potential in original["Bonds"].potentials.items()
+            if isinstance(potential, WrappedPotential)
+        }
+        assert len(wrapped) > 0
+
+        for potential_key, potential in original["Bonds"].potentials.items():
+            roundtrip_potential = roundtrip["Bonds"].potentials[potential_key]
+            assert type(roundtrip_potential) is type(potential)
+            assert roundtrip_potential.parameters == potential.parameters
+
+        for potential_key, potential in wrapped.items():
+            roundtrip_potential = roundtrip["Bonds"].potentials[potential_key]
+            assert roundtrip_potential._inner_data.data == potential._inner_data.data
+
     @needs_gmx
     @needs_lmp
     @pytest.mark.slow()
@@ -1,4 +1,5 @@
 import mdtraj as md
+import openmm
 import pytest
 from openff.toolkit.topology import Molecule
 from openff.toolkit.typing.engines.smirnoff import ForceField
@@ -7,6 +8,7 @@ from openmm import app
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.components.mdtraj import (
     _combine_topologies,
+    _get_bonded_pairs,
     _get_num_h_bonds,
     _iterate_pairs,
     _iterate_propers,
@@ -71,6 +73,38 @@ def test_iterate_pairs_benzene():
     assert len({*_iterate_pairs(mdtop)}) == 21
 
 
+@pytest.mark.parametrize("smiles", ["CCO", "c1ccccc1", "C1CC1", "C1CCC1"])
+def test_get_bonded_pairs(smiles):
+    """Check that bonded pairs match the exceptions OpenMM creates from bonds."""
+    mdtop = md.Topology.from_openmm(
+        Molecule.from_smiles(smiles).to_topology().to_openmm()
+    )
+
+    force = openmm.NonbondedForce()
+    for _ in range(mdtop.n_atoms):
+        force.addParticle(1.0, 1.0, 1.0)
+    force.createExceptionsFromBonds(
+        [(bond.atom1.index, bond.atom2.index) for bond in mdtop.bonds], 0.5, 0.5
+    )
+
+    excluded, scaled = set(), set()
+    for index in range(force.getNumExceptions()):
+        atom1, atom2, charge_product, _, _ = force.getExceptionParameters(index)
+        pair = tuple(sorted((atom1, atom2)))
+        if charge_product._value == 0.0:
+            excluded.add(pair)
+        else:
+            scaled.add(pair)
+
+    pairs_12, pairs_13, pairs_14 = _get_bonded_pairs(mdtop)
+
+    assert {*map(tuple, pairs_12.tolist())} == {
+        tuple(sorted((bond.atom1.index, bond.atom2.index))) for bond in mdtop.bonds
+    }
+    assert {*map(tuple, pairs_12.tolist()), *map(tuple, pairs_13.tolist())} == excluded
+    assert {*map(tuple, pairs_14.tolist())} == scaled
+
+
 def test_get_num_h_bonds():
     mol = Molecule.from_smiles("CCO")
     top = mol.to_topology()
@@ -1,11 +1,19 @@
+import numpy as np
+import pytest
 from openff.toolkit.typing.engines.smirnoff.parameters import BondHandler
 from openff.units import unit
+from openff.utilities.testing import skip_if_missing
+from openmm import unit as openmm_unit
 
 from openff.interchange.components.potentials import (
     Potential,
     PotentialHandler,
     WrappedPotential,
+    _LazyTrackedDict,
+    _TrackedDict,
 )
+from openff.interchange.exceptions import MissingUnitError
+from openff.interchange.models import PotentialKey, TopologyKey
 from openff.interchange.testing import _BaseTest
 
 
@@ -40,6 +48,24 @@ class TestWrappedPotential(_BaseTest):
         assert simple.parameters == pot2.parameters
 
 
+class TestPotential(_BaseTest):
+    def test_from_trusted(self):
+        """Test that trusted potentials match validated ones."""
+        parameters = {
+            "k": openmm_unit.Quantity(100.0, openmm_unit.kilojoule_per_mole),
+            "periodicity": 2 * unit.dimensionless,
+        }
+
+        trusted = Potential._from_trusted(parameters, map_key=1)
+
+        assert trusted.parameters == Potential(parameters=parameters).parameters
+        assert trusted.map_key == 1
+        assert isinstance(trusted.parameters["k"], unit.Quantity)
+
+        with pytest.raises(MissingUnitError):
+            Potential._from_trusted({"k": 100.0})
+
+
 class TestPotentialHandlerSubclassing(_BaseTest):
     def test_dummy_potential_handler(self):
         handler = PotentialHandler(
@@ -48,3 +74,156 @@ class TestPotentialHandlerSubclassing(_BaseTest):
         )
         assert handler.type == "foo"
         assert handler.expression == "m*x+b"
+
+
+class TestPotentialArrays(_BaseTest):
+    @pytest.fixture()
+    def bond_handler(self):
+        handler = PotentialHandler(type="Bonds", expression="k/2*(r-length)**2")
+
+        for index, (atom_indices, smirks) in enumerate(
+            [
+                ((0, 1), "[#6:1]-[#6:2]"),
+                ((1, 2), "[#6:1]-[#8:2]"),
+                ((2, 3), "[#6:1]-[#6:2]"),
+            ]
+        ):
+            potential_key = PotentialKey(id=smirks)
+            handler.slot_map[TopologyKey(atom_indices=atom_indices)] = potential_key
+            handler.potentials[potential_key] = Potential(
+                parameters={
+                    "k": unit.Quantity(
+                        100.0 + index, "kilocalorie / mole / angstrom ** 2"
+                    ),
+                    "length": 1.5 * unit.angstrom,
+                }
+            )
+
+        return handler
+
+    def test_from_handler(self, bond_handler):
+        arrays = bond_handler.to_arrays()
+
+        assert arrays.n_terms == 3
+        assert arrays.n_potentials == 2
+        assert arrays.parameter_names == ("k", "length")
+        np.testing.assert_equal(arrays.atom_indices, [[0, 1], [1, 2], [2, 3]])
+        np.testing.assert_equal(arrays.mult, [-1, -1, -1])
+        np.testing.assert_equal(arrays.potential_index, [0, 1, 0])
+
+        np.testing.assert_allclose(
+            arrays.term_parameter("length", unit.nanometer), [0.15, 0.15, 0.15]
+        )
+        np.testing.assert_allclose(
+            arrays.parameter("k", "kilojoule / mole / nanometer ** 2"),
+            [102.0 * 418.4, 101.0 * 418.4],
+        )
+
+    def test_cache_invalidation(self, bond_handler):
+        arrays = bond_handler.to_arrays()
+        assert bond_handler.to_arrays() is arrays
+
+        bond_handler.slot_map[TopologyKey(atom_indices=(3, 4))] = PotentialKey(
+            id="[#6:1]-[#8:2]"
+        )
+        assert bond_handler.to_arrays() is not arrays
+        assert bond_handler.to_arrays().n_terms == 4
+
+        arrays = bond_handler.to_arrays()
+        bond_handler.set_force_field_parameters(
+            bond_handler.get_force_field_parameters() * 2
+        )
+        assert bond_handler.to_arrays() is not arrays
+
+        # Potentials modified in place are picked up
+        potential_key = bond_handler.slot_map[TopologyKey(atom_indices=(0, 1))]
+        potential = bond_handler.potentials[potential_key]
+
+        potential.parameters["length"] = 1.6 * unit.angstrom
+        np.testing.assert_allclose(
+            bond_handler.to_arrays().parameter("length", unit.angstrom)[0], 1.6
+        )
+
+        potential.parameters = {**potential.parameters, "length": 1.7 * unit.angstrom}
+        np.testing.assert_allclose(
+            bond_handler.to_arrays().parameter("length", unit.angstrom)[0], 1.7
+        )
+
+    def test_lazy_round_trip(self, bond_handler):
+        arrays = bond_handler.to_arrays()
+
+        lazy = PotentialHandler.from_arrays(
+            arrays, type="Bonds", expression="k/2*(r-length)**2"
+        )
+
+        assert isinstance(lazy.slot_map, _LazyTrackedDict)
+        assert lazy.to_arrays() is arrays
+
+        assert lazy.slot_map == bond_handler.slot_map
+        assert isinstance(lazy.slot_map, _TrackedDict)
+        assert not isinstance(lazy.slot_map, _LazyTrackedDict)
+
+        for potential_key, potential in bond_handler.potentials.items():
+            assert lazy.potentials[potential_key].parameters == potential.parameters
+
+        # Materializing the dicts does not invalidate the arrays
+        assert lazy.to_arrays() is arrays
+
+
+class TestParameterAssignment(_BaseTest):
+    @pytest.fixture()
+    def interpolated_bond_handler(self):
+        handler = PotentialHandler(type="Bonds", expression="k/2*(r-length)**2")
+
+        k = unit.Quantity([100.0, 200.0], "kilocalorie / mole / angstrom ** 2")
+        length = unit.Quantity([1.5, 1.3], unit.angstrom)
+
+        for atom_indices, bond_order in [((0, 1), 1.2), ((1, 2), 1.8), ((2, 3), 1.2)]:
+            topology_key = TopologyKey(atom_indices=atom_indices, bond_order=bond_order)
+            potential_key = PotentialKey(id="[#6:1]~[#6:2]", bond_order=bond_order)
+            coefficients = [2.0 - bond_order, bond_order - 1.0]
+
+            handler.slot_map[topology_key] = potential_key
+            handler.potentials[potential_key] = WrappedPotential(
+                {
+                    Potential(
+                        parameters={"k": k[index], "length": length[index]},
+                        map_key=index + 1,
+                    ): coefficients[index]
+                    for index in range(2)
+                }
+            )
+
+        return handler
+
+    def test_interpolated_parameters(self, interpolated_bond_handler):
+        handler = interpolated_bond_handler
+
+        p = handler.get_force_field_parameters()
+        np.testing.assert_allclose(p, [[100.0, 1.5], [200.0, 1.3]], rtol=1e-5)
+
+        q = handler.get_system_parameters()
+        np.testing.assert_allclose(
+            q, [[120.0, 1.46], [180.0, 1.34], [120.0, 1.46]], rtol=1e-5
+        )
+        np.testing.assert_allclose(handler.parametrize_partial()(p), q, rtol=1e-5)
+
+        handler.set_force_field_parameters(p * 2)
+
+        np.testing.assert_allclose(handler.get_system_parameters(), q * 2, rtol=1e-5)
+
+    @skip_if_missing("scipy")
+    def test_sparse_param_matrix(self, interpolated_bond_handler):
+        handler = interpolated_bond_handler
+
+        matrix = handler.get_sparse_param_matrix()
+
+        assert matrix.shape == (6, 4)
+        assert matrix.nnz == 12
+        np.testing.assert_allclose(matrix.sum(axis=1), np.ones((6, 1)))
+
+        np.testing.assert_allclose(
+            matrix @ np.asarray(handler.get_force_field_parameters()).flatten(),
+            np.asarray(handler.get_system_parameters()).flatten(),
+            rtol=1e-5,
+        )
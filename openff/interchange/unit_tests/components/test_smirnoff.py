@@ -26,6 +26,7 @@ from pydantic import ValidationError
 
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.components.mdtraj import _OFFBioTop
+from openff.interchange.components.potentials import Potential
 from openff.interchange.components.smirnoff import (
     SMIRNOFFAngleHandler,
     SMIRNOFFBondHandler,
@@ -35,6 +36,7 @@ from openff.interchange.components.smirnoff import (
     SMIRNOFFPotentialHandler,
     SMIRNOFFvdWHandler,
     SMIRNOFFVirtualSiteHandler,
+    _find_matches,
     library_charge_from_molecule,
 )
 from openff.interchange.exceptions import InvalidParameterHandlerError
@@ -142,6 +144,28 @@ class TestSMIRNOFFHandlers(_BaseTest):
 
         assert pot.parameters["k"].to(kcal_mol_rad2).magnitude == pytest.approx(2.5)
 
+    def test_store_potentials_once_per_parameter(self, monkeypatch):
+        force_field = ForceField("openff-1.0.0.offxml")
+        topology = _top_from_smiles("CCCCCC")
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("Parameters should be looked up in an index")
+
+        monkeypatch.setattr(ParameterHandler, "get_parameter", _fail)
+
+        for handler_class, handler_name in [
+            (SMIRNOFFBondHandler, "Bonds"),
+            (SMIRNOFFAngleHandler, "Angles"),
+            (SMIRNOFFImproperTorsionHandler, "ImproperTorsions"),
+            (SMIRNOFFvdWHandler, "vdW"),
+        ]:
+            handler = handler_class._from_toolkit(
+                parameter_handler=force_field[handler_name],
+                topology=topology,
+            )
+
+            assert len(handler.potentials) == len(set(handler.slot_map.values()))
+
     def test_store_improper_torsion_matches(self):
         formaldehyde: Molecule = Molecule.from_mapped_smiles("[H:3][C:1]([H:4])=[O:2]")
 
@@ -221,6 +245,49 @@ class TestSMIRNOFFHandlers(_BaseTest):
             [-0.1, 0.025, 0.025, 0.025, 0.025],
         )
 
+    def test_electrostatics_charge_array(self):
+        top = _top_from_smiles("C")
+
+        library_charge_handler = LibraryChargeHandler(version=0.3)
+        library_charge_handler.add_parameter(
+            {
+                "smirks": "[#6X4:1]-[#1:2]",
+                "charge1": -0.1 * openmm_unit.elementary_charge,
+                "charge2": 0.025 * openmm_unit.elementary_charge,
+            }
+        )
+
+        electrostatics_handler = SMIRNOFFElectrostaticsHandler._from_toolkit(
+            [ElectrostaticsHandler(version=0.3), library_charge_handler], top
+        )
+
+        charges = electrostatics_handler.get_charge_array()
+
+        np.testing.assert_allclose(charges, [-0.1, 0.025, 0.025, 0.025, 0.025])
+        np.testing.assert_allclose(
+            electrostatics_handler.get_charge_array(n_atoms=7)[5:], [0.0, 0.0]
+        )
+
+        # Charges are not recomputed unless the slot map or potentials change
+        cached = electrostatics_handler._get_cached_charges()
+        assert electrostatics_handler._get_cached_charges() is cached
+
+        carbon_key = electrostatics_handler.slot_map[TopologyKey(atom_indices=(0,))]
+        electrostatics_handler.potentials[carbon_key] = Potential(
+            parameters={"charge": -0.2 * unit.elementary_charge}
+        )
+
+        assert electrostatics_handler._get_cached_charges() is not cached
+        assert electrostatics_handler.get_charge_array()[0] == pytest.approx(-0.2)
+        assert electrostatics_handler.charges[TopologyKey(atom_indices=(0,))].m_as(
+            unit.elementary_charge
+        ) == pytest.approx(-0.2)
+
+        # Modifying a potential in place is picked up
+        potential = electrostatics_handler.potentials[carbon_key]
+        potential.parameters["charge"] = -0.3 * unit.elementary_charge
+        assert electrostatics_handler.get_charge_array()[0] == pytest.approx(-0.3)
+
     def test_electrostatics_charge_increments(self):
         molecule = Molecule.from_mapped_smiles("[Cl:1][H:2]")
         top = _OFFBioTop.from_molecules(
@@ -338,6 +405,32 @@ class TestInterchangeFromSMIRNOFF(_BaseTest):
         assert out["vdW"].cutoff == 0.777 * unit.angstrom
         assert out["Electrostatics"].cutoff == 0.777 * unit.angstrom
 
+    @pytest.mark.parametrize(
+        "handler_name",
+        ["Bonds", "Constraints", "Angles", "ProperTorsions", "ImproperTorsions", "vdW"],
+    )
+    def test_reference_molecule_matches(self, parsley, handler_name):
+        """Test that matches broadcast from reference molecules are the same as topology matches."""
+        from openff.toolkit.tests.create_molecules import create_ethanol
+
+        water = Molecule.from_smiles("O")
+        topology = Topology.from_molecules(
+            [create_ethanol(), water, create_reversed_ethanol(), water]
+        )
+
+        parameter_handler = parsley[handler_name]
+
+        expected = parameter_handler.find_matches(topology)
+        found = _find_matches(parameter_handler, topology)
+
+        assert type(found) is type(expected)
+        assert {key: val.parameter_type.smirks for key, val in found.items()} == {
+            key: val.parameter_type.smirks for key, val in expected.items()
+        }
+
+        # Matching again should hit the cache and return equivalent matches
+        assert [*_find_matches(parameter_handler, topology).keys()] == [*found.keys()]
+
 
 class TestUnassignedParameters(_BaseTest):
     def test_catch_unassigned_bonds(self, parsley, ethanol_top):
@@ -399,6 +492,34 @@ class TestConstraints:
 
         assert len(constraints.slot_map) == n_constraints
 
+    def test_reuse_bond_handler(self, monkeypatch):
+        force_field = ForceField("openff-1.0.0.offxml")
+        topology = Molecule.from_smiles("C").to_topology()
+
+        bonds = SMIRNOFFBondHandler._from_toolkit(
+            parameter_handler=force_field["Bonds"],
+            topology=topology,
+        )
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("Bond handler should not be re-created")
+
+        monkeypatch.setattr(SMIRNOFFBondHandler, "_from_toolkit", _fail)
+
+        constraints = SMIRNOFFConstraintHandler._from_toolkit(
+            parameter_handler=[force_field["Bonds"], force_field["Constraints"]],
+            topology=topology,
+            dependencies={"Bonds": bonds},
+        )
+
+        assert len(constraints.slot_map) == 4
+
+        for top_key, pot_key in constraints.slot_map.items():
+            assert pot_key == bonds.slot_map[top_key]
+
+            distance = constraints.constraints[pot_key].parameters["distance"]
+            assert distance == bonds.potentials[pot_key].parameters["length"]
+
 
 # TODO: Remove xfail after openff-toolkit 0.10.0
 @pytest.mark.xfail()
@@ -571,6 +692,20 @@ class TestMatrixRepresentations(_BaseTest):
                 np.sum(param_matrix, axis=1), np.ones(param_matrix.shape[0])
             )
 
+    @skip_if_missing("scipy")
+    def test_sparse_param_matrix(self, parsley, ethanol_top):
+        handler = SMIRNOFFAngleHandler._from_toolkit(
+            parameter_handler=parsley["Angles"],
+            topology=ethanol_top,
+        )
+
+        param_matrix = handler.get_param_matrix()
+
+        assert np.allclose(handler.get_sparse_param_matrix().toarray(), param_matrix)
+        assert np.allclose(
+            handler.get_param_matrix(sparse=True).todense(), param_matrix
+        )
+
     def test_set_force_field_parameters(self, parsley, ethanol_top):
         import jax
 
@@ -746,6 +881,60 @@ class TestSMIRNOFFVirtualSites:
         assert len(virtual_site_handler.slot_map) == 2
         assert len(virtual_site_handler.potentials) == 1
 
+    @pytest.mark.parametrize("offxml", ["tip4p.offxml", "tip5p.offxml"])
+    def test_virtual_site_positions(self, offxml):
+        from openff.toolkit.tests.test_forcefield import create_water
+
+        water = create_water()
+        water.generate_conformers(n_conformers=1)
+        top = water.to_topology()
+
+        force_field = ForceField(get_test_file_path(offxml))
+
+        virtual_site_handler = SMIRNOFFVirtualSiteHandler._from_toolkit(
+            parameter_handler=force_field["VirtualSites"], topology=top
+        )
+
+        positions = virtual_site_handler.get_positions(water.conformers[0])
+
+        # Compare to the positions of the virtual sites OpenMM places in the system
+        # created by the toolkit, in any order
+        omm_sys = force_field.create_openmm_system(top)
+        n_virtual_sites = omm_sys.getNumParticles() - top.n_topology_atoms
+
+        context = openmm.Context(
+            omm_sys,
+            openmm.VerletIntegrator(1.0 * openmm_unit.femtoseconds),
+            openmm.Platform.getPlatformByName("Reference"),
+        )
+        context.setPositions(
+            np.vstack(
+                [
+                    water.conformers[0].value_in_unit(openmm_unit.nanometer),
+                    np.zeros((n_virtual_sites, 3)),
+                ]
+            )
+        )
+        context.computeVirtualSites()
+        expected = context.getState(getPositions=True).getPositions(asNumpy=True)
+        expected = expected.value_in_unit(openmm_unit.nanometer)[top.n_topology_atoms :]
+
+        assert positions.shape == expected.shape
+        np.testing.assert_allclose(
+            np.sort(positions.m_as(unit.nanometer), axis=0),
+            np.sort(expected, axis=0),
+            atol=1e-6,
+        )
+
+        # Positions of many conformers are computed at once
+        conformers = np.stack(
+            [water.conformers[0].value_in_unit(openmm_unit.nanometer)] * 2
+        )
+        np.testing.assert_allclose(
+            virtual_site_handler.get_positions(conformers).m_as(unit.nanometer),
+            np.stack([positions.m_as(unit.nanometer)] * 2),
+        )
+
 
 def _get_n_virtual_sites(handler: "SMIRNOFFPotentialHandler") -> int:
     """Get the number of TopologyKey objects in a SMIRNOFFvdWHandler that likely
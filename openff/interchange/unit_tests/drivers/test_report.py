@@ -1,7 +1,8 @@
+import numpy as np
 import pytest
 from openff.units import unit
 
-from openff.interchange.drivers.report import EnergyReport
+from openff.interchange.drivers.report import BatchEnergyReport, EnergyReport
 from openff.interchange.testing import _BaseTest
 
 kj_mol = unit.kilojoule / unit.mole
@@ -30,3 +31,32 @@ class TestEnergyReport(_BaseTest):
 
         with pytest.warns(UserWarning, match="Did not find key z"):
             c - b
+
+
+class TestBatchEnergyReport(_BaseTest):
+    def test_getitem(self):
+        report = BatchEnergyReport(
+            energies={
+                "Bond": np.array([1.0, 2.0, 3.0]) * kj_mol,
+                "Angle": np.array([0.5, 0.5, 0.5]) * kj_mol,
+            }
+        )
+
+        assert len(report) == 3
+        assert report["Torsion"] is None
+        np.testing.assert_allclose(report["Total"].m_as(kj_mol), [1.5, 2.5, 3.5])
+
+        frame = report[1]
+        assert isinstance(frame, EnergyReport)
+        assert frame["Bond"].m_as(kj_mol) == 2.0
+        assert frame["Total"].m_as(kj_mol) == 2.5
+
+        assert [r["Bond"] for r in report.to_reports()] == [
+            1.0 * kj_mol,
+            2.0 * kj_mol,
+            3.0 * kj_mol,
+        ]
+        assert report.to_dataframe().shape == (3, 2)
+
+        with pytest.raises(LookupError, match="type <class 'float'>"):
+            report[0.0]
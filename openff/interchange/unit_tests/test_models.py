@@ -1,4 +1,16 @@
-from openff.interchange.models import PotentialKey, TopologyKey, VirtualSiteKey
+import json
+import pickle
+from typing import Union
+
+import pytest
+from pydantic import ValidationError
+
+from openff.interchange.models import (
+    DefaultModel,
+    PotentialKey,
+    TopologyKey,
+    VirtualSiteKey,
+)
 
 
 def test_potentialkey_hash_uniqueness():
@@ -40,3 +52,62 @@ def test_virtualsitekey_hash_uniqueness():
 
     keys = [ref, with_type, with_match]
     assert len({hash(k) for k in keys}) == len(keys)
+
+
+def test_potentialkey_interning():
+    """Test that PotentialKey objects with identical fields are the same object."""
+    smirks = "[#1:1]-[#8X2:2]"
+
+    assert PotentialKey(id=smirks) is PotentialKey(id=smirks, mult=None)
+    assert PotentialKey(id=smirks) is not PotentialKey(id=smirks, mult=0)
+    assert pickle.loads(pickle.dumps(PotentialKey(id=smirks))) is PotentialKey(
+        id=smirks
+    )
+
+
+def test_keys_are_immutable():
+    key = TopologyKey(atom_indices=(0, 1))
+
+    with pytest.raises(TypeError, match="immutable"):
+        key.mult = 1
+
+    assert key.copy(update={"mult": 1}) == TopologyKey(atom_indices=(0, 1), mult=1)
+    assert key.mult is None
+
+
+def test_keys_in_pydantic_models():
+    """Test that keys can be validated from dicts and (de)serialized like Pydantic models."""
+
+    class Model(DefaultModel):
+        topology_key: Union[TopologyKey, VirtualSiteKey]
+        potential_key: PotentialKey
+
+    virtual_site_key = VirtualSiteKey(
+        atom_indices=(0, 1), type="BondCharge", match="once"
+    )
+    model = Model(topology_key=virtual_site_key, potential_key={"id": "foo"})
+
+    assert model.topology_key is virtual_site_key
+    assert model.potential_key is PotentialKey(id="foo")
+
+    assert Model(
+        topology_key={"atom_indices": [0, 1]}, potential_key={"id": "foo"}
+    ).topology_key == TopologyKey(atom_indices=(0, 1))
+
+    assert json.loads(model.json()) == {
+        "topology_key": {
+            "atom_indices": [0, 1],
+            "type": "BondCharge",
+            "match": "once",
+        },
+        "potential_key": {
+            "id": "foo",
+            "mult": None,
+            "associated_handler": None,
+            "bond_order": None,
+        },
+    }
+    assert VirtualSiteKey.parse_raw(virtual_site_key.json()) == virtual_site_key
+
+    with pytest.raises(ValidationError):
+        Model(topology_key=(0, 1), potential_key=PotentialKey(id="foo"))